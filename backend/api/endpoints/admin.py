@@ -0,0 +1,35 @@
+import hmac
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+from typing import Optional
+
+from backend.core.config import ADMIN_TOKEN, IS_PROD
+from backend.schemas import InstrumentationRequest
+from v_chess.instrumentation import instrumentation
+
+def require_admin(x_admin_token: Optional[str] = Header(default=None)):
+    # Without a configured token the admin endpoints are only open outside production.
+    if ADMIN_TOKEN:
+        # Compared in constant time so response timing does not leak the token.
+        if not hmac.compare_digest((x_admin_token or "").encode(), ADMIN_TOKEN.encode()):
+            raise HTTPException(status_code=403, detail="Admin token required")
+    elif IS_PROD:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+
+router = APIRouter(dependencies=[Depends(require_admin)])
+
+@router.get("/instrumentation")
+async def get_instrumentation():
+    return {**instrumentation.snapshot(), "status": "success"}
+
+@router.post("/instrumentation")
+async def set_instrumentation(req: InstrumentationRequest):
+    if req.reset:
+        instrumentation.reset()
+    if req.slow_threshold_ms is not None:
+        instrumentation.slow_threshold = req.slow_threshold_ms / 1000
+    if req.enabled:
+        instrumentation.enable()
+    else:
+        instrumentation.disable()
+    return {**instrumentation.snapshot(), "status": "success"}
@@ -11,6 +11,7 @@ from backend.services.game_service import get_game, get_player_info
 from backend.state import games, game_variants, RULES_MAP
 from v_chess.rules.standard import StandardRules
 from v_chess.game import Game
+from v_chess.position_cache import position_cache
 from v_chess.square import Square
 
 router = APIRouter()
@@ -92,8 +93,8 @@ async def get_all_legal_moves(req: GameRequest):
     rejection_log = {}
     validator_names = [v.__name__ for v in game.rules.move_validators]
     
-    for m in possible_moves:
-        reason = game.rules.validate_move(game.state, m)
+    reasons = game.rules.validate_moves(game.state, possible_moves)
+    for m, reason in zip(possible_moves, reasons):
         if reason == "move is legal":
             legal_moves_uci.append(m.uci)
         else:
@@ -119,3 +120,12 @@ async def get_legal_moves(req: LegalMovesRequest):
     if not piece: return {"moves": [], "status": "success"}
     if piece.color != game.state.turn: raise HTTPException(status_code=400, detail="Piece belongs to the opponent")
     return {"moves": [m.uci for m in game.legal_moves if m.start == square], "status": "success"}
+
+@router.post("/moves/attacks")
+async def get_attacks(req: GameRequest):
+    game = await get_game(req.game_id)
+    return {**game.state.attacks.to_dict(), "status": "success"}
+
+@router.get("/moves/cache")
+async def get_position_cache_stats():
+    return {**position_cache.stats(), "status": "success"}
@@ -14,7 +14,7 @@ from backend import database
 from backend.database import GameModel
 from backend.socket_manager import manager
 from backend.state import games, game_variants, seeks, quick_match_queue, pending_takebacks, RULES_MAP
-from backend.services.game_service import get_game, get_player_info, save_game_to_db, trigger_ai_move
+from backend.services.game_service import get_game, get_player_info, save_game_to_db, trigger_ai_move, game_state_message
 from v_chess.rules.standard import StandardRules
 
 router = APIRouter()
@@ -110,13 +110,9 @@ async def game_websocket(websocket: WebSocket, game_id: str):
     user_session = websocket.scope.get("session", {}).get("user")
     user_id = str(user_session.get("id")) if user_session else websocket.scope.get("session", {}).get("guest_id")
     
-    await manager.broadcast(game_id, json.dumps({
-        "type": "game_state", "fen": game.state.fen, "turn": game.state.turn.value, 
-        "is_over": game.is_over, "in_check": game.is_check, "winner": game.winner, 
-        "move_history": game.move_history, "uci_history": game.uci_history,
-        "clocks": {c.value: t for c, t in game.clocks.items()} if game.clocks else None,
-        "explosion_square": str(game.state.explosion_square) if hasattr(game.state, 'explosion_square') and game.state.explosion_square else None
-    }))
+    await manager.broadcast(game_id, json.dumps(game_state_message(
+        game, clocks={c.value: t for c, t in game.clocks.items()} if game.clocks else None
+    )))
 
     if not game.is_over:
         if (game.state.turn == Color.WHITE and white_id == "computer") or (game.state.turn == Color.BLACK and black_id == "computer"):
@@ -153,15 +149,7 @@ async def game_websocket(websocket: WebSocket, game_id: str):
                     rating_diffs = await save_game_to_db(game_id)
                     if game_id in pending_takebacks: del pending_takebacks[game_id]
                     
-                    game_state_msg = {
-                        "type": "game_state", "fen": game.state.fen, "turn": game.state.turn.value, 
-                        "is_over": game.is_over, "in_check": game.is_check, "winner": game.winner, 
-                        "move_history": game.move_history, "uci_history": game.uci_history,
-                        "clocks": {c.value: t for c, t in game.get_current_clocks().items()} if game.clocks else None, 
-                        "rating_diffs": rating_diffs,
-                        "explosion_square": str(game.state.explosion_square) if getattr(game.state, 'explosion_square', None) else None,
-                        "is_drop": move_obj.is_drop
-                    }
+                    game_state_msg = game_state_message(game, rating_diffs=rating_diffs, is_drop=move_obj.is_drop)
                     await manager.broadcast(game_id, json.dumps({"type": "takeback_cleared", "game_state": game_state_msg}))
                     await manager.broadcast(game_id, json.dumps({"type": "draw_cleared", "game_state": game_state_msg}))
                     await manager.broadcast(game_id, json.dumps(game_state_msg))
@@ -175,13 +163,9 @@ async def game_websocket(websocket: WebSocket, game_id: str):
             elif message["type"] == "undo":
                 if (white_id is None and black_id is None) or (user_id in [white_id, black_id]):
                     game.undo_move(); await save_game_to_db(game_id)
-                    await manager.broadcast(game_id, json.dumps({
-                        "type": "game_state", "fen": game.state.fen, "turn": game.state.turn.value, 
-                        "is_over": game.is_over, "in_check": game.is_check, "winner": game.winner, 
-                        "move_history": game.move_history, "uci_history": game.uci_history,
-                        "clocks": {c.value: t for c, t in game.get_current_clocks().items()} if game.clocks else None, 
-                        "rating_diffs": None, "explosion_square": None, "is_drop": False
-                    }))
+                    await manager.broadcast(game_id, json.dumps(game_state_message(
+                        game, rating_diffs=None, explosion_square=None, is_drop=False
+                    )))
             elif message["type"] == "resign":
                 if user_id in [white_id, black_id] or (not white_id and not black_id):
                     # Check for abort condition (no moves made)
@@ -198,28 +182,16 @@ async def game_websocket(websocket: WebSocket, game_id: str):
                         game.resign(resigning_color)
                     
                     rating_diffs = await save_game_to_db(game_id)
-                    await manager.broadcast(game_id, json.dumps({
-                        "type": "game_state", "fen": game.state.fen, "turn": game.state.turn.value, 
-                        "is_over": game.is_over, "in_check": game.is_check, "winner": game.winner, 
-                        "move_history": game.move_history, "uci_history": game.uci_history,
-                        "clocks": {c.value: t for c, t in game.get_current_clocks().items()} if game.clocks else None, 
-                        "rating_diffs": rating_diffs,
-                        "explosion_square": str(game.state.explosion_square) if getattr(game.state, 'explosion_square', None) else None,
-                        "is_drop": False
-                    }))
+                    await manager.broadcast(game_id, json.dumps(
+                        game_state_message(game, rating_diffs=rating_diffs, is_drop=False)
+                    ))
             elif message["type"] == "draw_offer":
                 await manager.broadcast(game_id, json.dumps({"type": "draw_offered", "by_user_id": user_id}))
             elif message["type"] == "draw_accept":
                 game.agree_draw(); rating_diffs = await save_game_to_db(game_id)
-                await manager.broadcast(game_id, json.dumps({
-                        "type": "game_state", "fen": game.state.fen, "turn": game.state.turn.value, 
-                        "is_over": game.is_over, "in_check": game.is_check, "winner": game.winner, 
-                        "move_history": game.move_history, "uci_history": game.uci_history,
-                        "clocks": {c.value: t for c, t in game.get_current_clocks().items()} if game.clocks else None, 
-                        "rating_diffs": rating_diffs,
-                        "explosion_square": str(game.state.explosion_square) if getattr(game.state, 'explosion_square', None) else None,
-                        "is_drop": False, "status": "draw_agreed"
-                }))
+                await manager.broadcast(game_id, json.dumps(
+                    game_state_message(game, rating_diffs=rating_diffs, is_drop=False, status="draw_agreed")
+                ))
             elif message["type"] == "takeback_offer":
                 if user_id in [white_id, black_id]:
                     pending_takebacks[game_id] = user_id
@@ -236,13 +208,9 @@ async def game_websocket(websocket: WebSocket, game_id: str):
                         if game_id in pending_takebacks: del pending_takebacks[game_id]
                     await save_game_to_db(game_id)
                     await manager.broadcast(game_id, json.dumps({"type": "takeback_cleared"}))
-                    await manager.broadcast(game_id, json.dumps({
-                        "type": "game_state", "fen": game.state.fen, "turn": game.state.turn.value, 
-                        "is_over": game.is_over, "in_check": game.is_check, "winner": game.winner, 
-                        "move_history": game.move_history, "uci_history": game.uci_history,
-                        "clocks": {c.value: t for c, t in game.get_current_clocks().items()} if game.clocks else None, 
-                        "rating_diffs": None, "explosion_square": None, "is_drop": False, "status": "takeback_accepted"
-                    }))
+                    await manager.broadcast(game_id, json.dumps(game_state_message(
+                        game, rating_diffs=None, explosion_square=None, is_drop=False, status="takeback_accepted"
+                    )))
             elif message["type"] == "takeback_decline":
                 if user_id in [white_id, black_id]:
                     if game_id in pending_takebacks: del pending_takebacks[game_id]
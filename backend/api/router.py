@@ -1,5 +1,5 @@
 from fastapi import APIRouter
-from backend.api.endpoints import auth, users, games, websockets
+from backend.api.endpoints import admin, auth, users, games, websockets
 
 api_router = APIRouter()
 
@@ -7,3 +7,4 @@ api_router.include_router(auth.router, prefix="/auth", tags=["auth"])
 api_router.include_router(users.router, prefix="/api", tags=["users"])
 api_router.include_router(games.router, prefix="/api", tags=["games"])
 api_router.include_router(websockets.router, prefix="/ws", tags=["websockets"])
+api_router.include_router(admin.router, prefix="/api/admin", tags=["admin"])
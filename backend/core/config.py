@@ -10,3 +10,5 @@ REDIRECT_URI = os.environ.get("REDIRECT_URI")
 FRONTEND_URL = os.environ.get("FRONTEND_URL", "http://localhost:3000")
 ENV = os.environ.get("ENV", "dev")
 IS_PROD = ENV == "prod"
+ADMIN_TOKEN = os.environ.get("ADMIN_TOKEN", "").strip()
+POSITION_CACHE_SIZE = int(os.environ.get("POSITION_CACHE_SIZE", "4096"))
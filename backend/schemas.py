@@ -23,3 +23,8 @@ class LegalMovesRequest(BaseModel):
 
 class GameRequest(BaseModel):
     game_id: str
+
+class InstrumentationRequest(BaseModel):
+    enabled: bool
+    slow_threshold_ms: Optional[float] = None
+    reset: bool = False
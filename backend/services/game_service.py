@@ -17,6 +17,20 @@ from backend.engine import engine_manager
 from backend.state import games, game_variants, RULES_MAP
 from backend.socket_manager import manager
 
+def game_state_message(game: Game, **extra) -> dict:
+    """Builds a game_state broadcast from the status stored on the current position.
+
+    Keyword arguments are added to, or override, the common fields.
+    """
+    return {
+        "type": "game_state", "fen": game.state.fen, "turn": game.state.turn.value,
+        "is_over": game.is_over, "in_check": game.is_check, "winner": game.winner,
+        "move_history": game.move_history, "uci_history": game.uci_history,
+        "clocks": {c.value: t for c, t in game.get_current_clocks().items()} if game.clocks else None,
+        "explosion_square": str(game.state.explosion_square) if getattr(game.state, 'explosion_square', None) else None,
+        **extra
+    }
+
 async def save_game_to_db(game_id: str):
     game = games.get(game_id)
     variant = game_variants.get(game_id)
@@ -146,20 +160,9 @@ async def trigger_ai_move(game_id: str, game: Game):
             move_obj = Move(best_move_uci, player_to_move=game.state.turn)
             game.take_turn(move_obj)
             rating_diffs = await save_game_to_db(game_id)
-            await manager.broadcast(game_id, json.dumps({
-                "type": "game_state", 
-                "fen": game.state.fen, 
-                "turn": game.state.turn.value, 
-                "is_over": game.is_over, 
-                "in_check": game.is_check, 
-                "winner": game.winner, 
-                "move_history": game.move_history, 
-                "uci_history": game.uci_history,
-                "clocks": {c.value: t for c, t in game.get_current_clocks().items()} if game.clocks else None, 
-                "rating_diffs": rating_diffs,
-                "explosion_square": str(game.state.explosion_square) if getattr(game.state, 'explosion_square', None) else None,
-                "is_drop": move_obj.is_drop
-            }))
+            await manager.broadcast(game_id, json.dumps(
+                game_state_message(game, rating_diffs=rating_diffs, is_drop=move_obj.is_drop)
+            ))
     except Exception as e:
         print(f"[AI] ERROR in trigger_ai_move: {e}")
         traceback.print_exc()
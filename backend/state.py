@@ -1,9 +1,10 @@
+from backend.core.config import POSITION_CACHE_SIZE
 from v_chess.game import Game
-from v_chess.rules import (
-    AntichessRules, StandardRules, AtomicRules, Chess960Rules,
-    CrazyhouseRules, HordeRules, KingOfTheHillRules, RacingKingsRules,
-    ThreeCheckRules
-)
+from v_chess.position_cache import position_cache
+from v_chess.rules import RULES_MAP
+
+# Legal moves and game status shared across all games in this process.
+position_cache.resize(POSITION_CACHE_SIZE)
 
 # Global in-memory storage
 games: dict[str, Game] = {}
@@ -11,15 +12,3 @@ game_variants: dict[str, str] = {}  # game_id -> variant name
 seeks: dict[str, dict] = {}
 quick_match_queue: list[dict] = []
 pending_takebacks: dict[str, str] = {}
-
-RULES_MAP = {
-    "standard": StandardRules,
-    "antichess": AntichessRules,
-    "atomic": AtomicRules,
-    "chess960": Chess960Rules,
-    "crazyhouse": CrazyhouseRules,
-    "horde": HordeRules,
-    "kingofthehill": KingOfTheHillRules,
-    "racingkings": RacingKingsRules,
-    "threecheck": ThreeCheckRules,
-}
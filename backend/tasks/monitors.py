@@ -3,7 +3,7 @@ import json
 from v_chess.enums import Color
 from backend.state import games
 from backend.socket_manager import manager
-from backend.services.game_service import save_game_to_db
+from backend.services.game_service import save_game_to_db, game_state_message
 from backend.services.matchmaking_service import match_players
 
 async def quick_match_monitor():
@@ -29,19 +29,11 @@ async def timeout_monitor():
                             game.is_over_by_timeout = True
                             winner = Color.WHITE if color == Color.BLACK else Color.BLACK
                             rating_diffs = await save_game_to_db(game_id)
-                            await manager.broadcast(game_id, json.dumps({
-                                "type": "game_state",
-                                "fen": game.state.fen,
-                                "turn": game.state.turn.value,
-                                "is_over": True,
-                                "in_check": game.is_check,
-                                "winner": winner.value,
-                                "move_history": game.move_history,
-                                "uci_history": game.uci_history,
-                                "clocks": {c.value: 0 if c == color else t for c, t in current_clocks.items()},
-                                "status": "timeout",
-                                "rating_diffs": rating_diffs
-                            }))
+                            await manager.broadcast(game_id, json.dumps(game_state_message(
+                                game, is_over=True, winner=winner.value,
+                                clocks={c.value: 0 if c == color else t for c, t in current_clocks.items()},
+                                status="timeout", rating_diffs=rating_diffs
+                            )))
             await asyncio.sleep(0.1)
         except Exception as e:
             print(f"Error in timeout monitor: {e}")
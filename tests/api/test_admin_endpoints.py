@@ -0,0 +1,18 @@
+from v_chess.instrumentation import instrumentation
+
+
+def test_instrumentation_can_be_toggled_and_read(client):
+    try:
+        response = client.post("/api/admin/instrumentation", json={"enabled": True, "slow_threshold_ms": 0, "reset": True})
+        assert response.status_code == 200
+        assert response.json()["enabled"] is True
+
+        game_id = client.post("/api/game/new", json={"variant": "standard"}).json()["game_id"]
+        client.post("/api/moves/all_legal", json={"game_id": game_id})
+
+        data = client.get("/api/admin/instrumentation").json()
+        assert data["validators"]["validate_piece_presence"]["calls"] >= 20
+        assert data["slow_moves"] and data["slow_moves"][0]["variant"] == "StandardRules"
+    finally:
+        client.post("/api/admin/instrumentation", json={"enabled": False, "slow_threshold_ms": 50, "reset": True})
+    assert instrumentation.enabled is False
@@ -65,3 +65,25 @@ def test_get_all_legal_moves(client):
     data = response.json()
     assert len(data["moves"]) == 20 # 16 pawn moves + 4 knight moves
     assert "e2e4" in data["moves"]
+
+def test_position_cache_stats(client):
+    create_res = client.post("/api/game/new", json={"variant": "standard"})
+    game_id = create_res.json()["game_id"]
+    client.post("/api/moves/legal", json={"game_id": game_id, "square": "e2"})
+    client.post("/api/moves/legal", json={"game_id": game_id, "square": "d2"})
+
+    response = client.get("/api/moves/cache")
+    assert response.status_code == 200
+    data = response.json()
+    assert data["hits"] >= 1 and data["size"] >= 1
+
+def test_get_attacks(client):
+    create_res = client.post("/api/game/new", json={"variant": "standard"})
+    game_id = create_res.json()["game_id"]
+
+    response = client.post("/api/moves/attacks", json={"game_id": game_id})
+    assert response.status_code == 200
+    data = response.json()
+    assert "e3" in data["attacked"]["w"] and "e6" in data["attacked"]["b"]
+    assert "e4" not in data["attacked"]["w"]
+    assert data["checkers"] == [] and data["pinned"] == []
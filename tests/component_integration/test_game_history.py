@@ -36,3 +36,27 @@ def test_repetitions_counts_accurately():
     game.take_turn(Move("f6g8", player_to_move=game.state.turn))
 
     assert game.repetitions_of_position == 3
+
+def test_undo_rolls_back_repetition_counts():
+    """Verify undone positions no longer count towards repetitions."""
+    game = Game()
+    for uci in ("g1f3", "g8f6", "f3g1", "f6g8"):
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+    assert game.repetitions_of_position == 2
+
+    for _ in range(4):
+        game.undo_move()
+    for uci in ("g1f3", "g8f6", "f3g1", "f6g8"):
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+
+    assert game.repetitions_of_position == 2
+    assert len(game.history) == 4
+
+def test_repetitions_ignore_move_clocks():
+    """Verify positions repeat regardless of halfmove and fullmove counters."""
+    game = Game("4k3/8/8/8/8/8/8/4K2R w - - 7 30")
+    for uci in ("h1h2", "e8d8", "h2h1", "d8e8"):
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+
+    assert game.state.halfmove_clock == 11
+    assert game.repetitions_of_position == 2
@@ -0,0 +1,38 @@
+from dataclasses import replace
+
+from v_chess.enums import Color, GameOverReason
+from v_chess.game import Game
+from v_chess.move import Move
+
+
+def test_take_turn_records_outcome_on_state():
+    """Verify the committed move's status is stored on the new state."""
+    game = Game("6k1/5ppp/8/8/8/8/8/R6K w - - 0 1")
+    game.take_turn(Move("a1a8"))
+
+    outcome = game.state.outcome
+    assert outcome.san == "Ra8#"
+    assert outcome.is_check and outcome.game_over_reason == GameOverReason.CHECKMATE
+    assert outcome.winner == Color.WHITE and outcome.result == "1-0"
+    assert game.is_over and game.winner == "w"
+    assert game.move_history == ["Ra8#", "1-0"]
+
+
+def test_outcome_is_not_copied_to_derived_states():
+    """Verify replace() does not carry a stale status to a new state."""
+    game = Game()
+    game.take_turn(Move("e2e4"))
+    assert game.state.outcome.san == "e4"
+    assert replace(game.state, halfmove_clock=5).outcome is None
+
+
+def test_outcome_of_unplayed_position_and_overrides():
+    """Verify positions not reached by a move are evaluated lazily."""
+    game = Game()
+    assert game.state.outcome is None
+    assert not game.is_check and not game.is_over
+    assert game.state.outcome.san is None
+
+    game.resign(Color.WHITE)
+    assert game.is_over and game.game_over_reason == GameOverReason.SURRENDER
+    assert not game.state.outcome.is_over
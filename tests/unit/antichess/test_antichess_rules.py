@@ -83,3 +83,14 @@ def test_termination_stalemate():
     
     assert not game.legal_moves
     assert game.is_over
+
+def test_capture_available_flag():
+    # Black pawn a2 is attacked by the rook; nothing attacks the black pawn on h7.
+    assert GameState.from_fen("8/7p/8/8/8/8/p7/R7 w - - 0 1").attacks.capture_available
+    assert not GameState.from_fen("8/7p/8/8/8/8/8/1R6 w - - 0 1").attacks.capture_available
+    # En passant is the only capture.
+    assert GameState.from_fen("8/8/8/3Pp3/8/8/8/8 w - e6 0 1").attacks.capture_available
+
+def test_legal_moves_are_all_captures_when_one_exists():
+    state = GameState.from_fen("rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR w - - 0 2")
+    assert [move.uci for move in AntichessRules().legal_moves(state)] == ["e4d5"]
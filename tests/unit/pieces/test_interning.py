@@ -0,0 +1,47 @@
+import copy
+import pickle
+
+from v_chess.board import Board
+from v_chess.enums import Color
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.piece import Pawn, Knight, Queen, King
+from v_chess.piece.codes import PIECES, piece_code, piece_for
+from v_chess.square import Square
+
+
+def test_constructor_returns_shared_instance():
+    assert Knight(Color.WHITE) is Knight(Color.WHITE)
+    assert Knight(Color.WHITE) is not Knight(Color.BLACK)
+    assert Knight(Color.WHITE) != Queen(Color.WHITE)
+
+
+def test_pieces_table_is_indexed_by_code():
+    assert len(set(map(id, PIECES))) == 12
+    for piece in PIECES:
+        assert PIECES[piece_code(type(piece), piece.color)] is piece
+    assert piece_for(King, Color.BLACK) is King(Color.BLACK)
+
+
+def test_copy_and_pickle_keep_identity():
+    pawn = Pawn(Color.BLACK)
+    assert copy.copy(pawn) is pawn
+    assert copy.deepcopy(pawn) is pawn
+    assert pickle.loads(pickle.dumps(pawn)) is pawn
+
+
+def test_board_returns_interned_pieces():
+    board = Board.starting_setup()
+    assert board.get_piece(Square("g1")) is Knight(Color.WHITE)
+    assert all(piece is PIECES[piece_code(type(piece), piece.color)] for _, piece in board.items())
+    assert board.piece_code_at(Square("d8").index) == piece_code(Queen, Color.BLACK)
+    assert board.piece_code_at(Square("d4").index) == -1
+
+
+def test_parsed_pieces_are_interned():
+    assert Move("e7e8q", player_to_move=Color.WHITE).promotion_piece is Queen(Color.WHITE)
+    assert Move("N@f3", player_to_move=Color.BLACK).drop_piece is Knight(Color.BLACK)
+
+    state = GameState.from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR[Np] w KQkq - 0 1")
+    assert state.pockets[0][0] is Knight(Color.WHITE)
+    assert state.pockets[1][0] is Pawn(Color.BLACK)
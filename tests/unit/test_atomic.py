@@ -79,3 +79,34 @@ def test_atomic_adjacent_kings_illegal():
     game = Game(fen, rules=AtomicRules())
     
     assert game.rules.validate_move(game.state, Move("c1b1")) != MoveLegalityReason.LEGAL
+
+def test_atomic_explosion_keeps_the_previous_position():
+    """Verify the explosion only changes the successor board and updates castling rights."""
+    # Bxh8 blows up the rook on h8 and the knight on g8.
+    fen = "r3k1nr/pppppp1p/8/8/8/8/PBPPPPPP/RN1QKBNR w KQkq - 0 1"
+    rules = AtomicRules()
+    game = Game(fen, rules=rules)
+    before = game.state.board.fen
+    new_state = rules.apply_move(game.state, Move("b2h8"))
+
+    assert game.state.board.fen == before
+    assert new_state.board.get_piece("h8") is None and new_state.board.get_piece("g8") is None
+    assert new_state.board.get_piece("h7") == Pawn(Color.BLACK)
+    assert {right.value for right in new_state.castling_rights} == {"K", "Q", "q"}
+    assert new_state.zobrist == new_state._compute_zobrist()
+
+def test_atomic_gives_check_resolves_explosions():
+    """Verify captures are tested for check after their explosion."""
+    from v_chess.game_state import GameState
+    from v_chess.san import san_for_moves
+    rules = AtomicRules()
+
+    # The queen explodes with the knight on d4 and gives no check.
+    state = GameState.from_fen("7k/8/8/8/3n4/8/8/3QK3 w - - 0 1")
+    assert not rules.gives_check(state, Move("d1d4"))
+    assert san_for_moves(state, [Move("d1d4")], rules, annotate=True) == ["Qxd4"]
+
+    # The explosion on d5 removes the knight blocking the e-file.
+    state = GameState.from_fen("4k3/8/8/3bn3/8/2N5/8/4R2K w - - 0 1")
+    assert rules.gives_check(state, Move("c3d5"))
+    assert rules.is_check(rules.apply_move(state, Move("c3d5")))
@@ -0,0 +1,108 @@
+import pytest
+
+from v_chess.bitboard import AttackTables
+from v_chess.board import Board
+from v_chess.enums import Color
+from v_chess.piece.bishop import Bishop
+from v_chess.piece.pawn import Pawn
+from v_chess.piece.rook import Rook
+from v_chess.square import Square
+
+
+def bit(name: str) -> int:
+    return 1 << Square(name).index
+
+
+def bits(*names: str) -> int:
+    mask = 0
+    for name in names:
+        mask |= bit(name)
+    return mask
+
+
+def ray_walk(sq_idx: int, occupied: int, deltas: list[tuple[int, int]]) -> int:
+    r, c = divmod(sq_idx, 8)
+    mask = 0
+    for dr, dc in deltas:
+        nr, nc = r + dr, c + dc
+        while 0 <= nr < 8 and 0 <= nc < 8:
+            mask |= 1 << (nr * 8 + nc)
+            if occupied & (1 << (nr * 8 + nc)):
+                break
+            nr += dr
+            nc += dc
+    return mask
+
+
+def test_rook_attacks_empty_board():
+    assert AttackTables.rook_attacks(Square("a1").index, 0) == (
+        bits("a2", "a3", "a4", "a5", "a6", "a7", "a8", "b1", "c1", "d1", "e1", "f1", "g1", "h1")
+    )
+
+
+def test_rook_attacks_stop_on_blockers():
+    occ = bits("d6", "f4", "d2")
+    attacks = AttackTables.rook_attacks(Square("d4").index, occ)
+    assert attacks == bits("d5", "d6", "e4", "f4", "d3", "d2", "c4", "b4", "a4")
+
+
+def test_bishop_attacks_stop_on_blockers():
+    occ = bits("f6", "b2")
+    attacks = AttackTables.bishop_attacks(Square("d4").index, occ)
+    assert attacks == bits("e5", "f6", "c3", "b2", "c5", "b6", "a7", "e3", "f2", "g1")
+
+
+def test_queen_attacks_is_union():
+    occ = bits("d6", "f6", "b2")
+    sq = Square("d4").index
+    assert AttackTables.queen_attacks(sq, occ) == (
+        AttackTables.rook_attacks(sq, occ) | AttackTables.bishop_attacks(sq, occ)
+    )
+
+
+@pytest.mark.parametrize("seed", range(4))
+def test_slider_tables_match_ray_walk(seed):
+    import random
+    rng = random.Random(seed)
+    straight = [(0, 1), (0, -1), (1, 0), (-1, 0)]
+    diagonal = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
+    for sq in range(64):
+        occ = rng.getrandbits(64)
+        assert AttackTables.rook_attacks(sq, occ) == ray_walk(sq, occ, straight)
+        assert AttackTables.bishop_attacks(sq, occ) == ray_walk(sq, occ, diagonal)
+
+
+def test_pawn_attacks():
+    assert AttackTables.pawn_attacks(Square("e4").index, Color.WHITE) == bits("d5", "f5")
+    assert AttackTables.pawn_attacks(Square("e4").index, Color.BLACK) == bits("d3", "f3")
+    assert AttackTables.pawn_attacks(Square("a2").index, Color.WHITE) == bit("b3")
+
+
+def test_is_attacked_uses_occupancy():
+    board = Board.empty()
+    board.set_piece(Rook(Color.WHITE), Square("a1"))
+    board.set_piece(Pawn(Color.BLACK), Square("a4"))
+    bb = board.bitboard
+
+    assert bb.is_attacked(Square("a4").index, Color.WHITE)
+    assert not bb.is_attacked(Square("a5").index, Color.WHITE)
+    assert bb.is_attacked(Square("a5").index, Color.WHITE, occupancy_override=bb.occupied & ~bit("a4"))
+
+
+def test_is_attacked_by_pawns_and_bishops():
+    board = Board.empty()
+    board.set_piece(Pawn(Color.WHITE), Square("e4"))
+    board.set_piece(Bishop(Color.BLACK), Square("h8"))
+    bb = board.bitboard
+
+    assert bb.is_attacked(Square("d5").index, Color.WHITE)
+    assert not bb.is_attacked(Square("e5").index, Color.WHITE)
+    assert not bb.is_attacked(Square("d3").index, Color.WHITE)
+    assert bb.is_attacked(Square("e5").index, Color.BLACK)
+    assert bb.is_attacked(Square("a1").index, Color.BLACK)
+    assert not bb.is_attacked(Square("d5").index, Color.BLACK)
+
+
+def test_explosion_masks():
+    assert AttackTables.explosion_mask(Square("a1").index) == bits("a1", "a2", "b1", "b2")
+    assert AttackTables.explosion_mask(Square("e4").index) == AttackTables.king_attacks(Square("e4").index) | bit("e4")
@@ -0,0 +1,74 @@
+import pytest
+
+from v_chess.enums import Color
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.move_codes import SQUARES
+from v_chess.piece import Rook
+from v_chess.rules import CrazyhouseRules, StandardRules
+from v_chess.square import Square
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def test_attack_maps_match_square_queries():
+    state = GameState.from_fen(KIWIPETE)
+    bitboard = state.board.bitboard
+    for color in Color:
+        for square in SQUARES:
+            assert state.attacks.is_attacked(square.index, color) == bitboard.is_attacked(square.index, color)
+
+
+def test_attacks_are_kept_on_the_state():
+    state = GameState.from_fen(KIWIPETE)
+    assert state.attacks is state.attacks
+    assert StandardRules().apply_move(state, Move("e1g1")).attacks is not state.attacks
+
+
+def test_attacks_follow_in_place_board_changes():
+    state = GameState.from_fen("4k3/8/8/8/8/8/8/4K3 w - - 0 1")
+    assert not state.attacks.in_check(Color.WHITE)
+    state.board.set_piece(Rook(Color.BLACK), "e5")
+    assert state.attacks.in_check(Color.WHITE)
+    assert state.attacks.checkers == 1 << Square("e5").index
+
+
+def test_pinned_pieces():
+    state = GameState.from_fen("4k3/4r3/8/8/1b6/8/3NR3/4K3 w - - 0 1")
+    pinned = state.attacks.pinned
+    assert pinned == (1 << Square("e2").index) | (1 << Square("d2").index)
+    assert state.attacks.to_dict()["pinned"] == ["d2", "e2"]
+
+
+def test_in_check_agrees_with_rules():
+    state = GameState.from_fen("4k3/8/8/8/8/8/3P4/r3K3 w - - 0 1")
+    assert StandardRules().is_check(state)
+    assert state.attacks.to_dict()["checkers"] == ["a1"]
+
+
+@pytest.mark.parametrize("fen, uci, expected", [
+    ("4k3/8/8/8/8/8/8/R3K3 w - - 0 1", "a1a8", True),
+    ("4k3/8/8/8/8/8/8/R3K3 w - - 0 1", "a1b1", False),
+    # Discovered check by the bishop behind the knight.
+    ("7k/8/8/8/8/2N5/8/B3K3 w - - 0 1", "c3e4", True),
+    # Promotion to a knight checks, to a queen it does not.
+    ("8/3P4/8/5k2/8/8/8/4K3 w - - 0 1", "d7d8n", False),
+    ("8/3P4/4k3/8/8/8/8/4K3 w - - 0 1", "d7d8n", True),
+    # En passant opens the rank for the rook.
+    ("8/8/8/R2Pp2k/8/8/8/4K3 w - e6 0 1", "d5e6", True),
+    # The castled rook gives check.
+    ("5k2/8/8/8/8/8/8/4K2R w K - 0 1", "e1g1", True),
+])
+def test_gives_check_matches_applied_move(fen, uci, expected):
+    rules = StandardRules()
+    state = GameState.from_fen(fen)
+    move = Move(uci)
+    assert rules.gives_check(state, move) is expected
+    assert rules.is_check(rules.apply_move(state, move)) is expected
+
+
+def test_drop_gives_check():
+    rules = CrazyhouseRules()
+    state = GameState.from_fen("4k3/8/8/8/8/8/8/4K3[N] w - - 0 1")
+    assert rules.gives_check(state, Move("N@d6"))
+    assert not rules.gives_check(state, Move("N@d5"))
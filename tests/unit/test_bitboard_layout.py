@@ -0,0 +1,143 @@
+import pytest
+
+from v_chess.bench import BENCHMARKS, run_benchmarks
+from v_chess.bitboard import Bitboard
+from v_chess.board import Board
+from v_chess.enums import Color
+from v_chess.piece import Pawn, Knight, Bishop, Rook, Queen, King
+from v_chess.piece.codes import BLACK_OFFSET, CODE_COLORS, CODE_TYPES, NUM_CODES, code_of, piece_code
+from v_chess.square import Square
+
+
+def test_piece_codes_round_trip():
+    seen = set()
+    for color in Color:
+        for p_type in (Pawn, Knight, Bishop, Rook, Queen, King):
+            code = piece_code(p_type, color)
+            assert code == code_of(p_type(color))
+            assert CODE_TYPES[code] is p_type
+            assert CODE_COLORS[code] == color
+            seen.add(code)
+    assert seen == set(range(NUM_CODES))
+    assert piece_code(Pawn, Color.BLACK) == BLACK_OFFSET
+
+
+def test_bitboard_uses_slots():
+    bb = Bitboard()
+    assert not hasattr(bb, "__dict__")
+    with pytest.raises(AttributeError):
+        bb.extra = 1
+
+
+def test_occupancy_is_updated_incrementally():
+    bb = Bitboard()
+    e4 = Square("e4").index
+    bb.set_piece(e4, Knight(Color.WHITE))
+    assert bb.colors == [1 << e4, 0]
+    assert bb.occupied == 1 << e4
+
+    bb.remove_piece(e4, Knight(Color.WHITE))
+    assert bb.colors == [0, 0]
+    assert bb.occupied == 0
+
+
+def test_removing_absent_piece_keeps_occupancy():
+    bb = Bitboard()
+    e4 = Square("e4").index
+    bb.set_piece(e4, Knight(Color.WHITE))
+    bb.remove_piece(e4, Bishop(Color.WHITE))
+    assert bb.piece_at(e4) == (Knight, Color.WHITE)
+    assert bb.occupied == 1 << e4
+
+
+def test_dict_views_match_masks():
+    bb = Board.starting_setup().bitboard
+    assert bb.pieces[Color.WHITE][Pawn] == 0xFF << 48
+    assert bb.pieces[Color.BLACK][King] == 1 << Square("e8").index
+    assert bb.occupied_co[Color.BLACK] == 0xFFFF
+    assert bb.get_piece_mask(Queen, Color.WHITE) == 1 << Square("d1").index
+
+
+def test_piece_code_at():
+    bb = Board.starting_setup().bitboard
+    assert bb.piece_code_at(Square("e8").index) == piece_code(King, Color.BLACK)
+    assert bb.piece_code_at(Square("a1").index) == piece_code(Rook, Color.WHITE)
+    assert bb.piece_code_at(Square("e4").index) == -1
+
+
+def test_copy_is_independent():
+    bb = Board.starting_setup().bitboard
+    clone = bb.copy()
+    clone.remove_piece(Square("e2").index, Pawn(Color.WHITE))
+    assert bb.piece_at(Square("e2").index) == (Pawn, Color.WHITE)
+    assert clone.piece_at(Square("e2").index) == (None, None)
+    assert bb.occupied != clone.occupied
+
+
+def test_update_occupancy_rebuilds_from_masks():
+    bb = Board.starting_setup().bitboard.copy()
+    expected = (list(bb.colors), bb.occupied)
+    bb.colors = [0, 0]
+    bb.occupied = 0
+    bb.update_occupancy()
+    assert (bb.colors, bb.occupied) == expected
+
+
+def test_mailbox_matches_masks():
+    bb = Board("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R").bitboard
+    for idx in range(64):
+        expected = next((code for code, mask in enumerate(bb.masks) if mask >> idx & 1), -1)
+        assert bb.mailbox[idx] == expected
+
+
+def test_mailbox_follows_mutations():
+    bb = Board.starting_setup().bitboard.copy()
+    bb.remove_piece(Square("e2").index, Pawn(Color.WHITE))
+    bb.set_piece(Square("e4").index, Pawn(Color.WHITE))
+    assert bb.mailbox[Square("e2").index] == -1
+    assert bb.mailbox[Square("e4").index] == piece_code(Pawn, Color.WHITE)
+
+    rebuilt = Bitboard()
+    rebuilt.masks = bb.masks.copy()
+    rebuilt.update_occupancy()
+    assert rebuilt.mailbox == bb.mailbox
+
+
+def test_set_piece_replaces_the_occupant():
+    bb = Board.starting_setup().bitboard.copy()
+    d8 = Square("d8").index
+    bb.set_piece(d8, Knight(Color.WHITE))
+    assert bb.mailbox[d8] == piece_code(Knight, Color.WHITE)
+    assert not bb.masks[piece_code(Queen, Color.BLACK)] >> d8 & 1
+    assert not bb.colors[1] >> d8 & 1
+    assert sum(mask >> d8 & 1 for mask in bb.masks) == 1
+
+    rebuilt = Bitboard()
+    rebuilt.masks = bb.masks.copy()
+    rebuilt.update_occupancy()
+    assert (rebuilt.colors, rebuilt.occupied, rebuilt.mailbox) == (bb.colors, bb.occupied, bb.mailbox)
+
+
+def test_from_mailbox_matches_piecewise_setup():
+    board = Board.starting_setup()
+    clone = Bitboard.from_mailbox(board.bitboard.mailbox.copy())
+    assert (clone.masks, clone.colors, clone.occupied) == (
+        board.bitboard.masks, board.bitboard.colors, board.bitboard.occupied
+    )
+
+
+@pytest.mark.parametrize("placement", ["8/8/8/8/8/8/8/8/K7", "9K/8/8/8/8/8/8/8", "8/8/8/8/8/8/8/7X"])
+def test_invalid_placement_raises(placement):
+    with pytest.raises(ValueError):
+        Board(placement)
+
+
+def test_benchmarks_report_every_entry():
+    results = run_benchmarks(iterations=200)
+    assert [r.name for r in results] == list(BENCHMARKS)
+    assert all(r.value > 0 for r in results)
+
+
+def test_unknown_benchmark_raises():
+    with pytest.raises(ValueError):
+        run_benchmarks(["nope"])
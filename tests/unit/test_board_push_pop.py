@@ -0,0 +1,133 @@
+import random
+
+import pytest
+
+from v_chess.board import Board
+from v_chess.enums import Color
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.perft import legal_moves
+from v_chess.piece.knight import Knight
+from v_chess.piece.pawn import Pawn
+from v_chess.piece.queen import Queen
+from v_chess.rules import AtomicRules, StandardRules
+from v_chess.square import Square
+
+
+def snapshot(board: Board):
+    bb = board.bitboard
+    return (
+        {c: dict(masks) for c, masks in bb.pieces.items()},
+        dict(bb.occupied_co),
+        bb.occupied,
+    )
+
+
+def test_push_pop_restores_quiet_move():
+    board = Board.starting_setup()
+    before = snapshot(board)
+
+    undo = board.push(Move("g1f3"))
+    assert isinstance(board.get_piece(Square("f3")), Knight)
+    assert board.get_piece(Square("g1")) is None
+    assert undo.captured is None
+
+    board.pop(undo)
+    assert snapshot(board) == before
+
+
+def test_push_capture_records_captured_piece():
+    board = Board("8/8/8/3p4/4P3/8/8/8")
+    undo = board.push(Move("e4d5"))
+    assert undo.captured == Pawn(Color.BLACK)
+    assert board.get_piece(Square("d5")) == Pawn(Color.WHITE)
+    assert len(board) == 1
+
+
+def test_push_en_passant_removes_passed_pawn():
+    state = GameState.from_fen("8/8/8/3pP3/8/8/8/8 w - d6 0 1")
+    board = state.board
+    before = snapshot(board)
+
+    undo = board.push(Move("e5d6"), state.ep_square)
+    assert board.get_piece(Square("d5")) is None
+    assert board.get_piece(Square("d6")) == Pawn(Color.WHITE)
+    assert undo.captured == Pawn(Color.BLACK)
+
+    board.pop(undo)
+    assert snapshot(board) == before
+
+
+def test_push_promotion():
+    board = Board("8/4P3/8/8/8/8/8/8")
+    board.push(Move("e7e8q"))
+    assert board.get_piece(Square("e8")) == Queen(Color.WHITE)
+    assert board.bitboard.pieces[Color.WHITE][Pawn] == 0
+
+
+@pytest.mark.parametrize("rook, king_dest, rook_dest", [
+    ("h1", "g1", "f1"),
+    ("a1", "c1", "d1"),
+])
+def test_push_castling(rook, king_dest, rook_dest):
+    board = Board("8/8/8/8/8/8/8/R3K2R")
+    before = snapshot(board)
+
+    undo = board.push(Move(f"e1{king_dest}"), castling_rook=Square(rook))
+    assert board.get_piece(Square(king_dest)) is not None
+    assert board.get_piece(Square(rook_dest)) is not None
+    assert board.get_piece(Square("e1")) is None
+    assert board.get_piece(Square(rook)) is None
+
+    board.pop(undo)
+    assert snapshot(board) == before
+
+
+def test_push_drop():
+    board = Board.empty()
+    undo = board.push(Move("N@e4"))
+    assert board.get_piece(Square("e4")) == Knight(Color.WHITE)
+    board.pop(undo)
+    assert len(board) == 0
+
+
+def test_push_explode_spares_pawns():
+    board = Board("8/8/3ppn2/4n3/8/8/4R3/8")
+    before = snapshot(board)
+
+    undo = board.push(Move("e2e5"), explode=True)
+    assert board.get_piece(Square("e5")) is None
+    assert board.get_piece(Square("f6")) is None
+    assert board.get_piece(Square("d6")) == Pawn(Color.BLACK)
+    assert board.get_piece(Square("e6")) == Pawn(Color.BLACK)
+
+    board.pop(undo)
+    assert snapshot(board) == before
+
+
+@pytest.mark.parametrize("rules_cls, explode", [(StandardRules, False), (AtomicRules, True)])
+def test_push_matches_apply_move_on_random_games(rules_cls, explode):
+    rng = random.Random(7)
+    rules = rules_cls()
+    state = GameState.from_fen("r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1")
+
+    for _ in range(30):
+        moves = legal_moves(rules, state)
+        if not moves:
+            break
+        move = rng.choice(sorted(moves, key=lambda m: m.uci))
+        next_state = rules.apply_move(state, move)
+
+        board = state.board.copy()
+        before = snapshot(board)
+        piece = board.get_piece(move.start)
+        is_castling = piece.fen.upper() == "K" and abs(move.start.col - move.end.col) > 1
+        rook = None
+        if is_castling:
+            rook = Square(move.start.row, 7 if move.end.col > move.start.col else 0)
+        undo = board.push(move, state.ep_square, rook, explode)
+        assert board.fen == next_state.board.fen
+
+        board.pop(undo)
+        assert snapshot(board) == before
+        state = next_state
@@ -0,0 +1,99 @@
+import pytest
+
+from v_chess.codec import CODEC_VERSION, decode_game, decode_state, encode_game, encode_state
+from v_chess.game import Game
+from v_chess.game_state import CrazyhouseGameState, GameState, ThreeCheckGameState
+from v_chess.move import Move
+from v_chess.rules import AtomicRules, CrazyhouseRules, ThreeCheckRules
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+@pytest.mark.parametrize("fen", [
+    GameState.STARTING_FEN,
+    KIWIPETE,
+    "rnbqkbnr/pppp1ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq e6 0 2",
+    "8/8/8/4k3/8/8/8/4K3 b - - 57 123",
+    "bqnb1rkr/pp3ppp/3ppn2/2p5/5P2/P2P4/NPP1P1PP/BQ1BNRKR w HFhf - 2 9",
+    "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1 +2+1",
+    "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R[BNPPQRpq] w KQkq - 0 1",
+    "8/8/8/8/8/8/8/8 w - - 0 1",
+])
+def test_state_round_trip(fen):
+    state = GameState.from_fen(fen)
+    decoded = decode_state(encode_state(state))
+    assert type(decoded) is type(state)
+    assert decoded == state
+    assert decoded.fen == state.fen
+    assert decoded.zobrist == state.zobrist
+    assert GameState.from_bytes(state.to_bytes()) == state
+
+
+def test_variant_fields_are_kept():
+    three_check = decode_state(encode_state(GameState.from_fen(f"{GameState.STARTING_FEN} +2+1")))
+    assert isinstance(three_check, ThreeCheckGameState)
+    assert three_check.checks == (2, 1)
+
+    crazyhouse = decode_state(encode_state(GameState.from_fen(
+        "k7/8/8/8/8/8/8/7K[QQn] w - - 0 1"
+    )))
+    assert isinstance(crazyhouse, CrazyhouseGameState)
+    assert crazyhouse.pockets[0].counts == (0, 0, 0, 0, 2)
+    assert crazyhouse.pockets[1].counts == (0, 1, 0, 0, 0)
+
+    rules = AtomicRules()
+    state = rules.apply_move(GameState.from_fen(KIWIPETE), Move("e5f7"))
+    decoded = decode_state(encode_state(state))
+    assert decoded.explosion_square == state.explosion_square is not None
+    assert decoded.repetition_count == state.repetition_count
+
+
+def test_encoding_is_smaller_than_fen():
+    state = GameState.from_fen(KIWIPETE)
+    assert len(encode_state(state)) < len(state.fen)
+
+
+@pytest.mark.parametrize("rules, fen, ucis", [
+    (None, None, ["e2e4", "e7e5", "g1f3", "b8c6", "f1b5", "a7a6", "e1g1"]),
+    (ThreeCheckRules(), None, ["e2e4", "f7f6", "d1h5"]),
+    (CrazyhouseRules(), "k7/8/8/8/8/8/p7/R6K w - - 0 1", ["a1a2", "a8b8", "P@b7"]),
+])
+def test_game_round_trip(rules, fen, ucis):
+    game = Game(fen, rules=rules)
+    for uci in ucis:
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+
+    decoded = decode_game(encode_game(game))
+    assert type(decoded.rules) is type(game.rules)
+    assert decoded.state == game.state
+    assert decoded.move_history == game.move_history
+    assert decoded.move_codes == game.move_codes
+    assert list(decoded.history) == list(game.history)
+
+
+def test_game_without_moves():
+    game = Game()
+    decoded = decode_game(encode_game(game))
+    assert decoded.state == game.state
+    assert not decoded.history
+
+
+def test_other_versions_are_rejected():
+    data = bytearray(encode_state(GameState.starting_setup()))
+    data[0] = CODEC_VERSION + 1
+    with pytest.raises(ValueError):
+        decode_state(bytes(data))
+
+
+@pytest.mark.parametrize("cut", [1, 5, 20, -1])
+def test_truncated_data_raises(cut):
+    data = encode_state(GameState.from_fen(KIWIPETE))
+    with pytest.raises(ValueError):
+        decode_state(data[:cut])
+
+
+def test_truncated_game_raises():
+    game = Game()
+    game.take_turn(Move("e2e4"))
+    with pytest.raises(ValueError):
+        decode_game(encode_game(game)[:-1])
@@ -86,4 +86,26 @@ def test_crazyhouse_checkmate_with_drop():
     game.take_turn(Move("Q@a8"))
     
     assert game.is_over
-    assert game.game_over_reason == GameOverReason.CHECKMATE
\ No newline at end of file
+    assert game.game_over_reason == GameOverReason.CHECKMATE
+
+def test_crazyhouse_pockets_are_counts():
+    """Verify pockets count pieces per type and serialize in FEN order."""
+    fen = "k7/8/8/8/8/8/8/7K[RQPBNPqp] w - - 0 1"
+    state = CrazyhouseGameState.from_fen(fen)
+
+    assert state.pockets[0].counts == (2, 1, 1, 1, 1)
+    assert state.pockets[1].counts == (1, 0, 0, 0, 1)
+    assert state.pockets[0].count(Queen) == 1
+    assert state.fen == "k7/8/8/8/8/8/8/7K[BNPPQRpq] w - - 0 1"
+    assert CrazyhouseGameState.from_fen(state.fen).fen == state.fen
+
+def test_crazyhouse_drops_block_check():
+    """Verify only blocking drops are generated in check."""
+    fen = "k7/8/8/8/8/8/8/r5K1[NP] w - - 0 1"
+    rules = CrazyhouseRules()
+    state = CrazyhouseGameState.from_fen(fen)
+
+    drops = {m.uci for m in rules.get_possible_moves(state) if m.is_drop}
+    # Pawns cannot block on the back rank.
+    assert drops == {f"N@{sq}" for sq in ("b1", "c1", "d1", "e1", "f1")}
+    assert {m.uci for m in rules.legal_moves(state) if m.is_drop} == drops
@@ -0,0 +1,70 @@
+import pytest
+
+from v_chess.game import Game
+from v_chess.history import GameHistory
+from v_chess.move import Move
+from v_chess.rules import CrazyhouseRules, StandardRules
+
+OPENING = ["e2e4", "e7e5", "g1f3", "b8c6", "f1b5", "a7a6", "b5c6", "d7c6", "e1g1", "f7f6"]
+
+
+def _play(game: Game, ucis: list[str]) -> list:
+    states = []
+    for uci in ucis:
+        states.append(game.state)
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+    return states
+
+
+@pytest.mark.parametrize("interval", [1, 3, 16])
+def test_positions_are_rebuilt_between_checkpoints(interval):
+    game = Game()
+    game.history = GameHistory(game.rules, interval)
+    states = _play(game, OPENING)
+
+    assert len(game.history) == len(states)
+    assert [s.fen for s in game.history] == [s.fen for s in states]
+    assert [game.history[i] for i in range(len(states))] == states
+    assert game.history[-1] == states[-1]
+    assert game.history[2:5] == states[2:5]
+    with pytest.raises(IndexError):
+        game.history[len(states)]
+
+
+def test_only_checkpoints_are_kept_in_full():
+    game = Game()
+    game.history = GameHistory(game.rules, 4)
+    _play(game, OPENING)
+    assert len(game.history._checkpoints) == 3
+
+
+def test_undo_across_checkpoints():
+    game = Game()
+    game.history = GameHistory(game.rules, 4)
+    states = _play(game, OPENING)
+
+    for expected in reversed(states):
+        game.undo_move()
+        assert game.state == expected
+    assert not game.history
+    assert game.history._checkpoints == []
+
+
+def test_repetition_counts_are_replayed():
+    game = Game()
+    game.history = GameHistory(game.rules, 3)
+    states = _play(game, ["g1f3", "g8f6", "f3g1", "f6g8"] * 2)
+    assert [s.repetition_count for s in game.history] == [s.repetition_count for s in states]
+    assert list(game.history) == states
+
+
+def test_drops_are_replayed():
+    game = Game("k7/8/8/8/8/8/8/7K[Nn] w - - 0 1", rules=CrazyhouseRules())
+    game.history = GameHistory(game.rules, 2)
+    states = _play(game, ["N@e4", "N@d5", "h1g1"])
+    assert list(game.history) == states
+
+
+def test_pop_from_empty_history_raises():
+    with pytest.raises(IndexError):
+        GameHistory(StandardRules()).pop()
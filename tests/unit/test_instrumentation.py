@@ -0,0 +1,48 @@
+import pytest
+
+from v_chess.enums import MoveLegalityReason
+from v_chess.game import Game
+from v_chess.instrumentation import instrumentation
+from v_chess.move import Move
+
+
+@pytest.fixture
+def recording():
+    instrumentation.reset()
+    instrumentation.enable(slow_threshold=0.0)
+    yield instrumentation
+    instrumentation.disable()
+    instrumentation.reset()
+    instrumentation.slow_threshold = 0.05
+
+
+def test_disabled_by_default_records_nothing():
+    instrumentation.reset()
+    Game().is_move_legal(Move("e2e4"))
+    assert instrumentation.validators == {}
+
+
+def test_counts_calls_rejections_and_time(recording):
+    game = Game()
+    assert game.is_move_legal(Move("e2e4"))
+    assert not game.is_move_legal(Move("e2e5"))
+
+    stats = recording.validators
+    assert stats["validate_piece_presence"].calls == 2
+    assert stats["validate_moveset"].rejections == {MoveLegalityReason.NOT_IN_MOVESET: 1}
+    assert stats["validate_king_safety"].calls == 1
+    assert all(s.seconds >= 0 for s in stats.values())
+
+
+def test_slow_moves_are_logged_with_position(recording):
+    game = Game()
+    game.take_turn(Move("e2e4"))
+
+    operations = {slow.operation for slow in recording.slow_moves}
+    assert operations >= {"validate", "apply"}
+    slow = next(s for s in recording.slow_moves if s.operation == "apply")
+    assert slow.variant == "StandardRules" and slow.move == "e2e4"
+    assert slow.fen == "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+
+    snapshot = recording.snapshot()
+    assert snapshot["enabled"] and snapshot["slow_moves"][0]["operation"] in ("validate", "apply")
@@ -0,0 +1,68 @@
+import pytest
+
+from v_chess.enums import Color
+from v_chess.game import Game
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.move_codes import decode, encode, from_uci, pack, to_uci
+from v_chess.perft import PERFT_SUITE, legal_moves
+from v_chess.piece import Knight, Queen
+from v_chess.piece.codes import KNIGHT, QUEEN
+from v_chess.rules import RULES_MAP
+from v_chess.square import Square
+
+
+@pytest.mark.parametrize("position", PERFT_SUITE, ids=lambda p: f"{p.variant}-{p.name}")
+def test_round_trip_of_legal_moves(position):
+    state = GameState.from_fen(position.fen)
+    for move in legal_moves(RULES_MAP[position.variant](), state):
+        code = encode(move)
+        assert decode(code) == move
+        assert to_uci(code) == move.uci
+        assert from_uci(move.uci, state.turn) == code
+        assert move.code == code
+
+
+def test_field_layout():
+    code = encode(Move("e7e8q", player_to_move=Color.WHITE))
+    assert code == pack(Square("e7").index, Square("e8").index, QUEEN + 1)
+
+    drop = encode(Move("N@f3", player_to_move=Color.BLACK))
+    assert drop == pack(0, Square("f3").index, drop=KNIGHT + 1, black=True)
+    assert decode(drop).drop_piece is Knight(Color.BLACK)
+
+
+def test_decode_shares_moves():
+    code = from_uci("g1f3")
+    assert decode(code) is decode(code)
+    assert decode(code).code == code
+
+
+def test_player_to_move_is_encoded():
+    white = Move("a7a8q", player_to_move=Color.WHITE)
+    black = Move("a7a8q", player_to_move=Color.BLACK)
+    assert white.code != black.code
+    assert decode(black.code).promotion_piece is Queen(Color.BLACK)
+
+
+def test_equal_moves_hash_equal():
+    a = Move(Square("e2"), Square("e4"))
+    b = Move("e2e4")
+    assert a == b and hash(a) == hash(b)
+    assert len({a, b, Move("d2d4")}) == 2
+
+
+@pytest.mark.parametrize("uci", ["e2", "e2e9", "z2e4", "e7e8x", "X@e4", "P@i9"])
+def test_from_uci_rejects_malformed_strings(uci):
+    with pytest.raises(ValueError):
+        from_uci(uci)
+
+
+def test_game_records_move_codes():
+    game = Game()
+    game.take_turn(Move("e2e4"))
+    game.take_turn(Move("e7e5", player_to_move=Color.BLACK))
+    assert [to_uci(code) for code in game.move_codes] == ["e2e4", "e7e5"]
+
+    game.undo_move()
+    assert game.move_codes == [from_uci("e2e4")]
@@ -0,0 +1,52 @@
+import pytest
+
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.move_context import MoveContext
+from v_chess.move_codes import SQUARES
+from v_chess.rules import AtomicRules, CrazyhouseRules, StandardRules
+from v_chess.square import Square
+
+KIWIPETE = "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1"
+
+
+def test_piece_table_matches_board():
+    state = GameState.from_fen(KIWIPETE)
+    context = MoveContext(state)
+    for square in SQUARES:
+        assert context.piece_at(square) == state.board.get_piece(square)
+    assert context.piece_at(Square(None)) is None
+    assert context.king_index == Square("e1").index
+
+
+def test_pinned_piece_is_only_safe_along_its_ray():
+    state = GameState.from_fen("4k3/4r3/8/8/8/8/4R3/4K3 w - - 0 1")
+    context = MoveContext(state)
+    assert context.keeps_king_safe(Move("e2e5"))
+    assert not context.keeps_king_safe(Move("e2d2"))
+    assert not context.keeps_king_safe(Move("e1d1"))
+
+
+def test_nothing_is_answered_in_check():
+    state = GameState.from_fen("4k3/8/8/8/8/8/3P4/r3K3 w - - 0 1")
+    context = MoveContext(state)
+    assert context.attacks.checkers
+    assert not context.keeps_king_safe(Move("d2d3"))
+
+
+def test_en_passant_is_always_probed():
+    state = GameState.from_fen("8/8/8/k2Pp2R/8/8/8/4K3 w - e6 0 1")
+    assert not MoveContext(state).keeps_king_safe(Move("d5e6"))
+
+
+@pytest.mark.parametrize("rules, fen", [
+    (StandardRules(), KIWIPETE),
+    (StandardRules(), "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1"),
+    (AtomicRules(), KIWIPETE),
+    (CrazyhouseRules(), "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R[Pp] w KQkq - 0 1"),
+])
+def test_batch_matches_single_move_validation(rules, fen):
+    state = rules.apply_move(GameState.from_fen(fen), rules.legal_moves(GameState.from_fen(fen))[0])
+    moves = rules.get_possible_moves(state)
+    moves += [Move(start, end) for start in SQUARES[:16] for end in SQUARES[40:56]]
+    assert rules.validate_moves(state, moves) == [rules.validate_move(state, move) for move in moves]
@@ -0,0 +1,99 @@
+import random
+
+import pytest
+
+from v_chess.game_state import GameState
+from v_chess.move_codes import decode_all
+from v_chess.movegen import between, checkers, generate_legal_moves, iter_legal_codes, pins
+from v_chess.perft import PERFT_SUITE, legal_moves
+from v_chess.rules import RULES_MAP, StandardRules, HordeRules
+from v_chess.square import Square
+
+GENERATOR_POSITIONS = [p for p in PERFT_SUITE if RULES_MAP[p.variant].uses_legal_movegen]
+
+
+def ucis(moves) -> set[str]:
+    return {move.uci for move in moves}
+
+
+@pytest.mark.parametrize("position", GENERATOR_POSITIONS, ids=lambda p: f"{p.variant}-{p.name}")
+def test_generator_matches_pipeline_on_random_games(position):
+    rng = random.Random(position.fen)
+    rules = RULES_MAP[position.variant]()
+    state = GameState.from_fen(position.fen)
+
+    for _ in range(15):
+        generated = rules.legal_moves(state)
+        assert len(generated) == len(ucis(generated))
+        assert ucis(generated) == ucis(legal_moves(rules, state))
+        if not generated:
+            break
+        state = rules.apply_move(state, rng.choice(sorted(generated, key=lambda m: m.uci)))
+
+
+def test_between():
+    assert between(Square("a1").index, Square("a4").index) == (
+        (1 << Square("a2").index) | (1 << Square("a3").index)
+    )
+    assert between(Square("c1").index, Square("f4").index) == (
+        (1 << Square("d2").index) | (1 << Square("e3").index)
+    )
+    assert between(Square("a1").index, Square("b3").index) == 0
+
+
+def test_pinned_piece_moves_along_pin_ray():
+    state = GameState.from_fen("4r1k1/8/8/8/8/8/4R3/4K3 w - - 0 1")
+    king_idx = Square("e1").index
+    assert set(pins(state, king_idx)) == {Square("e2").index}
+
+    moves = ucis(generate_legal_moves(StandardRules(), state))
+    rook_moves = {uci for uci in moves if uci.startswith("e2")}
+    assert rook_moves == {"e2e3", "e2e4", "e2e5", "e2e6", "e2e7", "e2e8"}
+
+
+def test_double_check_allows_only_king_moves():
+    state = GameState.from_fen("4k3/8/8/8/8/8/8/R3K2r w - - 0 1")
+    assert bin(checkers(state, Square("e1").index)).count("1") == 1
+
+    state = GameState.from_fen("4k3/8/8/8/1b6/8/8/4K2r w - - 0 1")
+    assert bin(checkers(state, Square("e1").index)).count("1") == 2
+    moves = generate_legal_moves(StandardRules(), state)
+    assert moves and all(move.start == Square("e1") for move in moves)
+
+
+def test_en_passant_cannot_expose_king_on_rank():
+    state = GameState.from_fen("8/8/8/K2pP2r/8/8/8/7k w - d6 0 1")
+    assert "e5d6" not in ucis(generate_legal_moves(StandardRules(), state))
+
+
+def test_horde_generates_first_rank_double_push():
+    state = GameState.from_fen("4k3/8/8/8/8/8/8/P7 w - - 0 1")
+    assert ucis(generate_legal_moves(HordeRules(), state)) == {"a1a2", "a1a3"}
+
+
+def test_generator_declines_positions_with_two_kings():
+    state = GameState.from_fen("4k3/8/8/8/8/8/8/K3K3 w - - 0 1")
+    assert generate_legal_moves(StandardRules(), state) is None
+    assert ucis(StandardRules().legal_moves(state)) == ucis(legal_moves(StandardRules(), state))
+
+
+def test_staged_iterator_yields_king_moves_then_captures():
+    state = GameState.from_fen("4k3/8/8/3p4/4P3/8/8/4K3 w - - 0 1")
+    moves = decode_all(list(iter_legal_codes(StandardRules(), state)))
+    assert all(move.start == Square("e1") for move in moves[:5])
+    assert moves[5].uci == "e4d5"
+    assert ucis(moves[6:]) == {"e4e5"}
+
+
+@pytest.mark.parametrize("position", PERFT_SUITE, ids=lambda p: f"{p.variant}-{p.name}")
+def test_iter_legal_moves_matches_legal_moves(position):
+    rules = RULES_MAP[position.variant]()
+    state = GameState.from_fen(position.fen)
+    assert ucis(rules.iter_legal_moves(state)) == ucis(rules.legal_moves(state))
+    assert ucis(rules.iter_possible_moves(state)) == ucis(rules.get_possible_moves(state))
+    assert rules.has_legal_moves(state)
+
+
+def test_has_legal_moves_in_mate_and_stalemate():
+    assert not StandardRules().has_legal_moves(GameState.from_fen("R5k1/5ppp/8/8/8/8/8/7K b - - 0 1"))
+    assert not StandardRules().has_legal_moves(GameState.from_fen("7k/5Q2/8/8/8/8/8/K7 b - - 0 1"))
@@ -0,0 +1,52 @@
+from dataclasses import replace
+
+from v_chess.enums import GameOverReason
+from v_chess.game import Game
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.position_cache import PositionCache
+from v_chess.rules import AntichessRules, StandardRules
+
+
+def test_legal_moves_are_shared_between_games():
+    cache = PositionCache()
+    state = GameState.starting_setup()
+    first = cache.legal_moves(StandardRules(), state)
+    second = cache.legal_moves(StandardRules(), GameState.starting_setup())
+    assert first == second and first is not second
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_entries_are_separated_by_variant():
+    cache = PositionCache()
+    state = GameState.starting_setup()
+    standard = cache.legal_moves(StandardRules(), state)
+    antichess = cache.legal_moves(AntichessRules(), state)
+    assert len(standard) == 20 and len(antichess) == 20
+    assert cache.misses == 2 and len(cache) == 2
+
+
+def test_game_over_reason_depends_on_counters():
+    cache = PositionCache()
+    rules = StandardRules()
+    state = GameState.starting_setup()
+    assert cache.game_over_reason(rules, state, rules.evaluate_game_over_conditions) == GameOverReason.ONGOING
+    repeated = replace(state, repetition_count=3)
+    assert cache.game_over_reason(rules, repeated, rules.evaluate_game_over_conditions) == GameOverReason.REPETITION
+    assert cache.misses == 2
+
+
+def test_lru_eviction_and_resize():
+    cache = PositionCache(maxsize=2)
+    rules = StandardRules()
+    game = Game()
+    for uci in ("e2e4", "e7e5"):
+        cache.is_check(rules, game.state)
+        game.take_turn(Move(uci, player_to_move=game.state.turn))
+    cache.is_check(rules, game.state)
+    assert len(cache) == 2
+
+    cache.resize(0)
+    assert len(cache) == 0
+    assert cache.is_check(rules, game.state) is False
+    assert cache.stats() == {"size": 0, "maxsize": 0, "hits": 0, "misses": 3}
@@ -0,0 +1,57 @@
+import copy
+import pickle
+
+import pytest
+
+from v_chess.move_validators import validate_king_safety, validate_moveset
+from v_chess.rules import (
+    RULES_MAP, AntichessRules, Chess960Rules, CrazyhouseRules, HordeRules, StandardRules
+)
+
+
+def test_rules_instances_are_shared():
+    assert StandardRules() is StandardRules()
+    assert StandardRules() is not AntichessRules()
+    for rules_cls in RULES_MAP.values():
+        assert rules_cls() is rules_cls()
+
+
+def test_copies_keep_the_shared_instance():
+    rules = CrazyhouseRules()
+    assert pickle.loads(pickle.dumps(rules)) is rules
+    assert copy.deepcopy(rules) is rules
+    assert copy.copy(rules) is rules
+
+
+def test_rule_set_matches_component_properties():
+    rules = StandardRules()
+    rule_set = rules.rule_set
+    assert rule_set.move_validators == tuple(rules.move_validators)
+    assert rule_set.state_validators == tuple(rules.state_validators)
+    assert rule_set.game_over_conditions == tuple(rules.game_over_conditions)
+    assert set(rule_set.piece_move_rules + rule_set.global_move_rules) == set(rules.available_moves)
+
+
+def test_rule_set_is_immutable():
+    with pytest.raises(AttributeError):
+        StandardRules().rule_set.has_castling = False
+
+
+@pytest.mark.parametrize("rules_cls, flags", [
+    (StandardRules, {"has_castling": True}),
+    (Chess960Rules, {"has_castling": True, "chess960_castling": True}),
+    (CrazyhouseRules, {"has_castling": True, "has_drops": True}),
+    (HordeRules, {"has_castling": True, "horde_pawns": True}),
+    (AntichessRules, {"king_promotion": True}),
+])
+def test_variant_flags(rules_cls, flags):
+    rule_set = rules_cls().rule_set
+    for name in ("has_castling", "chess960_castling", "has_drops", "horde_pawns", "king_promotion"):
+        assert getattr(rule_set, name) == flags.get(name, False), name
+
+
+def test_pseudo_legal_validators_skip_king_safety():
+    rule_set = StandardRules().rule_set
+    assert validate_king_safety in rule_set.move_validators
+    assert validate_king_safety not in rule_set.pseudo_legal_validators
+    assert validate_moveset in rule_set.pseudo_legal_validators
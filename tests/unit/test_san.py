@@ -0,0 +1,100 @@
+import pytest
+
+from v_chess.enums import Color
+from v_chess.game import Game
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.position_cache import position_cache
+from v_chess.rules import AtomicRules, Chess960Rules, StandardRules
+from v_chess.san import castling_side, parse_san, san_for_moves, san_index
+
+
+def sans(fen: str, *ucis: str, rules=None, annotate: bool = True) -> list[str]:
+    state = GameState.from_fen(fen)
+    moves = [Move(uci, player_to_move=state.turn) for uci in ucis]
+    return san_for_moves(state, moves, rules or StandardRules(), annotate=annotate)
+
+
+def test_disambiguates_by_file_rank_and_square():
+    assert sans("7k/8/8/8/8/2N1N3/8/K7 w - - 0 1", "c3d5") == ["Ncd5"]
+    assert sans("7k/8/8/8/R7/8/8/R6K w - - 0 1", "a1a2") == ["R1a2"]
+    assert sans("7k/8/8/8/Q1Q5/8/Q7/7K w - - 0 1", "a4b3") == ["Qa4b3"]
+
+
+def test_pinned_rival_does_not_disambiguate():
+    # The bishop on e5 pins the c3 knight to the king, so Ne3-d5 is unique.
+    assert sans("7k/8/8/4b3/8/2N1N3/8/K7 w - - 0 1", "e3d5") == ["Nd5"]
+
+
+def test_pawn_captures_and_promotions():
+    assert sans("7k/8/8/3p4/2P1P3/8/8/K7 w - - 0 1", "e4d5", "c4d5") == ["exd5", "cxd5"]
+    assert sans("3r3k/4P3/8/8/8/8/8/K7 w - - 0 1", "e7e8q", "e7d8n", annotate=False) == ["e8=Q", "exd8=N"]
+
+
+def test_check_and_mate_suffixes():
+    assert sans("rnbqkbnr/ppp2ppp/8/4p3/4P3/8/PPPP1PPP/RNBQKBNR w KQkq - 0 2", "f1b5") == ["Bb5+"]
+    assert sans("6k1/5ppp/8/8/8/8/8/R6K w - - 0 1", "a1a8") == ["Ra8#"]
+
+
+def test_castling_in_both_notations():
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1"
+    assert sans(fen, "e1g1", "e1c1", annotate=False) == ["O-O", "O-O-O"]
+
+    fen960 = "bqnb1rkr/pp3ppp/3ppn2/2p5/5P2/P2P4/NPP1P1PP/BQ1BNRKR w HFhf - 2 9"
+    state = GameState.from_fen(fen960)
+    assert castling_side(state, Move("g1h1", player_to_move=Color.WHITE)) == "O-O"
+    assert sans(fen960, "g1h1", rules=Chess960Rules(), annotate=False) == ["O-O"]
+
+
+def test_drops_use_uci_form():
+    fen = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR[N] w KQkq - 0 1"
+    assert sans(fen, "N@e4", annotate=False) == ["N@e4"]
+
+
+def test_take_turn_records_batch_san():
+    game = Game("3r3k/4P3/8/8/8/8/8/K7 w - - 0 1")
+    game.take_turn(Move("e7d8q"))
+    assert game.move_history[-1] == "exd8=Q+"
+
+
+def test_parse_san_resolves_through_the_index():
+    state = GameState.from_fen("7k/8/8/8/8/2N1N3/8/K7 w - - 0 1")
+    rules = StandardRules()
+    assert parse_san(state, "Ncd5", rules) == Move("c3d5", player_to_move=Color.WHITE)
+    assert parse_san(state, "Nc3xd5+", rules) == Move("c3d5", player_to_move=Color.WHITE)
+    assert parse_san(state, "Nd5", rules) is None
+    assert parse_san(state, "Nd6", rules) is None
+    assert san_index(state, rules) is san_index(state, rules)
+
+
+def test_san_index_is_cached_read_only_on_the_position_cache():
+    state = GameState.from_fen("7k/8/8/8/8/2N1N3/8/K7 w - - 0 1")
+    rules = StandardRules()
+    position_cache.clear()
+    index = san_index(state, rules)
+    assert position_cache.stats()["misses"] == 1
+
+    with pytest.raises(TypeError):
+        index["Nd5"] = ()
+    with pytest.raises(AttributeError):
+        index["Nd5"].append(Move("a1a2"))
+    assert san_index(state, rules) is index
+    assert position_cache.stats()["hits"] == 1
+    assert len(index["Nd5"]) == 2
+
+
+def test_parse_san_promotions_and_castling_aliases():
+    rules = StandardRules()
+    state = GameState.from_fen("3r3k/4P3/8/8/8/8/8/K7 w - - 0 1")
+    assert parse_san(state, "exd8Q", rules) == Move("e7d8q", player_to_move=Color.WHITE)
+    assert parse_san(state, "e8=n", rules) == Move("e7e8n", player_to_move=Color.WHITE)
+
+    state = GameState.from_fen("rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/R3K2R w KQkq - 0 1")
+    assert parse_san(state, "0-0", rules) == Move("e1g1", player_to_move=Color.WHITE)
+    assert parse_san(state, "O-O-O", rules) == Move("e1c1", player_to_move=Color.WHITE)
+
+
+def test_from_san_falls_back_for_pipeline_rules():
+    game = Game(rules=AtomicRules())
+    game.take_turn(Move.from_san("Nf3", game))
+    assert game.move_history == ["Nf3"]
@@ -0,0 +1,92 @@
+import random
+
+import pytest
+
+from v_chess.game import Game
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.perft import PERFT_SUITE, legal_moves
+from v_chess.piece import Knight
+from v_chess.rules import RULES_MAP, CrazyhouseRules, StandardRules
+
+
+def fresh_key(state: GameState) -> int:
+    """Recomputes the key of a state without the carried incremental key."""
+    return GameState.from_fen(state.fen).zobrist
+
+
+@pytest.mark.parametrize("position", PERFT_SUITE, ids=lambda p: f"{p.variant}-{p.name}")
+def test_incremental_key_matches_scratch_key(position):
+    rng = random.Random(position.fen)
+    rules = RULES_MAP[position.variant]()
+    state = GameState.from_fen(position.fen)
+
+    for _ in range(8):
+        moves = legal_moves(rules, state)
+        if not moves:
+            break
+        state = rules.apply_move(state, rng.choice(sorted(moves, key=lambda m: m.uci)))
+        assert state.zobrist_key is not None
+        assert state.zobrist == fresh_key(state)
+
+
+def test_transpositions_share_key():
+    rules = StandardRules()
+    start = GameState.starting_setup()
+
+    a = start
+    for uci in ("g1f3", "g8f6", "b1c3"):
+        a = rules.apply_move(a, Move(uci))
+    b = start
+    for uci in ("b1c3", "g8f6", "g1f3"):
+        b = rules.apply_move(b, Move(uci))
+
+    assert a.zobrist == b.zobrist
+    assert hash(a) == hash(b)
+    assert a == b
+
+
+def test_key_distinguishes_side_castling_and_ep():
+    base = GameState.from_fen("r3k2r/8/8/3pP3/8/8/8/R3K2R w KQkq d6 0 1")
+    keys = {
+        base.zobrist,
+        GameState.from_fen("r3k2r/8/8/3pP3/8/8/8/R3K2R b KQkq d6 0 1").zobrist,
+        GameState.from_fen("r3k2r/8/8/3pP3/8/8/8/R3K2R w Kkq d6 0 1").zobrist,
+        GameState.from_fen("r3k2r/8/8/3pP3/8/8/8/R3K2R w KQkq - 0 1").zobrist,
+    }
+    assert len(keys) == 4
+
+
+def test_key_covers_variant_counters():
+    three_check = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
+    assert GameState.from_fen(f"{three_check} +1+0").zobrist != GameState.from_fen(f"{three_check} +0+1").zobrist
+
+    board = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR"
+    assert (
+        GameState.from_fen(f"{board}[P] w KQkq - 0 1").zobrist
+        != GameState.from_fen(f"{board}[PP] w KQkq - 0 1").zobrist
+    )
+
+
+def test_equality_checks_clocks_after_key():
+    a = GameState.from_fen("8/8/8/4k3/8/8/8/4K3 w - - 0 1")
+    b = GameState.from_fen("8/8/8/4k3/8/8/8/4K3 w - - 5 9")
+
+    assert a.zobrist == b.zobrist
+    assert a != b
+    assert a == GameState.from_fen("8/8/8/4k3/8/8/8/4K3 w - - 0 1")
+    assert len({a, b, GameState.from_fen(a.fen)}) == 2
+
+
+def test_key_covers_counts_beyond_the_tables():
+    crazyhouse = "k7/8/8/8/8/8/8/7K[{}] w - - 0 1"
+    keys = {GameState.from_fen(crazyhouse.format("N" * count)).zobrist for count in (32, 33, 34)}
+    assert len(keys) == 3
+
+    three_check = "k7/8/8/8/8/8/8/7K w - - 0 1 +{}+0"
+    assert GameState.from_fen(three_check.format(17)).zobrist != GameState.from_fen(three_check.format(16)).zobrist
+
+    game = Game(crazyhouse.format("N" * 33), rules=CrazyhouseRules())
+    assert not game.is_over
+    game.take_turn(Move("N@b6"))
+    assert game.state.pockets[0].count(Knight) == 32
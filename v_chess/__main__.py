@@ -1,6 +1,9 @@
+import argparse
+
 from v_chess.game import Game, IllegalMoveException
 from v_chess.move import Move
 from v_chess.enums import MoveLegalityReason
+from v_chess.rules import RULES_MAP
 
 
 def main():
@@ -30,5 +33,85 @@ def main():
             continue
 
 
+def perft_main(args: argparse.Namespace) -> int:
+    """Runs perft on a single position or over the reference suite.
+
+    Returns:
+        The process exit code, non-zero when a suite count is wrong or a
+        known miscount has been fixed.
+    """
+    from v_chess.perft import divide, run_perft, run_suite
+
+    if args.suite:
+        failures = 0
+        variants = [args.variant] if args.variant else None
+        for position, depth, result in run_suite(args.depth, args.processes, variants):
+            expected = position.nodes[depth - 1]
+            known = depth in position.xfail
+            if result.nodes == expected:
+                status = "XPASS (remove xfail)" if known else "ok"
+            else:
+                status = f"{'xfail' if known else 'FAIL'} (expected {expected})"
+            failures += (result.nodes == expected) == known
+            print(
+                f"{position.variant:<14} {position.name:<14} depth {depth}: "
+                f"{result.nodes:>9} nodes {result.nps:>10.0f} nps  {status}"
+            )
+        return 1 if failures else 0
+
+    variant = args.variant or "standard"
+    fen = args.fen or RULES_MAP[variant]().starting_fen
+    depth = args.depth or 1
+
+    if args.divide:
+        counts = divide(variant, fen, depth, args.processes)
+        for uci, nodes in sorted(counts.items()):
+            print(f"{uci}: {nodes}")
+        print(f"\nMoves: {len(counts)}\nNodes: {sum(counts.values())}")
+        return 0
+
+    result = run_perft(variant, fen, depth, args.processes)
+    print(f"Nodes: {result.nodes}\nTime: {result.seconds:.3f}s\nNPS: {result.nps:.0f}")
+    return 0
+
+
+def bench_main(args: argparse.Namespace) -> int:
+    """Runs the micro benchmarks and prints one line per result.
+
+    Returns:
+        The process exit code.
+    """
+    from v_chess.bench import run_benchmarks
+
+    for result in run_benchmarks(args.only, args.iterations):
+        print(f"{result.name:<24} {result.value:>14.1f} {result.unit}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Builds the command line interface of the package."""
+    parser = argparse.ArgumentParser(prog="python -m v_chess")
+    subparsers = parser.add_subparsers(dest="command")
+
+    perft_parser = subparsers.add_parser("perft", help="count move tree leaf nodes")
+    perft_parser.add_argument("--variant", choices=sorted(RULES_MAP), help="variant rules to use")
+    perft_parser.add_argument("--fen", help="root position, defaults to the variant start")
+    perft_parser.add_argument("--depth", type=int, help="plies to search (suite: maximum depth)")
+    perft_parser.add_argument("--divide", action="store_true", help="print counts per root move")
+    perft_parser.add_argument("--suite", action="store_true", help="run the reference positions")
+    perft_parser.add_argument("--processes", type=int, help="split root moves over a process pool")
+
+    bench_parser = subparsers.add_parser("bench", help="run memory and throughput benchmarks")
+    bench_parser.add_argument("--only", nargs="+", help="benchmark names to run")
+    bench_parser.add_argument("--iterations", type=int, default=20000, help="operations per benchmark")
+
+    return parser
+
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    cli_args = build_parser().parse_args()
+    if cli_args.command == "perft":
+        raise SystemExit(perft_main(cli_args))
+    if cli_args.command == "bench":
+        raise SystemExit(bench_main(cli_args))
+    main()
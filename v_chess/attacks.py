@@ -0,0 +1,184 @@
+from typing import TYPE_CHECKING
+
+from v_chess.bitboard import AttackTables
+from v_chess.enums import Color
+from v_chess.move_codes import SQUARES
+from v_chess.movegen import checkers, pins
+from v_chess.piece.codes import (
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, BLACK_OFFSET, COLOR_INDEX, TYPE_INDEX,
+)
+
+if TYPE_CHECKING:
+    from v_chess.game_state import GameState
+    from v_chess.move import Move
+
+
+class AttackInfo:
+    """Attack maps and check information of a position, computed on first use.
+
+    Obtained through GameState.attacks, which keeps one instance per state
+    so is_check, castling and the legal move generator share the work.
+
+    Attributes:
+        state: The position.
+        placement: The piece masks the information was computed from, used
+            by GameState.attacks to notice a board changed in place.
+        king_index: The square of the king of the side to move, None if it
+            has no king or several of them.
+    """
+
+    def __init__(self, state: GameState):
+        """Records the piece placement of a position.
+
+        Args:
+            state: The position.
+        """
+        self.state = state
+        bb = state.board.bitboard
+        self.placement = list(bb.masks)
+        kings = bb.masks[COLOR_INDEX[state.turn] * BLACK_OFFSET + KING]
+        self.king_index = kings.bit_length() - 1 if kings and not kings & (kings - 1) else None
+        self._attacked: list[int | None] = [None, None]
+        self._in_check: list[bool | None] = [None, None]
+        self._checkers: int | None = None
+        self._pins: dict[int, int] | None = None
+        self._capture_available: bool | None = None
+
+    def attacked_by(self, color: Color) -> int:
+        """Returns the mask of the squares attacked by a color."""
+        idx = COLOR_INDEX[color]
+        attacked = self._attacked[idx]
+        if attacked is None:
+            attacked = self._attacked[idx] = self.state.board.bitboard.attacks_by(color)
+        return attacked
+
+    def is_attacked(self, square_idx: int, by_color: Color) -> bool:
+        """Returns whether a square is attacked by a color."""
+        return bool(self.attacked_by(by_color) >> square_idx & 1)
+
+    def in_check(self, color: Color) -> bool:
+        """Returns whether any king of a color is attacked."""
+        idx = COLOR_INDEX[color]
+        result = self._in_check[idx]
+        if result is None:
+            kings = self.placement[idx * BLACK_OFFSET + KING]
+            if self._attacked[1 - idx] is not None:
+                result = bool(kings & self._attacked[1 - idx])
+            else:
+                bb = self.state.board.bitboard
+                result = False
+                while kings and not result:
+                    result = bb.is_attacked((kings & -kings).bit_length() - 1, color.opposite)
+                    kings &= kings - 1
+            self._in_check[idx] = result
+        return result
+
+    @property
+    def checkers(self) -> int:
+        """Mask of the enemy pieces giving check, 0 without a single king."""
+        if self._checkers is None:
+            self._checkers = checkers(self.state, self.king_index) if self.king_index is not None else 0
+        return self._checkers
+
+    @property
+    def pins(self) -> dict[int, int]:
+        """Pinned squares of the side to move mapped to the ray they may move along."""
+        if self._pins is None:
+            self._pins = pins(self.state, self.king_index) if self.king_index is not None else {}
+        return self._pins
+
+    @property
+    def capture_available(self) -> bool:
+        """Whether a piece of the side to move attacks an enemy piece or the en passant square.
+
+        Ignores pins and checks, as variants with mandatory captures have no
+        king safety.
+        """
+        if self._capture_available is None:
+            state = self.state
+            bb = state.board.bitboard
+            us = COLOR_INDEX[state.turn]
+            available = bool(self.attacked_by(state.turn) & bb.colors[1 - us])
+            if not available and state.ep_square is not None and not state.ep_square.is_none_square:
+                pawns = bb.masks[us * BLACK_OFFSET + PAWN]
+                available = bool(AttackTables.pawn_attacks(state.ep_square.index, state.turn.opposite) & pawns)
+            self._capture_available = available
+        return self._capture_available
+
+    @property
+    def pinned(self) -> int:
+        """Mask of the pinned pieces of the side to move."""
+        mask = 0
+        for idx in self.pins:
+            mask |= 1 << idx
+        return mask
+
+    def to_dict(self) -> dict:
+        """Returns the attacked squares of both colors, checkers and pinned pieces as square names."""
+        return {
+            "attacked": {color.value: _square_names(self.attacked_by(color)) for color in Color},
+            "checkers": _square_names(self.checkers),
+            "pinned": _square_names(self.pinned),
+        }
+
+
+def move_gives_check(state: GameState, move: Move) -> bool:
+    """Whether a move attacks an enemy king, tested on attack tables without applying it.
+
+    Covers direct and discovered checks, promotions, en passant and drops.
+    Castling moves the rook as well and is not handled here.
+
+    Args:
+        state: The position the move is played from.
+        move: A move of the side to move.
+
+    Returns:
+        True if a king of the other side is attacked after the move.
+    """
+    bb = state.board.bitboard
+    masks = bb.masks
+    us = COLOR_INDEX[state.turn]
+    base = us * BLACK_OFFSET
+    kings = masks[(1 - us) * BLACK_OFFSET + KING]
+    if not kings:
+        return False
+
+    ours = masks[base:base + BLACK_OFFSET]
+    to_bit = 1 << move.end.index
+    occ = bb.occupied | to_bit
+    if move.is_drop:
+        type_idx = TYPE_INDEX[type(move.drop_piece)]
+    else:
+        start = move.start.index
+        moved = bb.piece_code_at(start) - base
+        if moved < 0 or moved >= BLACK_OFFSET:
+            return False
+        ours[moved] &= ~(1 << start)
+        occ &= ~(1 << start)
+        if moved == PAWN and move.end == state.ep_square and not bb.occupied & to_bit:
+            occ &= ~(1 << (move.start.row * 8 + move.end.col))
+        promotion = move.promotion_piece
+        type_idx = TYPE_INDEX[type(promotion)] if promotion is not None else moved
+    ours[type_idx] |= to_bit
+
+    straight = ours[ROOK] | ours[QUEEN]
+    diagonal = ours[BISHOP] | ours[QUEEN]
+    while kings:
+        king = (kings & -kings).bit_length() - 1
+        if (AttackTables._KNIGHT_ATTACKS[king] & ours[KNIGHT]
+                or AttackTables._PAWN_ATTACKS[1 - us][king] & ours[PAWN]
+                or AttackTables._KING_ATTACKS[king] & ours[KING]
+                or straight and AttackTables.rook_attacks(king, occ) & straight
+                or diagonal and AttackTables.bishop_attacks(king, occ) & diagonal):
+            return True
+        kings &= kings - 1
+    return False
+
+
+def _square_names(mask: int) -> list[str]:
+    """Returns the names of the squares of a mask, in index order."""
+    names = []
+    while mask:
+        names.append(str(SQUARES[(mask & -mask).bit_length() - 1]))
+        mask &= mask - 1
+    return names
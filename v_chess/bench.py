@@ -0,0 +1,295 @@
+import random
+import time
+import tracemalloc
+from dataclasses import dataclass
+from functools import cache
+from typing import Callable
+
+from v_chess.board import Board
+from v_chess.codec import decode_game, decode_state, encode_game, encode_state
+from v_chess.game import Game
+from v_chess.game_state import GameState
+from v_chess.perft import PERFT_SUITE
+from v_chess.piece import Pawn, Knight, Bishop, Rook, Queen, King
+from v_chess.enums import Color
+from v_chess.rules import RULES_MAP
+from v_chess.square import Square
+
+
+@dataclass(frozen=True)
+class BenchResult:
+    """Outcome of a single micro benchmark.
+
+    Attributes:
+        name: Dotted benchmark name, e.g. "bitboard.copy".
+        value: The measured quantity.
+        unit: Unit of value, e.g. "ops/s" or "bytes".
+    """
+    name: str
+    value: float
+    unit: str
+
+
+def _kiwipete() -> GameState:
+    position = next(p for p in PERFT_SUITE if p.name == "kiwipete")
+    return GameState.from_fen(position.fen)
+
+
+@cache
+def _fen_corpus() -> tuple[str, ...]:
+    """Every perft suite position and each position one legal move after it."""
+    fens = []
+    for position in PERFT_SUITE:
+        rules = RULES_MAP[position.variant]()
+        state = GameState.from_fen(position.fen)
+        fens.append(state.fen)
+        fens.extend(rules.apply_move(state, move).fen for move in rules.legal_moves(state))
+    return tuple(fens)
+
+
+def _rate(name: str, ops: int, func: Callable[[], None]) -> BenchResult:
+    """Times func and reports ops per second."""
+    start = time.perf_counter()
+    func()
+    seconds = time.perf_counter() - start
+    return BenchResult(name, ops / seconds if seconds > 0 else 0.0, "ops/s")
+
+
+def bench_bitboard_memory(iterations: int) -> BenchResult:
+    """Measures the bytes retained by one copied Bitboard."""
+    bitboard = _kiwipete().board.bitboard
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        copies = [bitboard.copy() for _ in range(iterations)]
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return BenchResult("bitboard.memory", retained / len(copies), "bytes")
+
+
+def bench_bitboard_copy(iterations: int) -> BenchResult:
+    """Measures Bitboard.copy throughput."""
+    bitboard = _kiwipete().board.bitboard
+
+    def run():
+        for _ in range(iterations):
+            bitboard.copy()
+
+    return _rate("bitboard.copy", iterations, run)
+
+
+def bench_bitboard_set_remove(iterations: int) -> BenchResult:
+    """Measures set_piece/remove_piece pairs on an otherwise full board."""
+    bitboard = _kiwipete().board.bitboard.copy()
+    pieces = [p_type(color) for color in Color for p_type in (Pawn, Knight, Bishop, Rook, Queen, King)]
+    empty = [idx for idx in range(64) if not bitboard.occupied & (1 << idx)]
+
+    def run():
+        for i in range(iterations):
+            idx = empty[i % len(empty)]
+            piece = pieces[i % len(pieces)]
+            bitboard.set_piece(idx, piece)
+            bitboard.remove_piece(idx, piece)
+
+    return _rate("bitboard.set_remove", iterations, run)
+
+
+def bench_bitboard_piece_at(iterations: int) -> BenchResult:
+    """Measures piece_at over every square of a middlegame position."""
+    bitboard = _kiwipete().board.bitboard
+    rounds = max(1, iterations // 64)
+
+    def run():
+        for _ in range(rounds):
+            for idx in range(64):
+                bitboard.piece_at(idx)
+
+    return _rate("bitboard.piece_at", rounds * 64, run)
+
+
+def bench_board_get_piece(iterations: int) -> BenchResult:
+    """Measures Board.get_piece over every square of a middlegame position."""
+    board = _kiwipete().board
+    squares = [Square(divmod(idx, 8)) for idx in range(64)]
+    rounds = max(1, iterations // 64)
+
+    def run():
+        for _ in range(rounds):
+            for square in squares:
+                board.get_piece(square)
+
+    return _rate("board.get_piece", rounds * 64, run)
+
+
+def bench_bitboard_is_attacked(iterations: int) -> BenchResult:
+    """Measures is_attacked over every square, for both colors."""
+    bitboard = _kiwipete().board.bitboard
+    rounds = max(1, iterations // 128)
+
+    def run():
+        for _ in range(rounds):
+            for idx in range(64):
+                bitboard.is_attacked(idx, Color.WHITE)
+                bitboard.is_attacked(idx, Color.BLACK)
+
+    return _rate("bitboard.is_attacked", rounds * 128, run)
+
+
+def bench_bitboard_push_pop(iterations: int) -> BenchResult:
+    """Measures push/pop of every legal move of a middlegame position."""
+    state = _kiwipete()
+    moves = RULES_MAP["standard"]().legal_moves(state)
+    bitboard = state.board.bitboard.copy()
+    rounds = max(1, iterations // len(moves))
+
+    def run():
+        for _ in range(rounds):
+            for move in moves:
+                bitboard.pop(bitboard.push(move, state.ep_square))
+
+    return _rate("bitboard.push_pop", rounds * len(moves), run)
+
+
+def bench_legal_moves(iterations: int) -> BenchResult:
+    """Measures full legal move generation of a middlegame position."""
+    state = _kiwipete()
+    rules = RULES_MAP["standard"]()
+    rounds = max(1, iterations // 100)
+
+    def run():
+        for _ in range(rounds):
+            rules.legal_moves(state)
+
+    return _rate("movegen.legal_moves", rounds, run)
+
+
+def bench_fen_parse(iterations: int) -> BenchResult:
+    """Measures building a Board from the placement field of a FEN corpus."""
+    placements = [fen.split()[0] for fen in _fen_corpus()]
+
+    def run():
+        for i in range(iterations):
+            Board(placements[i % len(placements)])
+
+    return _rate("fen.parse", iterations, run)
+
+
+def bench_fen_serialize(iterations: int) -> BenchResult:
+    """Measures writing the placement field of Boards from a FEN corpus."""
+    boards = [Board(fen.split()[0]) for fen in _fen_corpus()]
+
+    def run():
+        for i in range(iterations):
+            boards[i % len(boards)].fen
+
+    return _rate("fen.serialize", iterations, run)
+
+
+def _play_random_game(plies: int) -> Game:
+    """Plays seeded random legal moves from the starting position."""
+    game = Game(rules=RULES_MAP["standard"]())
+    rng = random.Random(0)
+    for _ in range(plies):
+        if game.is_over:
+            break
+        game.take_turn(rng.choice(sorted(game.legal_moves, key=lambda move: move.uci)))
+    return game
+
+
+def bench_game_memory(iterations: int) -> BenchResult:
+    """Measures the bytes retained by a Game with its history, per ply played."""
+    plies = min(iterations, 200)
+    # A first game warms the shared move and position caches.
+    _play_random_game(plies)
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        game = _play_random_game(plies)
+        retained = tracemalloc.get_traced_memory()[0] - before
+    finally:
+        tracemalloc.stop()
+    return BenchResult("game.memory", retained / max(1, len(game.history)), "bytes")
+
+
+def bench_codec_encode_state(iterations: int) -> BenchResult:
+    """Measures packing the positions of a FEN corpus into bytes."""
+    states = [GameState.from_fen(fen) for fen in _fen_corpus()]
+
+    def run():
+        for i in range(iterations):
+            encode_state(states[i % len(states)])
+
+    return _rate("codec.encode_state", iterations, run)
+
+
+def bench_codec_decode_state(iterations: int) -> BenchResult:
+    """Measures unpacking the positions of a FEN corpus from bytes."""
+    encoded = [encode_state(GameState.from_fen(fen)) for fen in _fen_corpus()]
+
+    def run():
+        for i in range(iterations):
+            decode_state(encoded[i % len(encoded)])
+
+    return _rate("codec.decode_state", iterations, run)
+
+
+def bench_codec_encode_game(iterations: int) -> BenchResult:
+    """Measures packing a random game, reported in plies per second."""
+    game = _play_random_game(min(iterations, 60))
+    rounds = max(1, iterations // 100)
+
+    def run():
+        for _ in range(rounds):
+            encode_game(game)
+
+    return _rate("codec.encode_game", rounds * len(game.history), run)
+
+
+def bench_codec_decode_game(iterations: int) -> BenchResult:
+    """Measures rebuilding a random game from bytes, reported in plies per second."""
+    game = _play_random_game(min(iterations, 60))
+    data = encode_game(game)
+    rounds = max(1, iterations // 5000)
+
+    def run():
+        for _ in range(rounds):
+            decode_game(data)
+
+    return _rate("codec.decode_game", rounds * len(game.history), run)
+
+
+BENCHMARKS: dict[str, Callable[[int], BenchResult]] = {
+    "bitboard.memory": bench_bitboard_memory,
+    "bitboard.copy": bench_bitboard_copy,
+    "bitboard.set_remove": bench_bitboard_set_remove,
+    "bitboard.piece_at": bench_bitboard_piece_at,
+    "board.get_piece": bench_board_get_piece,
+    "bitboard.is_attacked": bench_bitboard_is_attacked,
+    "bitboard.push_pop": bench_bitboard_push_pop,
+    "movegen.legal_moves": bench_legal_moves,
+    "fen.parse": bench_fen_parse,
+    "fen.serialize": bench_fen_serialize,
+    "game.memory": bench_game_memory,
+    "codec.encode_state": bench_codec_encode_state,
+    "codec.decode_state": bench_codec_decode_state,
+    "codec.encode_game": bench_codec_encode_game,
+    "codec.decode_game": bench_codec_decode_game,
+}
+
+
+def run_benchmarks(names: list[str] | None = None, iterations: int = 20000) -> list[BenchResult]:
+    """Runs the selected benchmarks.
+
+    Args:
+        names: Keys into BENCHMARKS, or None to run all of them.
+        iterations: Rough number of operations per benchmark.
+
+    Returns:
+        One result per benchmark, in registry order.
+    """
+    selected = names if names else list(BENCHMARKS)
+    unknown = [name for name in selected if name not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmarks: {', '.join(unknown)}")
+    return [BENCHMARKS[name](iterations) for name in BENCHMARKS if name in selected]
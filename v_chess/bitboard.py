@@ -1,7 +1,12 @@
+from dataclasses import dataclass
 from typing import TYPE_CHECKING
 
-from v_chess.enums import Color, Direction
-from v_chess.piece import Pawn, Knight, Bishop, Rook, Queen, King, Piece
+from v_chess.enums import Color
+from v_chess.piece import Pawn, Piece
+from v_chess.piece.codes import (
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, WHITE, BLACK, BLACK_OFFSET, NUM_CODES,
+    PIECE_TYPES, TYPE_INDEX, COLOR_INDEX, CODE_TYPES, CODE_COLORS, code_of,
+)
 from v_chess.move import Move
 from v_chess.square import Square
 
@@ -10,12 +15,81 @@ if TYPE_CHECKING:
 
 
 class AttackTables:
-    """Singleton provider for precomputed attack masks."""
+    """Singleton provider for precomputed attack masks.
+
+    Sliding attacks are resolved per line (rank, file, diagonal and
+    anti-diagonal). For every square and line the blockers that can stop the
+    slide are masked out of the occupancy and used as a key into a table of
+    precomputed attack sets, so a rook or bishop query is two lookups.
+    """
 
     _KNIGHT_ATTACKS = [0] * 64
     _KING_ATTACKS = [0] * 64
+    # The square itself and its king ring, the squares an Atomic capture clears.
+    _EXPLOSION_MASKS = [0] * 64
+    # Indexed by color index (White 0, Black 1), then by square.
+    _PAWN_ATTACKS = [[0] * 64, [0] * 64]
+
+    _RANK_MASKS = [0] * 64
+    _FILE_MASKS = [0] * 64
+    _DIAG_MASKS = [0] * 64
+    _ANTI_DIAG_MASKS = [0] * 64
+    _RANK_ATTACKS: list[dict[int, int]] = [{} for _ in range(64)]
+    _FILE_ATTACKS: list[dict[int, int]] = [{} for _ in range(64)]
+    _DIAG_ATTACKS: list[dict[int, int]] = [{} for _ in range(64)]
+    _ANTI_DIAG_ATTACKS: list[dict[int, int]] = [{} for _ in range(64)]
+
     _INITIALIZED = False
 
+    @staticmethod
+    def _step_mask(r: int, c: int, steps: list[tuple[int, int]]) -> int:
+        mask = 0
+        for dr, dc in steps:
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < 8 and 0 <= nc < 8:
+                mask |= (1 << (nr * 8 + nc))
+        return mask
+
+    @staticmethod
+    def _slide(r: int, c: int, deltas: tuple[tuple[int, int], tuple[int, int]], occupied: int) -> int:
+        """Walks both directions of a line, stopping on (and including) blockers."""
+        mask = 0
+        for dr, dc in deltas:
+            nr, nc = r + dr, c + dc
+            while 0 <= nr < 8 and 0 <= nc < 8:
+                bit = 1 << (nr * 8 + nc)
+                mask |= bit
+                if occupied & bit:
+                    break
+                nr += dr
+                nc += dc
+        return mask
+
+    @classmethod
+    def _build_line(cls, sq: int, deltas: tuple[tuple[int, int], tuple[int, int]],
+                    masks: list[int], attacks: list[dict[int, int]]):
+        """Fills the blocker mask and attack table of one line through sq."""
+        r, c = divmod(sq, 8)
+        full = cls._slide(r, c, deltas, 0)
+
+        # The last square of each ray can never block anything behind it.
+        relevant = 0
+        for dr, dc in deltas:
+            nr, nc = r + dr, c + dc
+            while 0 <= nr + dr < 8 and 0 <= nc + dc < 8:
+                relevant |= 1 << (nr * 8 + nc)
+                nr += dr
+                nc += dc
+        masks[sq] = relevant & full
+
+        table = attacks[sq]
+        subset = 0
+        while True:
+            table[subset] = cls._slide(r, c, deltas, subset)
+            subset = (subset - masks[sq]) & masks[sq]
+            if subset == 0:
+                break
+
     @classmethod
     def _initialize(cls):
         if cls._INITIALIZED:
@@ -24,231 +98,402 @@ class AttackTables:
         for sq in range(64):
             r, c = divmod(sq, 8)
 
-            k_moves = [
-                (r - 2, c - 1), (r - 2, c + 1), (r - 1, c - 2), (r - 1, c + 2),
-                (r + 1, c - 2), (r + 1, c + 2), (r + 2, c - 1), (r + 2, c + 1)
-            ]
-            mask = 0
-            for nr, nc in k_moves:
-                if 0 <= nr < 8 and 0 <= nc < 8:
-                    mask |= (1 << (nr * 8 + nc))
-            cls._KNIGHT_ATTACKS[sq] = mask
-
-            ki_moves = [
-                (r - 1, c - 1), (r - 1, c), (r - 1, c + 1),
-                (r, c - 1),             (r, c + 1),
-                (r + 1, c - 1), (r + 1, c), (r + 1, c + 1)
-            ]
-            mask = 0
-            for nr, nc in ki_moves:
-                if 0 <= nr < 8 and 0 <= nc < 8:
-                    mask |= (1 << (nr * 8 + nc))
-            cls._KING_ATTACKS[sq] = mask
+            cls._KNIGHT_ATTACKS[sq] = cls._step_mask(r, c, [
+                (-2, -1), (-2, 1), (-1, -2), (-1, 2),
+                (1, -2), (1, 2), (2, -1), (2, 1)
+            ])
+            cls._KING_ATTACKS[sq] = cls._step_mask(r, c, [
+                (-1, -1), (-1, 0), (-1, 1),
+                (0, -1),           (0, 1),
+                (1, -1),  (1, 0),  (1, 1)
+            ])
+            cls._EXPLOSION_MASKS[sq] = cls._KING_ATTACKS[sq] | (1 << sq)
+            # Row 0 is the 8th rank, so white pawns attack towards lower rows.
+            cls._PAWN_ATTACKS[WHITE][sq] = cls._step_mask(r, c, [(-1, -1), (-1, 1)])
+            cls._PAWN_ATTACKS[BLACK][sq] = cls._step_mask(r, c, [(1, -1), (1, 1)])
+
+            cls._build_line(sq, ((0, -1), (0, 1)), cls._RANK_MASKS, cls._RANK_ATTACKS)
+            cls._build_line(sq, ((-1, 0), (1, 0)), cls._FILE_MASKS, cls._FILE_ATTACKS)
+            cls._build_line(sq, ((-1, -1), (1, 1)), cls._DIAG_MASKS, cls._DIAG_ATTACKS)
+            cls._build_line(sq, ((-1, 1), (1, -1)), cls._ANTI_DIAG_MASKS, cls._ANTI_DIAG_ATTACKS)
 
         cls._INITIALIZED = True
 
     @classmethod
     def knight_attacks(cls, sq_idx: int) -> int:
-        if not cls._INITIALIZED:
-            cls._initialize()
         return cls._KNIGHT_ATTACKS[sq_idx]
 
     @classmethod
     def king_attacks(cls, sq_idx: int) -> int:
-        if not cls._INITIALIZED:
-            cls._initialize()
         return cls._KING_ATTACKS[sq_idx]
 
+    @classmethod
+    def explosion_mask(cls, sq_idx: int) -> int:
+        """Returns sq_idx and its king ring, the squares an Atomic capture on sq_idx clears."""
+        return cls._EXPLOSION_MASKS[sq_idx]
+
+    @classmethod
+    def pawn_attacks(cls, sq_idx: int, color: Color) -> int:
+        """Returns the squares a pawn of the given color attacks from sq_idx."""
+        return cls._PAWN_ATTACKS[COLOR_INDEX[color]][sq_idx]
+
+    @classmethod
+    def rook_attacks(cls, sq_idx: int, occupied: int) -> int:
+        """Returns the squares a rook on sq_idx attacks given the occupancy.
+
+        The first blocker in each direction is included in the result.
+        """
+        return (cls._RANK_ATTACKS[sq_idx][occupied & cls._RANK_MASKS[sq_idx]]
+                | cls._FILE_ATTACKS[sq_idx][occupied & cls._FILE_MASKS[sq_idx]])
+
+    @classmethod
+    def bishop_attacks(cls, sq_idx: int, occupied: int) -> int:
+        """Returns the squares a bishop on sq_idx attacks given the occupancy.
+
+        The first blocker in each direction is included in the result.
+        """
+        return (cls._DIAG_ATTACKS[sq_idx][occupied & cls._DIAG_MASKS[sq_idx]]
+                | cls._ANTI_DIAG_ATTACKS[sq_idx][occupied & cls._ANTI_DIAG_MASKS[sq_idx]])
+
+    @classmethod
+    def queen_attacks(cls, sq_idx: int, occupied: int) -> int:
+        """Returns the union of rook and bishop attacks from sq_idx."""
+        return cls.rook_attacks(sq_idx, occupied) | cls.bishop_attacks(sq_idx, occupied)
+
+
+AttackTables._initialize()
+
+
+@dataclass(frozen=True)
+class UndoInfo:
+    """Reversible record of the masks changed by Bitboard.push.
+
+    Attributes:
+        toggles: (piece code, bit) pairs xor-ed into the board, in order.
+        captured: The piece removed from the destination or en passant square.
+    """
+    toggles: tuple[tuple[int, int], ...]
+    captured: Piece | None = None
+
 
 class Bitboard:
     """Manages the bitwise state of the chess board.
 
+    Piece masks live in a flat list indexed by integer piece code (see
+    v_chess.piece.codes). Both occupancies and a mailbox of the piece code
+    on every square are kept up to date incrementally by every mutation.
+
     Attributes:
-        pieces: Nested dictionary mapping Color -> PieceType -> Bitmask.
-        occupied_co: Dictionary mapping Color -> Bitmask of all their pieces.
+        masks: Bitmask per piece code, White pawns to Black kings.
+        colors: Bitmask of all pieces per color index (White 0, Black 1).
         occupied: Bitmask of all pieces on the board.
+        mailbox: The piece code on each square index, -1 for empty squares.
     """
 
+    __slots__ = ("masks", "colors", "occupied", "mailbox")
+
     def __init__(self):
         """Initializes an empty Bitboard."""
-        self.pieces = {
-            Color.WHITE: {Pawn: 0, Knight: 0, Bishop: 0, Rook: 0, Queen: 0, King: 0},
-            Color.BLACK: {Pawn: 0, Knight: 0, Bishop: 0, Rook: 0, Queen: 0, King: 0}
-        }
-        self.occupied_co = {Color.WHITE: 0, Color.BLACK: 0}
+        self.masks = [0] * NUM_CODES
+        self.colors = [0, 0]
         self.occupied = 0
+        self.mailbox = [-1] * 64
+
+    @classmethod
+    def from_mailbox(cls, mailbox: list[int]) -> Bitboard:
+        """Builds a Bitboard from the piece code on each square in one pass.
+
+        Args:
+            mailbox: 64 piece codes, -1 for empty squares. The list is
+                owned by the new Bitboard afterwards.
+
+        Returns:
+            The Bitboard.
+        """
+        masks = [0] * NUM_CODES
+        colors = [0, 0]
+        for idx, code in enumerate(mailbox):
+            if code >= 0:
+                bit = 1 << idx
+                masks[code] |= bit
+                colors[code >= BLACK_OFFSET] |= bit
+        bb = cls.__new__(cls)
+        bb.masks = masks
+        bb.colors = colors
+        bb.occupied = colors[WHITE] | colors[BLACK]
+        bb.mailbox = mailbox
+        return bb
+
+    @property
+    def pieces(self) -> dict[Color, dict[type[Piece], int]]:
+        """Nested Color -> piece type -> mask view of the masks.
+
+        The dictionaries are built on access, writing to them does not
+        change the board.
+        """
+        masks = self.masks
+        return {
+            color: {p_type: masks[base + idx] for idx, p_type in enumerate(PIECE_TYPES)}
+            for color, base in ((Color.WHITE, 0), (Color.BLACK, BLACK_OFFSET))
+        }
+
+    @property
+    def occupied_co(self) -> dict[Color, int]:
+        """Color -> occupancy view of the color masks."""
+        return {Color.WHITE: self.colors[WHITE], Color.BLACK: self.colors[BLACK]}
 
     def copy(self) -> Bitboard:
         """Creates a deep copy of the Bitboard."""
-        new_bb = Bitboard()
-        for color in Color:
-            for p_type, mask in self.pieces[color].items():
-                new_bb.pieces[color][p_type] = mask
-        new_bb.occupied_co = self.occupied_co.copy()
+        new_bb = Bitboard.__new__(Bitboard)
+        new_bb.masks = self.masks.copy()
+        new_bb.colors = self.colors.copy()
         new_bb.occupied = self.occupied
+        new_bb.mailbox = self.mailbox.copy()
         return new_bb
 
     def update_occupancy(self):
-        """Recalculates occupancy bitmasks based on piece positions."""
-        self.occupied_co[Color.WHITE] = (
-            self.pieces[Color.WHITE][Pawn] | self.pieces[Color.WHITE][Knight] |
-            self.pieces[Color.WHITE][Bishop] | self.pieces[Color.WHITE][Rook] |
-            self.pieces[Color.WHITE][Queen] | self.pieces[Color.WHITE][King]
-        )
-        self.occupied_co[Color.BLACK] = (
-            self.pieces[Color.BLACK][Pawn] | self.pieces[Color.BLACK][Knight] |
-            self.pieces[Color.BLACK][Bishop] | self.pieces[Color.BLACK][Rook] |
-            self.pieces[Color.BLACK][Queen] | self.pieces[Color.BLACK][King]
-        )
-        self.occupied = self.occupied_co[Color.WHITE] | self.occupied_co[Color.BLACK]
+        """Recalculates occupancy bitmasks and the mailbox based on piece positions.
+
+        Mutations keep them current, this is only needed after writing to
+        masks directly.
+        """
+        masks = self.masks
+        white = masks[0] | masks[1] | masks[2] | masks[3] | masks[4] | masks[5]
+        black = masks[6] | masks[7] | masks[8] | masks[9] | masks[10] | masks[11]
+        self.colors[WHITE] = white
+        self.colors[BLACK] = black
+        self.occupied = white | black
+        mailbox = [-1] * 64
+        for code, mask in enumerate(masks):
+            while mask:
+                mailbox[(mask & -mask).bit_length() - 1] = code
+                mask &= mask - 1
+        self.mailbox = mailbox
 
     def set_piece(self, square_idx: int, piece: Piece):
-        """Sets a piece at the given square index."""
-        self.pieces[piece.color][type(piece)] |= (1 << square_idx)
-        self.update_occupancy()
+        """Sets a piece at the given square index, replacing any piece already there."""
+        code = code_of(piece)
+        bit = 1 << square_idx
+        occupant = self.mailbox[square_idx]
+        if occupant >= 0:
+            self.masks[occupant] ^= bit
+            self.colors[occupant >= BLACK_OFFSET] ^= bit
+        self.masks[code] |= bit
+        self.colors[code >= BLACK_OFFSET] |= bit
+        self.occupied |= bit
+        self.mailbox[square_idx] = code
 
     def remove_piece(self, square_idx: int, piece: Piece):
         """Removes a piece from the given square index."""
-        self.pieces[piece.color][type(piece)] &= ~(1 << square_idx)
-        self.update_occupancy()
+        code = code_of(piece)
+        bit = 1 << square_idx
+        if not self.masks[code] & bit:
+            return
+        self.masks[code] ^= bit
+        self.colors[code >= BLACK_OFFSET] ^= bit
+        self.occupied ^= bit
+        self.mailbox[square_idx] = -1
+
+    def _toggle(self, toggles: list, code: int, bit: int):
+        """Flips a single bit of one piece mask, the occupancies and the mailbox."""
+        self.masks[code] ^= bit
+        self.colors[code >= BLACK_OFFSET] ^= bit
+        self.occupied ^= bit
+        self.mailbox[bit.bit_length() - 1] = code if self.masks[code] & bit else -1
+        toggles.append((code, bit))
+
+    def _explode(self, toggles: list, square_idx: int):
+        """Removes the piece on square_idx and every adjacent non-pawn."""
+        masks = self.masks
+        pawns = masks[PAWN] | masks[BLACK_OFFSET + PAWN]
+        blast = AttackTables._EXPLOSION_MASKS[square_idx] & self.occupied & (~pawns | (1 << square_idx))
+        if not blast:
+            return
+        for code in range(NUM_CODES):
+            hit = masks[code] & blast
+            while hit:
+                bit = hit & -hit
+                self._toggle(toggles, code, bit)
+                hit ^= bit
+
+    def push(self, move: Move, ep_square: Square | None = None,
+             castling_rook: Square | None = None, explode: bool = False) -> UndoInfo:
+        """Applies a move in place, touching only the affected masks.
+
+        The move is not validated. Castling is only performed when the rook
+        square is given, otherwise a king move is applied literally.
+
+        Args:
+            move: The move to apply.
+            ep_square: The en passant target square of the position.
+            castling_rook: Start square of the rook when the move castles.
+            explode: Whether captures explode (Atomic chess).
+
+        Returns:
+            The record needed to revert the move with pop().
+        """
+        toggles = []
+        end_idx = move.end.index
+        end_bit = 1 << end_idx
+
+        if move.is_drop:
+            self._toggle(toggles, code_of(move.drop_piece), end_bit)
+            return UndoInfo(tuple(toggles))
+
+        start_idx = move.start.index
+        code = self.piece_code_at(start_idx)
+        if code < 0:
+            return UndoInfo(())
+        base = code - code % BLACK_OFFSET
+
+        if castling_rook is not None:
+            rank_offset = start_idx - start_idx % 8
+            if castling_rook.col < move.start.col:
+                king_dest, rook_dest = rank_offset + 2, rank_offset + 3
+            else:
+                king_dest, rook_dest = rank_offset + 6, rank_offset + 5
+            self._toggle(toggles, base + KING, 1 << start_idx)
+            self._toggle(toggles, base + ROOK, 1 << castling_rook.index)
+            for dest, dest_code in ((king_dest, base + KING), (rook_dest, base + ROOK)):
+                # Unvalidated castling may land on an occupied square, which
+                # is overwritten like Board.set_piece would.
+                occupant = self.piece_code_at(dest)
+                if occupant >= 0:
+                    self._toggle(toggles, occupant, 1 << dest)
+                self._toggle(toggles, dest_code, 1 << dest)
+            return UndoInfo(tuple(toggles))
+
+        captured = None
+        target = self.piece_code_at(end_idx)
+        if target >= 0:
+            captured = CODE_TYPES[target](CODE_COLORS[target])
+            self._toggle(toggles, target, end_bit)
+        elif code == base + PAWN and ep_square is not None and move.end == ep_square:
+            white = base == 0
+            captured_bit = 1 << (end_idx + 8 if white else end_idx - 8)
+            victim = BLACK_OFFSET + PAWN if white else PAWN
+            if self.masks[victim] & captured_bit:
+                captured = Pawn(CODE_COLORS[victim])
+                self._toggle(toggles, victim, captured_bit)
+
+        self._toggle(toggles, code, 1 << start_idx)
+        if move.promotion_piece is not None:
+            placed = base + TYPE_INDEX[type(move.promotion_piece)]
+        else:
+            placed = code
+        self._toggle(toggles, placed, end_bit)
+
+        if explode and captured is not None:
+            self._explode(toggles, end_idx)
+
+        return UndoInfo(tuple(toggles), captured)
+
+    def pop(self, undo: UndoInfo):
+        """Reverts a move applied with push().
+
+        Moves must be popped in the reverse order they were pushed.
+        """
+        masks, colors, mailbox = self.masks, self.colors, self.mailbox
+        for code, bit in reversed(undo.toggles):
+            masks[code] ^= bit
+            colors[code >= BLACK_OFFSET] ^= bit
+            self.occupied ^= bit
+            mailbox[bit.bit_length() - 1] = code if masks[code] & bit else -1
+
+    def explode(self, square_idx: int) -> UndoInfo:
+        """Applies an Atomic explosion centered on square_idx in place.
+
+        Returns:
+            The record needed to revert the explosion with pop().
+        """
+        toggles = []
+        self._explode(toggles, square_idx)
+        return UndoInfo(tuple(toggles))
 
     def get_piece_mask(self, piece_type: type, color: Color) -> int:
         """Returns the bitmask for a specific piece type and color."""
-        return self.pieces[color].get(piece_type, 0)
+        type_idx = TYPE_INDEX.get(piece_type)
+        if type_idx is None:
+            return 0
+        return self.masks[COLOR_INDEX[color] * BLACK_OFFSET + type_idx]
 
-    def piece_at(self, square_index: int) -> tuple[type[Piece] | None, Color | None]:
-        """Returns the piece type and color at the given square index."""
+    def piece_code_at(self, square_index: int) -> int:
+        """Returns the piece code at the given square index, or -1 if empty."""
         if square_index < 0:
-            return None, None
+            return -1
+        return self.mailbox[square_index]
 
-        mask = 1 << square_index
-        if not (self.occupied & mask):
+    def piece_at(self, square_index: int) -> tuple[type[Piece] | None, Color | None]:
+        """Returns the piece type and color at the given square index."""
+        code = self.piece_code_at(square_index)
+        if code < 0:
             return None, None
-
-        if self.occupied_co[Color.WHITE] & mask:
-            for p_type, p_mask in self.pieces[Color.WHITE].items():
-                if p_mask & mask:
-                    return p_type, Color.WHITE
-        else:
-            for p_type, p_mask in self.pieces[Color.BLACK].items():
-                if p_mask & mask:
-                    return p_type, Color.BLACK
-
-        return None, None
+        return CODE_TYPES[code], CODE_COLORS[code]
 
     def is_attacked(self, square_idx: int, by_color: Color, occupancy_override: int | None = None) -> bool:
         """Checks if a square is attacked by pieces of a specific color."""
         occ = occupancy_override if occupancy_override is not None else self.occupied
+        color_idx = COLOR_INDEX[by_color]
+        base = color_idx * BLACK_OFFSET
+        masks = self.masks
 
-        if (AttackTables.knight_attacks(square_idx) & self.pieces[by_color][Knight]):
+        if AttackTables._KNIGHT_ATTACKS[square_idx] & masks[base + KNIGHT]:
             return True
 
-        if (AttackTables.king_attacks(square_idx) & self.pieces[by_color][King]):
+        if AttackTables._KING_ATTACKS[square_idx] & masks[base + KING]:
             return True
 
-        ortho_attackers = self.pieces[by_color][Rook] | self.pieces[by_color][Queen]
-        if ortho_attackers and self._check_slider(square_idx, ortho_attackers, Direction.straight(), occ):
+        # A square is attacked by a pawn if a pawn of the other color standing
+        # on it would attack that pawn.
+        if AttackTables._PAWN_ATTACKS[1 - color_idx][square_idx] & masks[base + PAWN]:
             return True
 
-        diag_attackers = self.pieces[by_color][Bishop] | self.pieces[by_color][Queen]
-        if diag_attackers and self._check_slider(square_idx, diag_attackers, Direction.diagonal(), occ):
+        queens = masks[base + QUEEN]
+        ortho_attackers = masks[base + ROOK] | queens
+        if ortho_attackers and AttackTables.rook_attacks(square_idx, occ) & ortho_attackers:
             return True
 
-        r, c = divmod(square_idx, 8)
-        if by_color == Color.WHITE:
-            start_row = r + 1
-            if start_row < 8:
-                if c > 0 and (self.pieces[Color.WHITE][Pawn] & (1 << (start_row * 8 + c - 1))):
-                    return True
-                if c < 7 and (self.pieces[Color.WHITE][Pawn] & (1 << (start_row * 8 + c + 1))):
-                    return True
-        else:
-            start_row = r - 1
-            if start_row >= 0:
-                if c > 0 and (self.pieces[Color.BLACK][Pawn] & (1 << (start_row * 8 + c - 1))):
-                    return True
-                if c < 7 and (self.pieces[Color.BLACK][Pawn] & (1 << (start_row * 8 + c + 1))):
-                    return True
+        diag_attackers = masks[base + BISHOP] | queens
+        if diag_attackers and AttackTables.bishop_attacks(square_idx, occ) & diag_attackers:
+            return True
 
         return False
 
+    def attacks_by(self, by_color: Color) -> int:
+        """Returns the mask of all squares attacked by pieces of a specific color."""
+        base = COLOR_INDEX[by_color] * BLACK_OFFSET
+        masks = self.masks
+        occ = self.occupied
+        pawn_table = AttackTables._PAWN_ATTACKS[COLOR_INDEX[by_color]]
+        attacked = 0
+        for table, code in ((pawn_table, PAWN), (AttackTables._KNIGHT_ATTACKS, KNIGHT),
+                            (AttackTables._KING_ATTACKS, KING)):
+            mask = masks[base + code]
+            while mask:
+                attacked |= table[(mask & -mask).bit_length() - 1]
+                mask &= mask - 1
+
+        queens = masks[base + QUEEN]
+        mask = masks[base + ROOK] | queens
+        while mask:
+            attacked |= AttackTables.rook_attacks((mask & -mask).bit_length() - 1, occ)
+            mask &= mask - 1
+        mask = masks[base + BISHOP] | queens
+        while mask:
+            attacked |= AttackTables.bishop_attacks((mask & -mask).bit_length() - 1, occ)
+            mask &= mask - 1
+        return attacked
+
     def is_king_attacked_after_move(self, move: Move, color: Color, board: "Board", ep_square: Square | None = None) -> bool:
         """Checks if the king is under attack after a hypothetical move."""
-        start_idx = move.start.index
-        end_idx = move.end.index
-
-        if move.is_drop:
-            moving_piece = move.drop_piece
-        else:
-            moving_piece = board.get_piece(move.start)
-
-        if not moving_piece:
+        if not move.is_drop and not (self.occupied & (1 << move.start.index)):
             return False
 
-        target_piece = board.get_piece(move.end)
-        is_ep = not move.is_drop and isinstance(moving_piece, Pawn) and move.end == ep_square
-
-        orig_pieces_white = {k: v for k, v in self.pieces[Color.WHITE].items()}
-        orig_pieces_black = {k: v for k, v in self.pieces[Color.BLACK].items()}
-
-        if not move.is_drop:
-            self.pieces[moving_piece.color][type(moving_piece)] &= ~(1 << start_idx)
-
-        self.pieces[moving_piece.color][type(moving_piece)] |= (1 << end_idx)
-
-        if target_piece:
-            self.pieces[target_piece.color][type(target_piece)] &= ~(1 << end_idx)
-
-        if is_ep:
-            direction = Direction.DOWN if moving_piece.color == Color.WHITE else Direction.UP
-            captured_sq = move.end.adjacent(direction)
-            if not captured_sq.is_none_square:
-                self.pieces[moving_piece.color.opposite][Pawn] &= ~(1 << captured_sq.index)
-
-        self.update_occupancy()
-
-        king_mask = self.pieces[color][King]
-        if not king_mask:
-             king_idx = -1
-        else:
-             king_idx = (king_mask & -king_mask).bit_length() - 1
-
-        is_attacked = False
-        if king_idx != -1:
-            is_attacked = self.is_attacked(king_idx, color.opposite)
-
-        self.pieces[Color.WHITE] = orig_pieces_white
-        self.pieces[Color.BLACK] = orig_pieces_black
-        self.update_occupancy()
-
-        return is_attacked
-
-    def _check_slider(self, square_idx: int, attackers: int, directions: set[Direction], occupied: int) -> bool:
-        """Helper to check sliding piece attacks."""
-        for d in directions:
-            ray = d.get_ray_mask(square_idx)
-            if not (ray & attackers):
-                continue
-
-            blockers = ray & occupied
-            if not blockers:
-                # Ray has an attacker and no blockers, so the square IS attacked.
-                return True
-
-            # Need to find the blocker closest to square_idx
-            d_col, d_row = d.value
-            idx_delta = d_row * 8 + d_col
-            
-            if idx_delta > 0:
-                # Squares in this direction have higher indices
-                first_blocker_mask = blockers & -blockers
-            else:
-                # Squares in this direction have lower indices
-                first_blocker_mask = 1 << (blockers.bit_length() - 1)
-
-            if first_blocker_mask & attackers:
-                return True
-
-        return False
-
-
+        undo = self.push(move, ep_square)
+        try:
+            king_mask = self.masks[COLOR_INDEX[color] * BLACK_OFFSET + KING]
+            if not king_mask:
+                return False
+            return self.is_attacked((king_mask & -king_mask).bit_length() - 1, color.opposite)
+        finally:
+            self.pop(undo)
@@ -1,10 +1,13 @@
 from typing import TypeVar, Generator
 
-from v_chess.fen_helpers import board_from_fen, get_fen_from_board
+from v_chess.fen_helpers import mailbox_from_fen, get_fen_from_board
 from v_chess.enums import Color
 from v_chess.piece.piece import Piece
+from v_chess.piece.codes import PIECE_TYPES, PIECES
 from v_chess.square import Coordinate, Square
-from v_chess.bitboard import Bitboard
+from v_chess.bitboard import Bitboard, UndoInfo
+from v_chess.move import Move
+from v_chess.move_codes import SQUARES
 
 T = TypeVar("T", bound=Piece)
 
@@ -27,10 +30,7 @@ class Board:
         if isinstance(setup, Bitboard):
             self.bitboard = setup.copy()
         elif isinstance(setup, str):
-            self.bitboard = Bitboard()
-            initial_pieces = board_from_fen(setup)
-            for sq, piece in initial_pieces.items():
-                self.bitboard.set_piece(sq.index, piece)
+            self.bitboard = Bitboard.from_mailbox(mailbox_from_fen(setup))
         else:
             raise TypeError(f"setup must be Bitboard or str, not {type(setup)}")
 
@@ -46,10 +46,15 @@ class Board:
         if not isinstance(coordinate, Square):
             coordinate = Square(coordinate)
 
-        p_type, color = self.bitboard.piece_at(coordinate.index)
-        if p_type and color:
-            return p_type(color)
-        return None
+        code = self.bitboard.piece_code_at(coordinate.index)
+        return PIECES[code] if code >= 0 else None
+
+    def piece_code_at(self, index: int) -> int:
+        """Returns the integer piece code on a square index, or -1 if empty.
+
+        See v_chess.piece.codes for the encoding.
+        """
+        return self.bitboard.piece_code_at(index)
 
     def set_piece(self, piece: Piece, square: str | tuple | Square):
         """Sets a piece at a specific square.
@@ -97,6 +102,29 @@ class Board:
         self.remove_piece(start)
         self.set_piece(piece, end)
 
+    def push(self, move: Move, ep_square: Square | None = None,
+             castling_rook: Square | None = None, explode: bool = False) -> UndoInfo:
+        """Applies a move in place without copying the board.
+
+        Args:
+            move: The move to apply. It is not validated.
+            ep_square: The en passant target square of the position.
+            castling_rook: Start square of the rook when the move castles.
+            explode: Whether captures explode (Atomic chess).
+
+        Returns:
+            The record needed to revert the move with pop().
+        """
+        return self.bitboard.push(move, ep_square, castling_rook, explode)
+
+    def pop(self, undo: UndoInfo):
+        """Reverts the most recent move applied with push().
+
+        Args:
+            undo: The record returned by the matching push().
+        """
+        self.bitboard.pop(undo)
+
     def get_pieces(self, piece_type: type[T] = Piece, color: Color | None = None) -> list[T]:
         """Gets a list of pieces matching the criteria.
 
@@ -111,25 +139,19 @@ class Board:
         colors = [color] if color else [Color.WHITE, Color.BLACK]
 
         for c in colors:
-            types_to_check = [piece_type] if piece_type != Piece else self.bitboard.pieces[c].keys()
+            types_to_check = [piece_type] if piece_type != Piece else PIECE_TYPES
             for p_cls in types_to_check:
-                mask = self.bitboard.pieces[c][p_cls]
-                while mask:
-                    mask &= mask - 1
-                    pieces.append(p_cls(c))
+                mask = self.bitboard.get_piece_mask(p_cls, c)
+                if mask:
+                    pieces.extend([p_cls(c)] * mask.bit_count())
 
         return pieces
 
     def items(self) -> Generator[tuple[Square, Piece], None, None]:
         """Yields (Square, Piece) pairs for all pieces on the board."""
-        occupied = self.bitboard.occupied
-        while occupied:
-            idx = (occupied & -occupied).bit_length() - 1
-            sq = Square(divmod(idx, 8))
-            p_type, color = self.bitboard.piece_at(idx)
-            if p_type and color:
-                yield sq, p_type(color)
-            occupied &= occupied - 1
+        for idx, code in enumerate(self.bitboard.mailbox):
+            if code >= 0:
+                yield SQUARES[idx], PIECES[code]
 
     def values(self) -> Generator[Piece, None, None]:
         """Yields all Pieces on the board."""
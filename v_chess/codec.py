@@ -0,0 +1,256 @@
+import struct
+from typing import TYPE_CHECKING
+
+from v_chess.bitboard import Bitboard
+from v_chess.board import Board
+from v_chess.enums import CastlingRight, Color
+from v_chess.move_codes import SQUARES, decode
+from v_chess.piece.codes import NUM_CODES
+from v_chess.pocket import POCKET_SLOTS, Pocket
+
+if TYPE_CHECKING:
+    from v_chess.game import Game
+    from v_chess.game_state import GameState
+    from v_chess.square import Square
+
+# Bumped whenever the layout below changes; decoders reject other versions.
+CODEC_VERSION = 1
+
+# Position layout, all integers big-endian:
+#   version u8, kind u8, turn u8, occupied u64,
+#   piece codes as 4-bit nibbles in square index order (padded to a byte),
+#   castling right count u8 and one index into CASTLING_RIGHTS per right,
+#   ep square u8, halfmove clock u16, fullmove count u16,
+#   repetition count u8, explosion square u8,
+#   then per kind: the check counters (u8 x2) or the pocket counts
+#   (u8 x5 per color, White first).
+# Squares are indices, NO_SQUARE when absent.
+KIND_STANDARD, KIND_THREE_CHECK, KIND_CRAZYHOUSE = range(3)
+NO_SQUARE = 0xFF
+CASTLING_RIGHTS: tuple[CastlingRight, ...] = tuple(CastlingRight)
+CASTLING_INDEX: dict[CastlingRight, int] = {right: idx for idx, right in enumerate(CASTLING_RIGHTS)}
+
+_HEADER = struct.Struct(">BBBQ")
+_CLOCKS = struct.Struct(">BHHBB")
+_POCKETS = struct.Struct(">" + "B" * (2 * POCKET_SLOTS))
+_CHECKS = struct.Struct(">BB")
+# Game layout: version u8, variant name length u8 and ASCII name, the
+# encoded starting position, move count u32, then 3 bytes per packed move.
+_GAME_HEADER = struct.Struct(">BB")
+_MOVE_COUNT = struct.Struct(">I")
+MOVE_BYTES = 3
+
+
+def encode_state(state: GameState) -> bytes:
+    """Packs a position into bytes.
+
+    Covers everything state_to_fen writes plus the repetition count and
+    the Atomic explosion square. The Zobrist key is recomputed on decode.
+
+    Args:
+        state: The position to encode.
+
+    Returns:
+        The encoded position.
+    """
+    from v_chess.game_state import ThreeCheckGameState, CrazyhouseGameState
+
+    if isinstance(state, CrazyhouseGameState):
+        kind = KIND_CRAZYHOUSE
+    elif isinstance(state, ThreeCheckGameState):
+        kind = KIND_THREE_CHECK
+    else:
+        kind = KIND_STANDARD
+
+    bb = state.board.bitboard
+    mailbox = bb.mailbox
+    codes = [code for code in mailbox if code >= 0]
+    if len(codes) % 2:
+        codes.append(0)
+    pieces = bytes((codes[i] << 4) | codes[i + 1] for i in range(0, len(codes), 2))
+
+    rights = state.castling_rights
+    parts = [
+        _HEADER.pack(CODEC_VERSION, kind, state.turn == Color.BLACK, bb.occupied),
+        pieces,
+        bytes([len(rights), *(CASTLING_INDEX[right] for right in rights)]),
+        _CLOCKS.pack(
+            _square_byte(state.ep_square),
+            state.halfmove_clock,
+            state.fullmove_count,
+            min(state.repetition_count, 0xFF),
+            _square_byte(state.explosion_square),
+        ),
+    ]
+    if kind == KIND_CRAZYHOUSE:
+        parts.append(_POCKETS.pack(*state.pockets[0].counts, *state.pockets[1].counts))
+    elif kind == KIND_THREE_CHECK:
+        parts.append(_CHECKS.pack(*state.checks))
+    return b"".join(parts)
+
+
+def decode_state(data: bytes) -> GameState:
+    """Unpacks a position written by encode_state.
+
+    Args:
+        data: The encoded position.
+
+    Returns:
+        The position, of the GameState subclass it was encoded from.
+
+    Raises:
+        ValueError: If the data is truncated, has trailing bytes or was
+            written by another codec version.
+    """
+    state, offset = _read_state(data, 0)
+    if offset != len(data):
+        raise ValueError("Trailing bytes after encoded position.")
+    return state
+
+
+def encode_game(game: Game) -> bytes:
+    """Packs a game as its variant, starting position and packed moves.
+
+    Clocks, SAN and results such as resignations are not included.
+
+    Args:
+        game: The game to encode.
+
+    Returns:
+        The encoded game.
+    """
+    from v_chess.rules import RULES_MAP
+
+    name = next((key for key, rules_cls in RULES_MAP.items() if type(game.rules) is rules_cls), None)
+    if name is None:
+        raise ValueError(f"Rules {type(game.rules).__name__} have no variant name.")
+    start = game.history[0] if game.history else game.state
+    codes = game.move_codes
+    return b"".join([
+        _GAME_HEADER.pack(CODEC_VERSION, len(name)),
+        name.encode("ascii"),
+        encode_state(start),
+        _MOVE_COUNT.pack(len(codes)),
+        b"".join(code.to_bytes(MOVE_BYTES, "big") for code in codes),
+    ])
+
+
+def decode_game(data: bytes) -> Game:
+    """Rebuilds a game written by encode_game by replaying its moves.
+
+    Args:
+        data: The encoded game.
+
+    Returns:
+        The game, with history, SAN and repetition counts restored.
+
+    Raises:
+        ValueError: If the data is malformed or was written by another
+            codec version.
+        IllegalMoveException: If a move is not legal when replayed.
+    """
+    from v_chess.game import Game
+    from v_chess.rules import RULES_MAP
+
+    try:
+        version, name_length = _GAME_HEADER.unpack_from(data, 0)
+        _check_version(version)
+        offset = _GAME_HEADER.size
+        name = data[offset:offset + name_length].decode("ascii")
+        rules_cls = RULES_MAP.get(name)
+        if rules_cls is None:
+            raise ValueError(f"Unknown variant in encoded game: {name!r}")
+        state, offset = _read_state(data, offset + name_length)
+        (count,) = _MOVE_COUNT.unpack_from(data, offset)
+    except (struct.error, UnicodeDecodeError) as e:
+        raise ValueError(f"Malformed encoded game: {e}") from e
+    offset += _MOVE_COUNT.size
+    if len(data) != offset + count * MOVE_BYTES:
+        raise ValueError("Encoded game length does not match its move count.")
+
+    game = Game(state, rules=rules_cls())
+    for start in range(offset, len(data), MOVE_BYTES):
+        game.take_turn(decode(int.from_bytes(data[start:start + MOVE_BYTES], "big")))
+    return game
+
+
+def _read_state(data: bytes, offset: int) -> tuple[GameState, int]:
+    """Reads a position at an offset, returning it and the offset after it."""
+    from v_chess.game_state import GameState, ThreeCheckGameState, CrazyhouseGameState
+
+    try:
+        version, kind, black, occupied = _HEADER.unpack_from(data, offset)
+        _check_version(version)
+        offset += _HEADER.size
+
+        count = occupied.bit_count()
+        packed = data[offset:offset + (count + 1) // 2]
+        if len(packed) != (count + 1) // 2:
+            raise ValueError("Truncated piece placement.")
+        offset += len(packed)
+        mailbox = [-1] * 64
+        occ = occupied
+        for byte in packed:
+            for code in (byte >> 4, byte & 0xF):
+                if not occ:
+                    break
+                if code >= NUM_CODES:
+                    raise ValueError(f"Invalid piece code: {code}")
+                bit = occ & -occ
+                mailbox[bit.bit_length() - 1] = code
+                occ ^= bit
+
+        rights_count = data[offset]
+        rights = tuple(CASTLING_RIGHTS[idx] for idx in data[offset + 1:offset + 1 + rights_count])
+        if len(rights) != rights_count:
+            raise ValueError("Truncated castling rights.")
+        offset += 1 + rights_count
+
+        ep, halfmove, fullmove, repetitions, explosion = _CLOCKS.unpack_from(data, offset)
+        offset += _CLOCKS.size
+
+        args = (
+            Board(Bitboard.from_mailbox(mailbox)),
+            Color.BLACK if black else Color.WHITE,
+            rights,
+            _byte_square(ep),
+            halfmove,
+            fullmove,
+            repetitions,
+            _byte_square(explosion),
+        )
+        if kind == KIND_CRAZYHOUSE:
+            counts = _POCKETS.unpack_from(data, offset)
+            offset += _POCKETS.size
+            pockets = (
+                Pocket(Color.WHITE, counts[:POCKET_SLOTS]),
+                Pocket(Color.BLACK, counts[POCKET_SLOTS:]),
+            )
+            return CrazyhouseGameState(*args, pockets=pockets), offset
+        if kind == KIND_THREE_CHECK:
+            checks = _CHECKS.unpack_from(data, offset)
+            offset += _CHECKS.size
+            return ThreeCheckGameState(*args, checks=checks), offset
+        if kind != KIND_STANDARD:
+            raise ValueError(f"Unknown position kind: {kind}")
+        return GameState(*args), offset
+    except (struct.error, IndexError) as e:
+        raise ValueError(f"Malformed encoded position: {e}") from e
+
+
+def _check_version(version: int):
+    """Rejects data written by another codec version."""
+    if version != CODEC_VERSION:
+        raise ValueError(f"Unsupported codec version {version}, expected {CODEC_VERSION}.")
+
+
+def _square_byte(square: Square | None) -> int:
+    """Returns the index of a square, NO_SQUARE for None and NoneSquare."""
+    if square is None or square.is_none_square:
+        return NO_SQUARE
+    return square.index
+
+
+def _byte_square(value: int) -> Square | None:
+    """Returns the square of an index written by _square_byte."""
+    return None if value == NO_SQUARE else SQUARES[value]
@@ -2,46 +2,67 @@ from typing import TYPE_CHECKING
 from v_chess.enums import CastlingRight, Color
 from v_chess.piece.piece import Piece
 from v_chess.square import Square
-from v_chess.piece import piece_from_char
+from v_chess.piece.codes import CODE_FROM_FEN, FEN_CHARS, PIECE_FROM_FEN, PIECES
+from v_chess.pocket import Pocket
 
 if TYPE_CHECKING:
     from v_chess.game_state import GameState
     from v_chess.board import Board
 
 
-def board_from_fen(fen_board: str) -> dict[Square, Piece]:
-    """Parses the piece placement part of a FEN string.
+def mailbox_from_fen(fen_board: str) -> list[int]:
+    """Parses the piece placement part of a FEN string in a single pass.
 
     Args:
         fen_board: The piece placement part of a FEN string.
 
     Returns:
-        A dictionary mapping Squares to Pieces.
+        The piece code on each square index, -1 for empty squares.
 
     Raises:
-        ValueError: If the FEN string contains invalid characters.
+        ValueError: If the FEN string contains invalid characters or
+            describes squares outside the board.
     """
     # Strip pocket info if present for board parsing
     if "[" in fen_board:
         fen_board = fen_board.split("[")[0]
 
-    board: dict[Square, Piece] = {}
-    fen_rows = fen_board.split("/")
-    for row, fen_row in enumerate(fen_rows):
-        empty_squares = 0
-        for col, char in enumerate(fen_row):
-            if char.isdigit():
-                empty_squares += int(char) - 1
-            else:
-                is_white = char.isupper()
-                piece_color = Color.WHITE if is_white else Color.BLACK
-                piece_type = piece_from_char.get(char)
-                if piece_type is None:
-                    raise ValueError(f"Invalid piece in FEN: {char}")
-                piece = piece_type(piece_color)
-                coord = Square(row, col + empty_squares)
-                board[coord] = piece
-    return board
+    mailbox = [-1] * 64
+    idx = 0
+    row_end = 8
+    for char in fen_board:
+        if char == "/":
+            idx = row_end
+            row_end += 8
+        elif char.isdigit():
+            idx += int(char)
+        else:
+            code = CODE_FROM_FEN.get(char)
+            if code is None:
+                raise ValueError(f"Invalid piece in FEN: {char}")
+            if idx >= row_end or idx >= 64:
+                raise ValueError(f"Invalid square in FEN: {fen_board}")
+            mailbox[idx] = code
+            idx += 1
+    return mailbox
+
+def board_from_fen(fen_board: str) -> dict[Square, Piece]:
+    """Parses the piece placement part of a FEN string.
+
+    Args:
+        fen_board: The piece placement part of a FEN string.
+
+    Returns:
+        A dictionary mapping Squares to Pieces.
+
+    Raises:
+        ValueError: If the FEN string contains invalid characters.
+    """
+    return {
+        Square(divmod(idx, 8)): PIECES[code]
+        for idx, code in enumerate(mailbox_from_fen(fen_board))
+        if code >= 0
+    }
 
 def get_fen_from_board(board: "Board") -> str:
     """Generates the piece placement part of a FEN string from a board.
@@ -52,15 +73,13 @@ def get_fen_from_board(board: "Board") -> str:
     Returns:
         The FEN piece placement string.
     """
+    mailbox = board.bitboard.mailbox
     fen_rows = []
-    for row in range(8):
+    for row_start in range(0, 64, 8):
         empty_squares = 0
         fen_row_string = ""
-        for col in range(8):
-            coord = Square(row, col)
-            piece = board.get_piece(coord)
-
-            if piece is None:
+        for code in mailbox[row_start:row_start + 8]:
+            if code < 0:
                 empty_squares += 1
                 continue
 
@@ -68,7 +87,7 @@ def get_fen_from_board(board: "Board") -> str:
                 fen_row_string += str(empty_squares)
                 empty_squares = 0
 
-            fen_row_string += piece.fen
+            fen_row_string += FEN_CHARS[code]
 
         if empty_squares > 0:
             fen_row_string += str(empty_squares)
@@ -76,8 +95,8 @@ def get_fen_from_board(board: "Board") -> str:
 
     return "/".join(fen_rows)
 
-def _parse_pocket(pocket_str: str) -> tuple[tuple[Piece, ...], tuple[Piece, ...]]:
-    """Parses a Crazyhouse pocket string into piece tuples.
+def _parse_pocket(pocket_str: str) -> tuple[Pocket, Pocket]:
+    """Parses a Crazyhouse pocket string into per-color piece counts.
 
     Args:
         pocket_str: The pocket string (e.g., 'QNp').
@@ -86,21 +105,14 @@ def _parse_pocket(pocket_str: str) -> tuple[tuple[Piece, ...], tuple[Piece, ...]
         A tuple (white_pocket, black_pocket).
     """
     # content inside []
-    white_pocket: list[Piece] = []
-    black_pocket: list[Piece] = []
-
-    for char in pocket_str:
-        piece_cls = piece_from_char.get(char)
-        if piece_cls:
-            # Uppercase = White, Lowercase = Black
-            if char.isupper():
-                white_pocket.append(piece_cls(Color.WHITE))
-            else:
-                black_pocket.append(piece_cls(Color.BLACK))
-
-    return (tuple(white_pocket), tuple(black_pocket))
-
-def _serialize_pocket(white_pocket: tuple[Piece, ...], black_pocket: tuple[Piece, ...]) -> str:
+    # Uppercase = White, Lowercase = Black
+    pieces = [PIECE_FROM_FEN[char] for char in pocket_str if char in PIECE_FROM_FEN]
+    return (
+        Pocket.from_pieces(Color.WHITE, (p for p in pieces if p.color == Color.WHITE)),
+        Pocket.from_pieces(Color.BLACK, (p for p in pieces if p.color == Color.BLACK)),
+    )
+
+def _serialize_pocket(white_pocket: Pocket, black_pocket: Pocket) -> str:
     """Serializes Crazyhouse pockets to a string.
 
     Args:
@@ -110,11 +122,7 @@ def _serialize_pocket(white_pocket: tuple[Piece, ...], black_pocket: tuple[Piece
     Returns:
         The FEN-compatible pocket string.
     """
-    s = ""
-    for p in white_pocket:
-        s += p.fen
-    for p in black_pocket:
-        s += p.fen
+    s = white_pocket.fen + black_pocket.fen
     return f"[{s}]" if s else ""
 
 def state_from_fen(fen: str) -> "GameState":
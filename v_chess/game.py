@@ -1,8 +1,14 @@
 import time
+from collections import Counter
 from dataclasses import replace
 from v_chess.game_state import GameState
+from v_chess.history import GameHistory
+from v_chess.instrumentation import instrumentation
 from v_chess.move import Move
+from v_chess.outcome import MoveOutcome, evaluate_outcome, outcome_of
+from v_chess.position_cache import position_cache
 from v_chess.rules import Rules
+from v_chess.san import san_for_moves
 from v_chess.exceptions import IllegalMoveException, IllegalBoardException
 from v_chess.enums import MoveLegalityReason, BoardLegalityReason, GameOverReason, Color
 
@@ -35,7 +41,9 @@ class Game:
             from v_chess.rules import StandardRules
             self.rules = StandardRules()
 
-        self.history: list[GameState] = []
+        self.history = GameHistory(self.rules)
+        # Occurrences of each Zobrist key in history, kept in step with it.
+        self._position_counts: Counter[int] = Counter()
         self.move_history: list[str] = [] # SAN
         self.uci_history: list[str] = [] # UCI (for highlighting)
 
@@ -60,9 +68,19 @@ class Game:
                 Color.BLACK: start_sec
             }
 
-    def add_to_history(self):
-        """Adds the current state to the history stack."""
-        self.history.append(self.state)
+    @property
+    def move_codes(self) -> list[int]:
+        """The packed moves played, see v_chess.move_codes."""
+        return self.history.codes
+
+    def add_to_history(self, move: Move):
+        """Adds the current state and the move played from it to the history.
+
+        Args:
+            move: The move about to be played.
+        """
+        self.history.append(self.state, move)
+        self._position_counts[self.state.zobrist] += 1
 
     def render(self):
         """Print the board to the console."""
@@ -124,7 +142,7 @@ class Game:
         if move_status != MoveLegalityReason.LEGAL:
             raise IllegalMoveException(f"Illegal move: {move_status.value} (attempted: {move.uci})")
 
-        san = move.get_san(self)
+        san = san_for_moves(self.state, [move], self.rules, annotate=False)[0]
 
         # Update Clocks (Absolute time for persistence)
         now = time.time()
@@ -138,42 +156,29 @@ class Game:
                 self.clocks[self.state.turn] += self.time_control.get('increment', 0)
                 self.last_move_at = now
 
-        self.add_to_history()
+        self.add_to_history(move)
         new_state = self.apply_move(self.state, move)
 
-        current_fen_key = " ".join(new_state.fen.split()[:4])
-
-        count = 1
-        for past_state in self.history:
-            past_fen_key = " ".join(past_state.fen.split()[:4])
-            if past_fen_key == current_fen_key:
-                count += 1
-
+        count = 1 + self._position_counts[new_state.zobrist]
         self.state = replace(new_state, repetition_count=count)
 
-        is_game_over = self.is_over
-        is_check = self.is_check
-
-        if is_game_over:
-            if self.game_over_reason == GameOverReason.CHECKMATE:
+        # Check and game over status are evaluated once and kept on the state.
+        outcome = evaluate_outcome(self.rules, self.state)
+        if outcome.is_over:
+            if outcome.game_over_reason == GameOverReason.CHECKMATE:
                  san += "#"
-        elif is_check:
+        elif outcome.is_check:
              san += "+"
 
         if offer_draw:
              san += "="
 
+        self.state.set_outcome(replace(outcome, san=san))
         self.move_history.append(san)
         self.uci_history.append(move.uci)
 
-        if is_game_over:
-             result = "1/2-1/2"
-             winner_color = self.rules.get_winner(self.state)
-             if winner_color == Color.WHITE:
-                 result = "1-0"
-             elif winner_color == Color.BLACK:
-                 result = "0-1"
-             self.move_history.append(result)
+        if outcome.is_over:
+             self.move_history.append(outcome.result)
 
     def get_current_clocks(self) -> dict[Color, float] | None:
         """Returns the current remaining time for each player.
@@ -211,6 +216,7 @@ class Game:
             self.move_history.pop()
 
         self.state = self.history.pop()
+        self._position_counts[self.state.zobrist] -= 1
         if self.move_history:
             self.move_history.pop()
         if self.uci_history:
@@ -231,10 +237,15 @@ class Game:
         """Returns the number of times the current position has occurred."""
         return self.state.repetition_count
 
+    @property
+    def outcome(self) -> MoveOutcome:
+        """Returns the check and game over status of the current position."""
+        return outcome_of(self.rules, self.state)
+
     @property
     def is_check(self) -> bool:
         """Checks if the current side to move is in check."""
-        return self.rules.is_check(self.state)
+        return self.outcome.is_check
 
     @property
     def is_checkmate(self) -> bool:
@@ -256,17 +267,17 @@ class Game:
         """Checks if the game is over."""
         if self.is_over_by_timeout or self.game_over_reason_override is not None or self.winner_override is not None:
             return True
-        return self.rules.is_game_over(self.state)
+        return self.outcome.is_over
 
     @property
     def legal_moves(self) -> list[Move]:
         """Returns a list of all legal moves in the current position."""
-        return [move for move in self.rules.get_possible_moves(self.state) if self.is_move_legal(move)]
+        return position_cache.legal_moves(self.rules, self.state)
 
     @property
     def has_legal_moves(self) -> bool:
         """Checks if there is at least one legal move."""
-        return self.rules.has_legal_moves(self.state)
+        return position_cache.has_legal_moves(self.rules, self.state)
 
     @property
     def game_over_reason(self) -> GameOverReason:
@@ -275,7 +286,7 @@ class Game:
             return self.game_over_reason_override
         if self.is_over_by_timeout:
              return GameOverReason.TIMEOUT
-        return self.rules.get_game_over_reason(self.state)
+        return self.outcome.game_over_reason
 
     @property
     def winner(self) -> str | None:
@@ -288,7 +299,7 @@ class Game:
              # If timeout, the winner is the one NOT on turn (simplification)
              return self.state.turn.opposite.value
 
-        color = self.rules.get_winner(self.state)
+        color = self.outcome.winner
         return color.value if color else None
 
     def is_move_legal(self, move: Move) -> bool:
@@ -316,4 +327,9 @@ class Game:
 
     def apply_move(self, state: GameState, move: Move) -> GameState:
         """Executes a move and returns the new GameState."""
-        return self.rules.apply_move(state, move)
+        if not instrumentation.enabled:
+            return self.rules.apply_move(state, move)
+        started = time.perf_counter()
+        new_state = self.rules.apply_move(state, move)
+        instrumentation.record_operation("apply", self.rules, state, move, time.perf_counter() - started)
+        return new_state
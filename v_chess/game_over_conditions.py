@@ -1,6 +1,9 @@
 from typing import TYPE_CHECKING, Optional
 from v_chess.enums import GameOverReason, Color
+from v_chess.game_state import ThreeCheckGameState
 from v_chess.piece import King
+from v_chess.piece.codes import BLACK_OFFSET, KING
+from v_chess.position_cache import position_cache
 
 if TYPE_CHECKING:
     from v_chess.game_state import GameState
@@ -20,15 +23,15 @@ def evaluate_fifty_move_rule(state: "GameState", rules: "Rules") -> Optional[Gam
 
 def evaluate_checkmate(state: "GameState", rules: "Rules") -> Optional[GameOverReason]:
     """Win by Checkmate."""
-    if rules.is_check(state):
-        if not rules.has_legal_moves(state):
+    if position_cache.is_check(rules, state):
+        if not position_cache.has_legal_moves(rules, state):
             return GameOverReason.CHECKMATE
     return None
 
 def evaluate_stalemate(state: "GameState", rules: "Rules") -> Optional[GameOverReason]:
-    """Draw by Stalemate."""
-    if not rules.is_check(state):
-        if not rules.has_legal_moves(state):
+    """Draw by Stalemate. Shares the check and mobility results of evaluate_checkmate."""
+    if not position_cache.is_check(rules, state):
+        if not position_cache.has_legal_moves(rules, state):
             return GameOverReason.STALEMATE
     return None
 
@@ -43,7 +46,6 @@ def evaluate_king_center_win(state: "GameState", rules: "Rules") -> Optional[Gam
 
 def evaluate_three_check_win(state: "GameState", rules: "Rules") -> Optional[GameOverReason]:
     """Win by giving check 3 times."""
-    from v_chess.game_state import ThreeCheckGameState
     if isinstance(state, ThreeCheckGameState):
         if state.checks[0] >= 3 or state.checks[1] >= 3:
             return GameOverReason.THREE_CHECKS
@@ -51,9 +53,8 @@ def evaluate_three_check_win(state: "GameState", rules: "Rules") -> Optional[Gam
 
 def evaluate_atomic_king_exploded(state: "GameState", rules: "Rules") -> Optional[GameOverReason]:
     """Game over if a king explodes."""
-    wk = any(isinstance(p, King) and p.color == Color.WHITE for p in state.board.values())
-    bk = any(isinstance(p, King) and p.color == Color.BLACK for p in state.board.values())
-    if not wk or not bk:
+    masks = state.board.bitboard.masks
+    if not masks[KING] or not masks[BLACK_OFFSET + KING]:
         return GameOverReason.KING_EXPLODED
     return None
 
@@ -68,7 +69,7 @@ def evaluate_antichess_win(state: "GameState", rules: "Rules") -> Optional[GameO
          return GameOverReason.ALL_PIECES_CAPTURED
          
     # Priority 2: No legal moves (Stalemate win)
-    if not rules.has_legal_moves(state):
+    if not position_cache.has_legal_moves(rules, state):
          return GameOverReason.STALEMATE
     return None
 
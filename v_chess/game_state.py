@@ -1,11 +1,18 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from functools import cached_property
+from typing import TYPE_CHECKING
+
+from v_chess import zobrist
 
 from v_chess.board import Board
 from v_chess.square import Square
 from v_chess.enums import Color, CastlingRight
 from v_chess.fen_helpers import state_from_fen, state_to_fen
-from v_chess.piece import Piece
+from v_chess.pocket import EMPTY_POCKETS, Pocket
+
+if TYPE_CHECKING:
+    from v_chess.attacks import AttackInfo
+    from v_chess.outcome import MoveOutcome
 
 
 @dataclass(frozen=True)
@@ -21,6 +28,11 @@ class GameState:
         fullmove_count: The number of the full move.
         repetition_count: Number of times this position has occurred.
         explosion_square: The square where an explosion occurred (Atomic chess).
+        zobrist_key: Incrementally maintained Zobrist key of the position, or
+            None to compute it from scratch on first use.
+        outcome: Check and game over status recorded by Game when the
+            position is reached, see v_chess.outcome. Not copied by replace().
+        attacks: Attack maps and check information, see the attacks property.
     """
     board: Board
     turn: Color
@@ -30,6 +42,9 @@ class GameState:
     fullmove_count: int
     repetition_count: int = 1
     explosion_square: Square | None = None
+    zobrist_key: int | None = field(default=None, repr=False)
+    outcome: MoveOutcome | None = field(default=None, init=False, repr=False, compare=False)
+    _attacks: AttackInfo | None = field(default=None, init=False, repr=False, compare=False)
 
     STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1"
     EMPTY_BOARD_FEN = "8/8/8/8/8/8/8/8 w KQkq - 0 1"
@@ -44,22 +59,85 @@ class GameState:
         """Creates a GameState from a FEN string."""
         return state_from_fen(fen)
 
+    @classmethod
+    def from_bytes(cls, data: bytes) -> GameState:
+        """Creates a GameState from bytes written by to_bytes, see v_chess.codec."""
+        from v_chess.codec import decode_state
+        return decode_state(data)
+
+    def to_bytes(self) -> bytes:
+        """Packs the game state into bytes, see v_chess.codec."""
+        from v_chess.codec import encode_state
+        return encode_state(self)
+
     @classmethod
     def empty(cls) -> GameState:
         """Creates a GameState with an empty board."""
         return state_from_fen(cls.EMPTY_BOARD_FEN)
 
+    def set_outcome(self, outcome: MoveOutcome):
+        """Records the status of the position, computed once by the Game."""
+        object.__setattr__(self, "outcome", outcome)
+
+    @property
+    def attacks(self) -> AttackInfo:
+        """Attacked squares, checkers and pins of the position, computed on first use.
+
+        Kept on the state and shared by every query about the position. It is
+        recomputed if the board has been changed in place since.
+        """
+        from v_chess.attacks import AttackInfo
+        info = self._attacks
+        if info is None or info.placement != self.board.bitboard.masks:
+            info = AttackInfo(self)
+            object.__setattr__(self, "_attacks", info)
+        return info
+
     @cached_property
     def fen(self) -> str:
         """The FEN string representation of the game state."""
         return state_to_fen(self)
 
-    def __hash__(self):
-        """Returns the hash of the FEN string."""
-        return hash(self.fen)
-
+    @cached_property
+    def zobrist(self) -> int:
+        """The 64-bit Zobrist key of the position.
+
+        Covers piece placement, side to move, castling rights, the en passant
+        file and variant counters, but not the move clocks.
+        """
+        if self.zobrist_key is not None:
+            return self.zobrist_key
+        return self._compute_zobrist()
+
+    def _compute_zobrist(self) -> int:
+        """Computes the Zobrist key from scratch."""
+        return (
+            zobrist.board_key(self.board.bitboard)
+            ^ zobrist.side_key(self.turn)
+            ^ zobrist.castling_key(self.castling_rights)
+            ^ zobrist.ep_key(self.ep_square)
+        )
 
-@dataclass(frozen=True)
+    def __hash__(self):
+        """Returns the Zobrist key of the position."""
+        return self.zobrist
+
+    def __eq__(self, other):
+        """Compares Zobrist keys first, then the full FEN and counters."""
+        if not isinstance(other, GameState) or type(other) is not type(self):
+            return NotImplemented
+        if self is other:
+            return True
+        if self.zobrist != other.zobrist:
+            return False
+        return (
+            self.fen == other.fen
+            and self.repetition_count == other.repetition_count
+            and self.explosion_square == other.explosion_square
+        )
+
+
+@dataclass(frozen=True, eq=False)
 class ThreeCheckGameState(GameState):
     """GameState for Three-Check Chess.
 
@@ -68,12 +146,21 @@ class ThreeCheckGameState(GameState):
     """
     checks: tuple[int, int] = (0, 0)
 
+    def _compute_zobrist(self) -> int:
+        """Computes the Zobrist key including the check counters."""
+        return super()._compute_zobrist() ^ zobrist.checks_key(self.checks)
 
-@dataclass(frozen=True)
+
+@dataclass(frozen=True, eq=False)
 class CrazyhouseGameState(GameState):
     """GameState for Crazyhouse Chess.
 
     Attributes:
-        pockets: Tuple (white_pocket, black_pocket) tracking available drop pieces.
+        pockets: Tuple (white_pocket, black_pocket) of the piece counts
+            available for drops.
     """
-    pockets: tuple[tuple[Piece, ...], tuple[Piece, ...]] = ((), ())
+    pockets: tuple[Pocket, Pocket] = EMPTY_POCKETS
+
+    def _compute_zobrist(self) -> int:
+        """Computes the Zobrist key including the pocket contents."""
+        return super()._compute_zobrist() ^ zobrist.pockets_key(self.pockets)
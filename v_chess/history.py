@@ -0,0 +1,114 @@
+from dataclasses import replace
+from typing import TYPE_CHECKING, Iterator
+
+from v_chess.move_codes import decode
+
+if TYPE_CHECKING:
+    from v_chess.game_state import GameState
+    from v_chess.move import Move
+    from v_chess.rules import Rules
+
+# Plies between two positions kept in full.
+CHECKPOINT_INTERVAL = 16
+
+
+class GameHistory:
+    """The positions a game's moves were played from, stored compactly.
+
+    Every move is kept as its packed code together with the repetition
+    count of the position it was played from. Only every interval-th
+    position is kept as a full GameState; the others are rebuilt on access
+    by replaying the moves from the closest earlier checkpoint. Behaves as
+    a read-only sequence of GameStates, history[i] being the position move
+    i was played from.
+
+    Attributes:
+        rules: The rules the moves are replayed with.
+        interval: Plies between two checkpoints.
+        codes: The packed moves, see v_chess.move_codes.
+        repetitions: The repetition count of the position each move was
+            played from.
+    """
+
+    def __init__(self, rules: Rules, interval: int = CHECKPOINT_INTERVAL):
+        """Initializes an empty history.
+
+        Args:
+            rules: The rules the moves are replayed with.
+            interval: Plies between two checkpoints.
+        """
+        self.rules = rules
+        self.interval = interval
+        self.codes: list[int] = []
+        self.repetitions: list[int] = []
+        self._checkpoints: list[GameState] = []
+        # Moves whose packed code decodes to a different Move, such as a
+        # drop piece of the other color, by ply.
+        self._moves: dict[int, Move] = {}
+
+    def append(self, state: GameState, move: Move):
+        """Records a position and the move played from it.
+
+        Args:
+            state: The position before the move.
+            move: The move played.
+        """
+        ply = len(self.codes)
+        if ply % self.interval == 0:
+            self._checkpoints.append(state)
+        if decode(move.code) != move:
+            self._moves[ply] = move
+        self.codes.append(move.code)
+        self.repetitions.append(state.repetition_count)
+
+    def pop(self) -> GameState:
+        """Removes the last move and returns the position it was played from.
+
+        Raises:
+            IndexError: If the history is empty.
+        """
+        if not self.codes:
+            raise IndexError("pop from empty history")
+        state = self._state_at(len(self.codes) - 1)
+        self.codes.pop()
+        self.repetitions.pop()
+        self._moves.pop(len(self.codes), None)
+        if len(self.codes) % self.interval == 0:
+            self._checkpoints.pop()
+        return state
+
+    def _state_at(self, ply: int) -> GameState:
+        """Rebuilds the position of a ply from the closest earlier checkpoint."""
+        checkpoint, offset = divmod(ply, self.interval)
+        state = self._checkpoints[checkpoint]
+        start = ply - offset
+        for idx in range(start, ply):
+            state = self._next(state, idx)
+        return state
+
+    def _next(self, state: GameState, ply: int) -> GameState:
+        """Plays the move of a ply on its position."""
+        move = self._moves.get(ply) or decode(self.codes[ply])
+        new_state = self.rules.apply_move(state, move)
+        return replace(new_state, repetition_count=self.repetitions[ply + 1])
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def __getitem__(self, index: int | slice) -> GameState | list[GameState]:
+        if isinstance(index, slice):
+            return [self._state_at(ply) for ply in range(*index.indices(len(self.codes)))]
+        if index < 0:
+            index += len(self.codes)
+        if not 0 <= index < len(self.codes):
+            raise IndexError("history index out of range")
+        return self._state_at(index)
+
+    def __iter__(self) -> Iterator[GameState]:
+        """Yields every position in order, replaying each move once."""
+        for ply in range(len(self.codes)):
+            if ply % self.interval == 0:
+                state = self._checkpoints[ply // self.interval]
+            else:
+                state = self._next(state, ply - 1)
+            yield state
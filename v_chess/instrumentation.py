@@ -0,0 +1,136 @@
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING
+
+from v_chess.enums import MoveLegalityReason
+
+if TYPE_CHECKING:
+    from v_chess.game_state import GameState
+    from v_chess.move import Move
+    from v_chess.rules import Rules
+
+DEFAULT_SLOW_THRESHOLD = 0.05  # seconds
+SLOW_LOG_SIZE = 200
+
+
+@dataclass
+class ValidatorStats:
+    """Counters of one move validator.
+
+    Attributes:
+        calls: Number of times the validator ran.
+        rejections: Number of rejections by reason.
+        seconds: Cumulative time spent in the validator.
+    """
+    calls: int = 0
+    rejections: Counter[MoveLegalityReason] = field(default_factory=Counter)
+    seconds: float = 0.0
+
+    def to_dict(self) -> dict:
+        """Returns the counters as JSON-friendly values."""
+        return {
+            "calls": self.calls,
+            "rejections": {reason.value: count for reason, count in self.rejections.items()},
+            "seconds": self.seconds,
+        }
+
+
+@dataclass(frozen=True)
+class SlowMove:
+    """A validation or move application that exceeded the slow threshold.
+
+    Attributes:
+        operation: "validate" or "apply".
+        variant: The name of the rules class.
+        fen: The position the move was played from.
+        move: The move in UCI notation.
+        seconds: The time the operation took.
+    """
+    operation: str
+    variant: str
+    fen: str
+    move: str
+    seconds: float
+
+
+class Instrumentation:
+    """Opt-in counters for the move validator pipeline and a slow-move log.
+
+    While disabled, Rules.validate_move and Game.apply_move do not time
+    anything, so the instrumentation costs one attribute lookup per call.
+
+    Attributes:
+        enabled: Whether calls are being recorded.
+        slow_threshold: Duration in seconds above which a validation or move
+            application is added to the slow-move log.
+        validators: Counters by validator name.
+        slow_moves: The most recent slow operations, oldest first.
+    """
+
+    def __init__(self, slow_threshold: float = DEFAULT_SLOW_THRESHOLD):
+        """Initializes disabled instrumentation.
+
+        Args:
+            slow_threshold: Duration in seconds above which operations are logged.
+        """
+        self.enabled = False
+        self.slow_threshold = slow_threshold
+        self.validators: dict[str, ValidatorStats] = {}
+        self.slow_moves: deque[SlowMove] = deque(maxlen=SLOW_LOG_SIZE)
+
+    def enable(self, slow_threshold: float | None = None):
+        """Starts recording, optionally changing the slow threshold."""
+        if slow_threshold is not None:
+            self.slow_threshold = slow_threshold
+        self.enabled = True
+
+    def disable(self):
+        """Stops recording, keeping the collected data."""
+        self.enabled = False
+
+    def reset(self):
+        """Drops the collected counters and slow moves."""
+        self.validators.clear()
+        self.slow_moves.clear()
+
+    def record_validator(self, name: str, reason: MoveLegalityReason | None, seconds: float):
+        """Adds one validator call to its counters.
+
+        Args:
+            name: The validator function name.
+            reason: The rejection reason, or None if the move passed.
+            seconds: The time the call took.
+        """
+        stats = self.validators.get(name)
+        if stats is None:
+            stats = self.validators[name] = ValidatorStats()
+        stats.calls += 1
+        stats.seconds += seconds
+        if reason:
+            stats.rejections[reason] += 1
+
+    def record_operation(self, operation: str, rules: Rules, state: GameState, move: Move, seconds: float):
+        """Logs an operation if it exceeded the slow threshold.
+
+        Args:
+            operation: "validate" or "apply".
+            rules: The variant rules.
+            state: The position the move was played from.
+            move: The move.
+            seconds: The time the operation took.
+        """
+        if seconds >= self.slow_threshold:
+            self.slow_moves.append(SlowMove(operation, type(rules).__name__, state.fen, move.uci, seconds))
+
+    def snapshot(self) -> dict:
+        """Returns the settings, validator counters and slow moves as JSON-friendly values."""
+        return {
+            "enabled": self.enabled,
+            "slow_threshold": self.slow_threshold,
+            "validators": {name: stats.to_dict() for name, stats in self.validators.items()},
+            "slow_moves": [asdict(slow) for slow in self.slow_moves],
+        }
+
+
+# Shared by every Rules and Game instance in the process.
+instrumentation = Instrumentation()
@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import TYPE_CHECKING
 
 from v_chess.piece.pawn import Pawn
@@ -7,6 +8,7 @@ from v_chess.square import Square
 from v_chess.enums import Color, MoveLegalityReason
 from v_chess.piece.piece import Piece
 from v_chess.piece import piece_from_char
+from v_chess.piece.codes import piece_for
 
 if TYPE_CHECKING:
     from v_chess.game import Game
@@ -48,7 +50,7 @@ class Move:
                 if piece_char in piece_from_char and Move.is_square_valid(square_str):
                     _start = Square(None) # NoneSquare
                     _end = Square(square_str)
-                    _drop_piece = piece_from_char[piece_char](player_to_move)
+                    _drop_piece = piece_for(piece_from_char[piece_char], player_to_move)
                 else:
                      raise ValueError(f"Invalid Drop UCI: {uci_str}")
 
@@ -58,7 +60,7 @@ class Move:
                 _start = Square(uci_str[:2])
                 _end = Square(uci_str[2:4])
                 if len(uci_str) == 5:
-                    _promotion_piece = piece_from_char[uci_str[4:]](player_to_move)
+                    _promotion_piece = piece_for(piece_from_char[uci_str[4:]], player_to_move)
 
         elif len(args) >= 2:
             if not (isinstance(args[0], Square) and isinstance(args[1], Square)):
@@ -83,6 +85,16 @@ class Move:
         object.__setattr__(self, 'drop_piece', _drop_piece)
         object.__setattr__(self, 'player_to_move', player_to_move)
 
+    @cached_property
+    def code(self) -> int:
+        """The move packed into an int, see v_chess.move_codes."""
+        from v_chess.move_codes import encode
+        return encode(self)
+
+    def __hash__(self) -> int:
+        """Hashes the packed move instead of the Square and Piece fields."""
+        return self.code
+
     @property
     def is_drop(self) -> bool:
         """Whether the move is a drop move (placing a piece from reserve)."""
@@ -121,74 +133,13 @@ class Move:
         """Generates the Standard Algebraic Notation (SAN) for the move.
 
         Args:
-            game: The game context, used to resolve ambiguity and checks.
+            game: The game context, used to resolve ambiguity.
 
         Returns:
-            The SAN string (e.g., 'Nf3', 'O-O', 'exd5').
+            The SAN string without check suffix (e.g., 'Nf3', 'O-O', 'exd5').
         """
-        if self.is_drop:
-            # SAN for drop is usually same as UCI/special: N@e4
-            return self.uci
-
-        piece = game.state.board.get_piece(self.start)
-        if piece is None:
-            return self.uci
-
-        if isinstance(piece, King) and abs(self.start.col - self.end.col) == 2:
-            if self.end.col > self.start.col:
-                return "O-O"
-            else:
-                return "O-O-O"
-
-        san = ""
-        piece_char = piece.fen.upper()
-        if not isinstance(piece, Pawn):
-            san += piece_char
-
-        candidates = []
-
-        for sq, p in game.state.board.items():
-            if p and isinstance(p, type(piece)) and p.color == piece.color:
-                if sq == self.start:
-                    continue
-
-                candidate_move = Move(sq, self.end, self.promotion_piece, player_to_move=game.state.turn)
-                if game.rules.validate_move(game.state, candidate_move) == MoveLegalityReason.LEGAL:
-                    candidates.append(sq)
-
-        if candidates:
-            file_distinct = True
-            for c_sq in candidates:
-                if c_sq.col == self.start.col:
-                    file_distinct = False
-                    break
-
-            rank_distinct = True
-            for c_sq in candidates:
-                if c_sq.row == self.start.row:
-                    rank_distinct = False
-                    break
-
-            if file_distinct:
-                san += str(self.start).lower()[0]
-            elif rank_distinct:
-                san += str(self.start).lower()[1]
-            else:
-                san += str(self.start).lower()
-
-        target = game.state.board.get_piece(self.end)
-        is_en_passant = isinstance(piece, Pawn) and self.start.col != self.end.col and target is None
-
-        if target is not None or is_en_passant:
-            if isinstance(piece, Pawn):
-                san += str(self.start).lower()[0]
-            san += "x"
-
-        san += str(self.end).lower()
-        if self.promotion_piece:
-            san += "=" + str(self.promotion_piece).upper()
-
-        return san
+        from v_chess.san import san_for_moves
+        return san_for_moves(game.state, [self], game.rules, annotate=False)[0]
 
     @staticmethod
     def is_uci_valid(uci_str: str):
@@ -265,16 +216,12 @@ class Move:
         promotion_piece = None
         if "=" in clean_san:
             clean_san, promotion_char = clean_san.split("=")
-            promotion_piece = piece_from_char[promotion_char](
-                game.state.turn
-            )
+            promotion_piece = piece_for(piece_from_char[promotion_char], game.state.turn)
         elif clean_san and clean_san[-1].isalpha() and clean_san[-1].upper() in piece_from_char:
 
             promotion_char = clean_san[-1]
             clean_san = clean_san[:-1]
-            promotion_piece = piece_from_char[promotion_char](
-                game.state.turn
-            )
+            promotion_piece = piece_for(piece_from_char[promotion_char], game.state.turn)
 
         end_square = Square(clean_san[-2:])
         piece_indicator = clean_san[:-2]
@@ -317,7 +264,18 @@ class Move:
 
     @classmethod
     def from_san(cls, san_str: str, game: "Game") -> "Move":
-        """Creates a Move from a SAN string (including castling)."""
+        """Creates a Move from a SAN string (including castling).
+
+        Rules with the bitboard move generator resolve the string through
+        the legal move index of the position. Other rules, and strings the
+        index cannot resolve, are parsed by validating the candidate pieces.
+        """
+        from v_chess.san import parse_san
+        if game.rules.uses_legal_movegen:
+            move = parse_san(game.state, san_str, game.rules)
+            if move is not None:
+                return move
+
         if san_str in ("O-O", "O-O-O"):
             return cls.from_san_castling(san_str, game)
 
@@ -0,0 +1,170 @@
+from v_chess.enums import Color
+from v_chess.move import Move
+from v_chess.piece import piece_from_char
+from v_chess.piece.codes import PIECES, TYPE_INDEX, BLACK_OFFSET
+from v_chess.square import Square
+
+# A packed move is a plain int:
+#   bits  0-5   start square index (0 for drops)
+#   bits  6-11  end square index
+#   bits 12-14  promotion piece type index + 1, 0 for none
+#   bits 15-17  dropped piece type index + 1, 0 for none
+#   bit  18     set when Black is the player to move
+TO_SHIFT = 6
+PROMOTION_SHIFT = 12
+DROP_SHIFT = 15
+SQUARE_MASK = 0x3F
+PIECE_FIELD_MASK = 0x7
+BLACK_FLAG = 1 << 18
+
+SQUARES: list[Square] = [Square(divmod(idx, 8)) for idx in range(64)]
+SQUARE_NAMES: list[str] = [str(sq) for sq in SQUARES]
+SQUARE_INDEX: dict[str, int] = {name: idx for idx, name in enumerate(SQUARE_NAMES)}
+NONE_SQUARE = Square(None)
+
+# Decoded moves are immutable, so each code maps to one shared Move.
+_MOVE_CACHE: dict[int, Move] = {}
+_UCI_CACHE: dict[int, str] = {}
+
+
+def pack(start: int, end: int, promotion: int = 0, drop: int = 0, black: bool = False) -> int:
+    """Packs move fields into an int.
+
+    Args:
+        start: Start square index, ignored for drops.
+        end: End square index.
+        promotion: Promotion piece type index + 1, or 0.
+        drop: Dropped piece type index + 1, or 0.
+        black: Whether Black is the player to move.
+
+    Returns:
+        The packed move.
+    """
+    code = start | (end << TO_SHIFT) | (promotion << PROMOTION_SHIFT) | (drop << DROP_SHIFT)
+    return code | BLACK_FLAG if black else code
+
+
+def start_index(code: int) -> int:
+    """Returns the start square index of a packed move."""
+    return code & SQUARE_MASK
+
+
+def end_index(code: int) -> int:
+    """Returns the end square index of a packed move."""
+    return (code >> TO_SHIFT) & SQUARE_MASK
+
+
+def promotion_type(code: int) -> int:
+    """Returns the promotion piece type index of a packed move, or -1."""
+    return ((code >> PROMOTION_SHIFT) & PIECE_FIELD_MASK) - 1
+
+
+def drop_type(code: int) -> int:
+    """Returns the dropped piece type index of a packed move, or -1."""
+    return ((code >> DROP_SHIFT) & PIECE_FIELD_MASK) - 1
+
+
+def encode(move: Move) -> int:
+    """Packs a Move into an int.
+
+    Args:
+        move: The move to encode.
+
+    Returns:
+        The packed move, equal for equal moves.
+    """
+    black = move.player_to_move == Color.BLACK
+    end = move.end.index if not move.end.is_none_square else 0
+    if move.drop_piece is not None:
+        return pack(0, end, drop=TYPE_INDEX[type(move.drop_piece)] + 1, black=black)
+    start = move.start.index if not move.start.is_none_square else 0
+    promotion = TYPE_INDEX[type(move.promotion_piece)] + 1 if move.promotion_piece is not None else 0
+    return pack(start, end, promotion, black=black)
+
+
+def decode(code: int) -> Move:
+    """Returns the Move of a packed move.
+
+    Moves are built once per code and shared afterwards.
+
+    Args:
+        code: A packed move.
+
+    Returns:
+        The corresponding Move.
+    """
+    move = _MOVE_CACHE.get(code)
+    if move is None:
+        black = bool(code & BLACK_FLAG)
+        color = Color.BLACK if black else Color.WHITE
+        offset = BLACK_OFFSET if black else 0
+        end = SQUARES[end_index(code)]
+        drop = drop_type(code)
+        if drop >= 0:
+            move = Move(NONE_SQUARE, end, None, PIECES[offset + drop], player_to_move=color)
+        else:
+            promotion = promotion_type(code)
+            promotion_piece = PIECES[offset + promotion] if promotion >= 0 else None
+            move = Move(SQUARES[start_index(code)], end, promotion_piece, player_to_move=color)
+        move.__dict__["code"] = code
+        _MOVE_CACHE[code] = move
+    return move
+
+
+def to_uci(code: int) -> str:
+    """Returns the UCI string of a packed move, matching Move.uci."""
+    uci = _UCI_CACHE.get(code)
+    if uci is None:
+        offset = BLACK_OFFSET if code & BLACK_FLAG else 0
+        end = SQUARE_NAMES[end_index(code)]
+        drop = drop_type(code)
+        if drop >= 0:
+            uci = f"{PIECES[drop].fen}@{end}"
+        else:
+            promotion = promotion_type(code)
+            suffix = PIECES[offset + promotion].fen if promotion >= 0 else ""
+            uci = SQUARE_NAMES[start_index(code)] + end + suffix
+        _UCI_CACHE[code] = uci
+    return uci
+
+
+def from_uci(uci: str, player_to_move: Color = Color.WHITE) -> int:
+    """Packs a UCI string without building a Move.
+
+    Args:
+        uci: The move in UCI notation, e.g. 'e2e4', 'a7a8q' or 'N@f3'.
+        player_to_move: The color of the player moving.
+
+    Returns:
+        The packed move.
+
+    Raises:
+        ValueError: If the string is not a well-formed UCI move.
+    """
+    black = player_to_move == Color.BLACK
+    if len(uci) == 4 and uci[1] == "@":
+        p_type = piece_from_char.get(uci[0])
+        end = SQUARE_INDEX.get(uci[2:])
+        if p_type is None or end is None:
+            raise ValueError(f"Invalid Drop UCI: {uci}")
+        return pack(0, end, drop=TYPE_INDEX[p_type] + 1, black=black)
+
+    if len(uci) not in (4, 5):
+        raise ValueError(f"Invalid UCI string: {uci}")
+    start = SQUARE_INDEX.get(uci[:2])
+    end = SQUARE_INDEX.get(uci[2:4])
+    if start is None or end is None:
+        raise ValueError(f"Invalid UCI string: {uci}")
+    promotion = 0
+    if len(uci) == 5:
+        p_type = piece_from_char.get(uci[4])
+        if p_type is None:
+            raise ValueError(f"Invalid UCI string: {uci}")
+        promotion = TYPE_INDEX[p_type] + 1
+    return pack(start, end, promotion, black=black)
+
+
+def decode_all(codes: list[int]) -> list[Move]:
+    """Returns the Moves of a list of packed moves."""
+    return [decode(code) for code in codes]
+
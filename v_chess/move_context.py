@@ -0,0 +1,73 @@
+from typing import TYPE_CHECKING
+
+from v_chess.piece.codes import BLACK_OFFSET, COLOR_INDEX, PAWN, PIECES
+
+if TYPE_CHECKING:
+    from v_chess.attacks import AttackInfo
+    from v_chess.game_state import GameState
+    from v_chess.move import Move
+    from v_chess.piece import Piece
+    from v_chess.square import Square
+
+
+class MoveContext:
+    """Facts about a position shared by the validation of many of its moves.
+
+    The piece-at table and occupancy masks are read from the bitboard once,
+    checkers and pins of the side to move come from GameState.attacks. Built
+    by Rules.validate_moves and passed to every move validator, which fall
+    back to the board when called without a context.
+
+    Attributes:
+        state: The position the moves are played from.
+        pieces: The piece on each square index, None for empty squares.
+        occupied: Mask of all occupied squares.
+        own: Mask of the pieces of the side to move.
+        opponent: Mask of the pieces of the other side.
+        attacks: The attack information of the position.
+        king_index: The square of the king of the side to move, None if it
+            has no king or several of them.
+    """
+
+    def __init__(self, state: GameState):
+        """Reads the piece placement of a position.
+
+        Args:
+            state: The position the moves are played from.
+        """
+        self.state = state
+        bb = state.board.bitboard
+        us = COLOR_INDEX[state.turn]
+        self.pieces: list[Piece | None] = [PIECES[code] if code >= 0 else None for code in bb.mailbox]
+        self.occupied = bb.occupied
+        self.own = bb.colors[us]
+        self.opponent = bb.colors[1 - us]
+
+        self.attacks: AttackInfo = state.attacks
+        self.king_index = self.attacks.king_index
+
+    def piece_at(self, square: Square) -> Piece | None:
+        """Returns the piece on a square, None for empty squares and NoneSquare."""
+        index = square.index
+        return self.pieces[index] if index >= 0 else None
+
+    def keeps_king_safe(self, move: Move) -> bool:
+        """Whether a move certainly does not expose the king of the side to move.
+
+        True while not in check for drops and for moves of pieces other than
+        the king that are not pinned or stay on their pin ray. En passant
+        captures remove a second piece from the board and are never
+        answered here. False means the move has to be probed.
+        """
+        if self.king_index is None or self.attacks.checkers:
+            return False
+        if move.is_drop:
+            return True
+        start = move.start.index
+        if start == self.king_index:
+            return False
+        pawn = PIECES[COLOR_INDEX[self.state.turn] * BLACK_OFFSET + PAWN]
+        if move.end == self.state.ep_square and self.pieces[start] is pawn:
+            return False
+        ray = self.attacks.pins.get(start)
+        return ray is None or bool(ray >> move.end.index & 1)
@@ -1,66 +1,76 @@
+import logging
 from typing import TYPE_CHECKING, Optional
-from v_chess.enums import MoveLegalityReason, Color
+from v_chess.bitboard import AttackTables
+from v_chess.enums import MoveLegalityReason, Color, Direction
+from v_chess.game_state import CrazyhouseGameState
+from v_chess.piece import Pawn, Knight, Bishop, Rook, Queen, King
+from v_chess.piece.codes import BLACK_OFFSET, COLOR_INDEX, KING
 
 if TYPE_CHECKING:
     from v_chess.game_state import GameState
     from v_chess.move import Move
+    from v_chess.move_context import MoveContext
     from v_chess.rules import Rules
-    from v_chess.rules.chess960 import Chess960Rules
-    from v_chess.rules.horde import HordeRules
 
-def validate_piece_presence(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+logger = logging.getLogger(__name__)
+
+def _piece_at(state: "GameState", square, context: "MoveContext | None"):
+    """Returns the piece on a square from the move context when given, otherwise from the board."""
+    if context is not None:
+        return context.piece_at(square)
+    return state.board.get_piece(square)
+
+def validate_piece_presence(state: "GameState", move: "Move", rules: "Rules",
+                            context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Ensures a piece exists at the starting square (unless it's a drop)."""
     if move.is_drop:
         return None
-    piece = state.board.get_piece(move.start)
+    piece = _piece_at(state, move.start, context)
     if piece is None:
         return MoveLegalityReason.NO_PIECE
     return None
 
-def validate_turn(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_turn(state: "GameState", move: "Move", rules: "Rules",
+                  context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Ensures the piece being moved belongs to the active player."""
     if move.is_drop:
         if move.player_to_move and move.player_to_move != state.turn:
              return MoveLegalityReason.WRONG_COLOR
         return None
         
-    piece = state.board.get_piece(move.start)
+    piece = _piece_at(state, move.start, context)
     if piece and piece.color != state.turn:
         return MoveLegalityReason.WRONG_COLOR
     return None
 
-def validate_friendly_capture(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_friendly_capture(state: "GameState", move: "Move", rules: "Rules",
+                              context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Ensures the move does not capture a piece of the same color (except castling in 960)."""
-    target = state.board.get_piece(move.end)
+    target = _piece_at(state, move.end, context)
     if target and target.color == state.turn:
-        from v_chess.piece import King, Rook
-        from v_chess.rules.chess960 import Chess960Rules
-        piece = state.board.get_piece(move.start)
+        piece = _piece_at(state, move.start, context)
         if isinstance(piece, King) and isinstance(target, Rook):
-             if isinstance(rules, Chess960Rules):
+             if rules.rule_set.chess960_castling:
                   return None
         
         return MoveLegalityReason.OWN_PIECE_CAPTURE
     return None
 
-def validate_moveset(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_moveset(state: "GameState", move: "Move", rules: "Rules",
+                     context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Checks if the move is physically possible for the piece type (geometry)."""
     if move.is_drop:
         return None
         
-    piece = state.board.get_piece(move.start)
+    piece = _piece_at(state, move.start, context)
     if not piece: return None
     
-    from v_chess.piece import Pawn, King
-    from v_chess.rules.horde import HordeRules
-    from v_chess.rules.chess960 import Chess960Rules
-    
     in_moveset = move.end in piece.theoretical_moves(move.start)
     
     is_pawn_double_push = False
     if isinstance(piece, Pawn):
         is_start_rank = (move.start.row == 6 if piece.color == Color.WHITE else move.start.row == 1)
-        if isinstance(rules, HordeRules) and piece.color == Color.WHITE and move.start.row == 7:
+        if rules.rule_set.horde_pawns and piece.color == Color.WHITE and move.start.row == 7:
             is_start_rank = True
             
         direction = piece.direction
@@ -73,9 +83,8 @@ def validate_moveset(state: "GameState", move: "Move", rules: "Rules") -> Option
     if isinstance(piece, King):
         if abs(move.start.col - move.end.col) == 2:
             is_castling_attempt = True
-        elif isinstance(rules, Chess960Rules):
-            target = state.board.get_piece(move.end)
-            from v_chess.piece import Rook
+        elif rules.rule_set.chess960_castling:
+            target = _piece_at(state, move.end, context)
             if isinstance(target, Rook) and target.color == piece.color:
                 is_castling_attempt = True
     
@@ -83,36 +92,44 @@ def validate_moveset(state: "GameState", move: "Move", rules: "Rules") -> Option
         return MoveLegalityReason.NOT_IN_MOVESET
     return None
 
-def validate_path(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_path(state: "GameState", move: "Move", rules: "Rules",
+                  context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Ensures the path between start and end is not blocked."""
     if move.is_drop:
         return None
         
-    piece = state.board.get_piece(move.start)
+    piece = _piece_at(state, move.start, context)
     if not piece: return None
     
-    from v_chess.piece import Pawn, King, Rook
-    from v_chess.rules.chess960 import Chess960Rules
     if isinstance(piece, King):
          if abs(move.start.col - move.end.col) < 2:
-              if isinstance(rules, Chess960Rules):
-                   target = state.board.get_piece(move.end)
+              if rules.rule_set.chess960_castling:
+                   target = _piece_at(state, move.end, context)
                    if isinstance(target, Rook) and target.color == piece.color:
                         return None
               return None
          elif abs(move.start.col - move.end.col) == 2:
               return None
 
-    from v_chess.piece import Knight
     if isinstance(piece, Knight):
         return None
 
+    if context is not None and isinstance(piece, (Rook, Bishop, Queen)):
+        attacks = 0
+        if not isinstance(piece, Bishop):
+            attacks |= AttackTables.rook_attacks(move.start.index, context.occupied)
+        if not isinstance(piece, Rook):
+            attacks |= AttackTables.bishop_attacks(move.start.index, context.occupied)
+        if not attacks & ~context.own & (1 << move.end.index):
+            return MoveLegalityReason.PATH_BLOCKED
+        return None
+
     if isinstance(piece, Pawn):
         direction = piece.direction
         one_step = move.start.get_step(direction)
         two_step = one_step.get_step(direction) if one_step and not one_step.is_none_square else None
         if move.end == two_step:
-            if state.board.get_piece(one_step) is not None or state.board.get_piece(two_step) is not None:
+            if _piece_at(state, one_step, context) is not None or _piece_at(state, two_step, context) is not None:
                 return MoveLegalityReason.PATH_BLOCKED
             return None
 
@@ -122,14 +139,14 @@ def validate_path(state: "GameState", move: "Move", rules: "Rules") -> Optional[
         
     return None
 
-def validate_pawn_capture(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_pawn_capture(state: "GameState", move: "Move", rules: "Rules",
+                          context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Enforces pawn capture/non-capture rules (Vertical vs Diagonal)."""
-    piece = state.board.get_piece(move.start)
-    from v_chess.piece import Pawn
+    piece = _piece_at(state, move.start, context)
     if not isinstance(piece, Pawn):
         return None
         
-    target = state.board.get_piece(move.end)
+    target = _piece_at(state, move.end, context)
     is_capture = target is not None or move.end == state.ep_square
     
     if move.is_vertical and is_capture:
@@ -140,11 +157,10 @@ def validate_pawn_capture(state: "GameState", move: "Move", rules: "Rules") -> O
         
     return None
 
-def validate_promotion(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_promotion(state: "GameState", move: "Move", rules: "Rules",
+                       context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Ensures pawns promote when and only when they reach the last rank."""
-    piece = state.board.get_piece(move.start)
-    from v_chess.piece import Pawn, King
-    
+    piece = _piece_at(state, move.start, context)
     is_pawn = isinstance(piece, Pawn)
     is_promo_rank = move.end.is_promotion_row(state.turn)
     
@@ -155,98 +171,83 @@ def validate_promotion(state: "GameState", move: "Move", rules: "Rules") -> Opti
         if not is_pawn or not is_promo_rank:
             return MoveLegalityReason.EARLY_PROMOTION
         if isinstance(move.promotion_piece, King):
-            from v_chess.rules.antichess import AntichessRules
-            if not isinstance(rules, AntichessRules):
+            if not rules.rule_set.king_promotion:
                 return MoveLegalityReason.KING_PROMOTION
             
     return None
 
-def validate_standard_castling(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_standard_castling(state: "GameState", move: "Move", rules: "Rules",
+                               context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Validates standard castling (O-O, O-O-O)."""
-    piece = state.board.get_piece(move.start)
-    from v_chess.piece import King
+    piece = _piece_at(state, move.start, context)
     if not (isinstance(piece, King) and abs(move.start.col - move.end.col) == 2):
         return None
         
     reason = rules.castling_legality_reason(state, move, piece)
     return reason if reason != MoveLegalityReason.LEGAL else None
 
-def validate_king_safety(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_king_safety(state: "GameState", move: "Move", rules: "Rules",
+                         context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Ensures the move does not leave the player's own King in check."""
-    from v_chess.piece import King
-    has_king = any(isinstance(p, King) and p.color == state.turn for p in state.board.values())
+    if context is not None and context.keeps_king_safe(move):
+        return None
+    has_king = state.board.bitboard.masks[COLOR_INDEX[state.turn] * BLACK_OFFSET + KING]
     if has_king and rules.king_left_in_check(state, move):
         return MoveLegalityReason.KING_LEFT_IN_CHECK
     return None
 
-def validate_mandatory_capture(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_mandatory_capture(state: "GameState", move: "Move", rules: "Rules",
+                               context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Enforces mandatory captures (e.g., in Antichess)."""
-    from v_chess.piece import Pawn
-    is_capture = state.board.get_piece(move.end) is not None
+    is_capture = _piece_at(state, move.end, context) is not None
     if not is_capture:
-        piece = state.board.get_piece(move.start)
+        piece = _piece_at(state, move.start, context)
         if piece and isinstance(piece, Pawn) and move.end == state.ep_square:
             is_capture = True
-    
-    if is_capture:
+
+    if is_capture or not state.attacks.capture_available:
         return None
-        
-    possible_moves = rules.get_possible_moves(state)
-    for opt_move in possible_moves:
-        if rules.move_pseudo_legality_reason(state, opt_move) == MoveLegalityReason.LEGAL:
-            opt_is_cap = state.board.get_piece(opt_move.end) is not None
-            if not opt_is_cap:
-                opt_piece = state.board.get_piece(opt_move.start)
-                if opt_piece and isinstance(opt_piece, Pawn) and opt_move.end == state.ep_square:
-                    opt_is_cap = True
-            
-            if opt_is_cap:
-                print(f"[VALIDATOR DEBUG] MANDATORY_CAPTURE triggered for move {move.uci}. Found mandatory capture: {opt_move.uci}")
-                return MoveLegalityReason.MANDATORY_CAPTURE
-    
-    return None
 
-def validate_horde_pawn(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+    logger.debug("Mandatory capture available, rejecting %s", move)
+    return MoveLegalityReason.MANDATORY_CAPTURE
+
+def validate_horde_pawn(state: "GameState", move: "Move", rules: "Rules",
+                        context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Handles Horde-specific pawn rules (rank 1 double push)."""
-    from v_chess.piece import Pawn
-    from v_chess.enums import Direction
-    piece = state.board.get_piece(move.start)
+    piece = _piece_at(state, move.start, context)
     if piece and isinstance(piece, Pawn) and piece.color == Color.WHITE:
         if move.start.row == 7:
             one_step = move.start.get_step(Direction.UP)
             two_step = one_step.get_step(Direction.UP) if one_step else None
             if move.end == two_step:
-                if state.board.get_piece(one_step) is None and state.board.get_piece(two_step) is None:
+                if _piece_at(state, one_step, context) is None and _piece_at(state, two_step, context) is None:
                     return None
     return None
 
-def validate_antichess_castling(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_antichess_castling(state: "GameState", move: "Move", rules: "Rules",
+                                context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Explicitly blocks castling in Antichess."""
-    piece = state.board.get_piece(move.start)
-    from v_chess.piece import King
+    piece = _piece_at(state, move.start, context)
     if isinstance(piece, King) and abs(move.start.col - move.end.col) > 1:
         return MoveLegalityReason.CASTLING_DISABLED
     return None
 
-def validate_crazyhouse_drop(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_crazyhouse_drop(state: "GameState", move: "Move", rules: "Rules",
+                             context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Validates piece drops in Crazyhouse."""
     if not move.is_drop:
         return None
-        
-    from v_chess.game_state import CrazyhouseGameState
-    from v_chess.piece import Pawn
-    
+
     if not isinstance(state, CrazyhouseGameState):
         return MoveLegalityReason.NO_PIECE
 
     pocket_idx = 0 if state.turn == Color.WHITE else 1
     pocket = state.pockets[pocket_idx]
 
-    has_piece = any(type(p) == type(move.drop_piece) for p in pocket)
-    if not has_piece:
+    if not pocket.count(type(move.drop_piece)):
         return MoveLegalityReason.NO_PIECE
 
-    if state.board.get_piece(move.end) is not None:
+    if _piece_at(state, move.end, context) is not None:
         return MoveLegalityReason.PATH_BLOCKED
 
     if isinstance(move.drop_piece, Pawn) and (move.end.row == 0 or move.end.row == 7):
@@ -254,73 +255,64 @@ def validate_crazyhouse_drop(state: "GameState", move: "Move", rules: "Rules") -
 
     return None
 
-def validate_atomic_move(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_atomic_move(state: "GameState", move: "Move", rules: "Rules",
+                         context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Enforces Atomic-specific move constraints."""
-    from v_chess.piece import King, Pawn
-    from v_chess.enums import Direction
-    from dataclasses import replace
-    
-    piece = state.board.get_piece(move.start)
+    piece = _piece_at(state, move.start, context)
     if isinstance(piece, King):
-        if state.board.get_piece(move.end) or move.end == state.ep_square:
+        if _piece_at(state, move.end, context) or move.end == state.ep_square:
             return MoveLegalityReason.OWN_PIECE_CAPTURE
 
-    sim_board = state.board.copy()
-    sim_board.move_piece(piece, move.start, move.end)
-    
-    is_ep = isinstance(piece, Pawn) and move.end == state.ep_square
-    if is_ep:
-        d = Direction.DOWN if piece.color == Color.WHITE else Direction.UP
-        sim_board.remove_piece(move.end.adjacent(d))
-        
-    dummy_next = replace(state, board=sim_board, turn=state.turn.opposite)
-    final_state = rules.post_move_actions(state, move, dummy_next)
-    
-    own_king_exists = any(isinstance(p, King) and p.color == state.turn 
-                          for p in final_state.board.values())
-
-    if not own_king_exists:
-        return MoveLegalityReason.KING_EXPLODED
-
-    opp_king_exists = any(isinstance(p, King) and p.color == state.turn.opposite 
-                           for p in final_state.board.values())
-
-    if not opp_king_exists:
-        return None
+    # Probe the explosion in place and restore the shared board afterwards.
+    board = state.board
+    bb = board.bitboard
+    us = COLOR_INDEX[state.turn]
+    undo = board.push(move, state.ep_square, explode=True)
+    try:
+        own_king = bb.masks[us * BLACK_OFFSET + KING]
+        if not own_king:
+            return MoveLegalityReason.KING_EXPLODED
+
+        opp_king = bb.masks[(1 - us) * BLACK_OFFSET + KING]
+        if not opp_king:
+            return None
 
-    if rules.inactive_player_in_check(final_state):
-         return MoveLegalityReason.KING_LEFT_IN_CHECK
+        kings = own_king
+        while kings:
+            if bb.is_attacked((kings & -kings).bit_length() - 1, state.turn.opposite):
+                return MoveLegalityReason.KING_LEFT_IN_CHECK
+            kings &= kings - 1
 
-    wk = [sq for sq, p in final_state.board.items() if isinstance(p, King) and p.color == Color.WHITE]
-    bk = [sq for sq, p in final_state.board.items() if isinstance(p, King) and p.color == Color.BLACK]
-    if wk and bk and wk[0].is_adjacent_to(bk[0]):
-        return MoveLegalityReason.KING_EXPLODED
+        own_idx = (own_king & -own_king).bit_length() - 1
+        if AttackTables.king_attacks(own_idx) & opp_king:
+            return MoveLegalityReason.KING_EXPLODED
+    finally:
+        board.pop(undo)
 
     return None
 
-def validate_racing_kings_move(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_racing_kings_move(state: "GameState", move: "Move", rules: "Rules",
+                               context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Enforces Racing Kings constraints."""
-    next_state = rules.apply_move(state, move)
-    
-    if rules.is_check(next_state):
-        print(f"[VALIDATOR DEBUG] RACING_KINGS GIVES_CHECK for move {move.uci}")
+    if rules.gives_check(state, move):
         return MoveLegalityReason.GIVES_CHECK
 
-    if rules.inactive_player_in_check(next_state):
-         print(f"[VALIDATOR DEBUG] RACING_KINGS KING_LEFT_IN_CHECK for move {move.uci}")
-         return MoveLegalityReason.KING_LEFT_IN_CHECK
-         
+    if context is not None and context.keeps_king_safe(move):
+        return None
+    if rules.king_left_in_check(state, move):
+        return MoveLegalityReason.KING_LEFT_IN_CHECK
+
     return None
 
-def validate_chess960_castling(state: "GameState", move: "Move", rules: "Rules") -> Optional[MoveLegalityReason]:
+def validate_chess960_castling(state: "GameState", move: "Move", rules: "Rules",
+                               context: "MoveContext | None" = None) -> Optional[MoveLegalityReason]:
     """Validates 960-specific castling."""
-    piece = state.board.get_piece(move.start)
-    from v_chess.piece import King, Rook
+    piece = _piece_at(state, move.start, context)
     if not isinstance(piece, King):
         return None
         
     is_castling = abs(move.start.col - move.end.col) > 1
-    target = state.board.get_piece(move.end)
+    target = _piece_at(state, move.end, context)
     if isinstance(target, Rook) and target.color == piece.color:
         is_castling = True
         
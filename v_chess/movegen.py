@@ -0,0 +1,304 @@
+from typing import TYPE_CHECKING, Iterator
+
+from v_chess.bitboard import AttackTables
+from v_chess.enums import Color, MoveLegalityReason
+from v_chess.game_state import CrazyhouseGameState
+from v_chess.move import Move
+from v_chess.move_codes import (
+    BLACK_FLAG, DROP_SHIFT, PROMOTION_SHIFT, TO_SHIFT, SQUARE_MASK, SQUARES, decode, decode_all,
+)
+from v_chess.piece import Rook
+from v_chess.pocket import FEN_ORDER
+from v_chess.special_moves import crazyhouse_drops
+from v_chess.piece.codes import (
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING, BLACK_OFFSET, COLOR_INDEX, PIECES,
+)
+
+if TYPE_CHECKING:
+    from v_chess.game_state import GameState
+    from v_chess.rules import Rules
+
+FULL_MASK = (1 << 64) - 1
+RANK_1 = 0xFF << 56
+RANK_8 = 0xFF
+# Promotion field values (type index + 1) in the order moves are emitted.
+PROMOTION_FIELDS = tuple((idx + 1) << PROMOTION_SHIFT for idx in (QUEEN, ROOK, BISHOP, KNIGHT))
+
+
+def _bit_indices(mask: int):
+    """Yields the indices of the set bits of mask, lowest first."""
+    while mask:
+        bit = mask & -mask
+        yield bit.bit_length() - 1
+        mask ^= bit
+
+
+def between(a: int, b: int) -> int:
+    """Returns the squares strictly between two aligned squares, or 0."""
+    bit_a, bit_b = 1 << a, 1 << b
+    ortho = AttackTables.rook_attacks(a, bit_b)
+    if ortho & bit_b:
+        return ortho & AttackTables.rook_attacks(b, bit_a)
+    diag = AttackTables.bishop_attacks(a, bit_b)
+    if diag & bit_b:
+        return diag & AttackTables.bishop_attacks(b, bit_a)
+    return 0
+
+
+def checkers(state: GameState, king_idx: int) -> int:
+    """Returns the mask of enemy pieces attacking the king on king_idx."""
+    bb = state.board.bitboard
+    us = COLOR_INDEX[state.turn]
+    masks = bb.masks
+    theirs = (1 - us) * BLACK_OFFSET
+    occ = bb.occupied
+    queens = masks[theirs + QUEEN]
+    return (
+        (AttackTables._KNIGHT_ATTACKS[king_idx] & masks[theirs + KNIGHT])
+        | (AttackTables._PAWN_ATTACKS[us][king_idx] & masks[theirs + PAWN])
+        | (AttackTables._KING_ATTACKS[king_idx] & masks[theirs + KING])
+        | (AttackTables.rook_attacks(king_idx, occ) & (masks[theirs + ROOK] | queens))
+        | (AttackTables.bishop_attacks(king_idx, occ) & (masks[theirs + BISHOP] | queens))
+    )
+
+
+def pins(state: GameState, king_idx: int) -> dict[int, int]:
+    """Finds the pieces of the side to move pinned to their king.
+
+    Returns:
+        A mapping of pinned square index to the ray (including the pinner)
+        the piece may still move along.
+    """
+    bb = state.board.bitboard
+    us = COLOR_INDEX[state.turn]
+    masks = bb.masks
+    theirs = (1 - us) * BLACK_OFFSET
+    opp_occ = bb.colors[1 - us]
+    own_occ = bb.colors[us]
+    queens = masks[theirs + QUEEN]
+
+    # Sliding from the king through our own pieces finds the potential pinners.
+    snipers = (
+        (AttackTables.rook_attacks(king_idx, opp_occ) & (masks[theirs + ROOK] | queens))
+        | (AttackTables.bishop_attacks(king_idx, opp_occ) & (masks[theirs + BISHOP] | queens))
+    )
+
+    pinned = {}
+    for sniper in _bit_indices(snipers):
+        ray = between(king_idx, sniper)
+        blockers = ray & bb.occupied
+        if blockers and not (blockers & (blockers - 1)) and blockers & own_occ:
+            pinned[blockers.bit_length() - 1] = ray | (1 << sniper)
+    return pinned
+
+
+def _is_castling_attempt(state: GameState, move: Move, rules: Rules) -> bool:
+    """Mirrors the validators' notion of a castling move."""
+    if abs(move.start.col - move.end.col) > 1:
+        return True
+    if rules.rule_set.chess960_castling:
+        target = state.board.get_piece(move.end)
+        return isinstance(target, Rook) and target.color == state.turn
+    return False
+
+
+def generate_legal_moves(rules: Rules, state: GameState) -> list[Move] | None:
+    """Generates the legal moves of a position without the validator pipeline.
+
+    See generate_legal_codes, the packed moves are converted to shared
+    Move instances.
+
+    Returns:
+        The legal moves, or None when the caller should fall back to the
+        pipeline.
+    """
+    codes = generate_legal_codes(rules, state)
+    return decode_all(codes) if codes is not None else None
+
+
+def generate_legal_codes(rules: Rules, state: GameState) -> list[int] | None:
+    """Generates the legal moves of a position as packed ints.
+
+    See iter_legal_codes, all stages are collected into one list.
+
+    Returns:
+        The legal moves packed as in v_chess.move_codes, or None when the
+        position has several kings of the side to move and the caller
+        should fall back to the pipeline.
+    """
+    codes = iter_legal_codes(rules, state)
+    return list(codes) if codes is not None else None
+
+
+def iter_legal_codes(rules: Rules, state: GameState) -> Iterator[int] | None:
+    """Lazily generates the legal moves of a position as packed ints.
+
+    Moves are produced in stages: king moves, captures, quiet moves and
+    drops, so callers that only need one legal move usually stop after
+    the king or capture stage. Checkers, pinned pieces and the check
+    evasion mask are computed once after the king stage, after which every
+    emitted move is legal under standard king safety. Castling and
+    non-Crazyhouse global moves are rare enough that their candidates are
+    still confirmed by rules.validate_move, and en passant is probed on the
+    board because it can expose the king along the rank.
+
+    Args:
+        rules: Rules whose legality is "do not leave your king in check".
+        state: The position to generate moves for.
+
+    Returns:
+        An iterator of the legal moves packed as in v_chess.move_codes, or
+        None when the position has several kings of the side to move and
+        the caller should fall back to the pipeline.
+    """
+    kings = state.board.bitboard.masks[COLOR_INDEX[state.turn] * BLACK_OFFSET + KING]
+    if kings & (kings - 1):
+        return None
+    return _staged_codes(rules, state)
+
+
+def _staged_codes(rules: Rules, state: GameState) -> Iterator[int]:
+    """Yields the legal moves of a single-king position, see iter_legal_codes."""
+    rule_set = rules.rule_set
+    bb = state.board.bitboard
+    turn = state.turn
+    them = turn.opposite
+    us = COLOR_INDEX[turn]
+    masks = bb.masks
+    ours = us * BLACK_OFFSET
+    occ = bb.occupied
+    own_occ = bb.colors[us]
+    opp_occ = bb.colors[1 - us]
+    targets = FULL_MASK & ~own_occ
+    flag = BLACK_FLAG if us else 0
+    kings = masks[ours + KING]
+
+    # Stage 1: king steps, legal whenever the target is not attacked.
+    king_idx = -1
+    king_codes: set[int] = set()
+    if kings:
+        king_idx = kings.bit_length() - 1
+        occ_without_king = occ ^ kings
+        code = king_idx | flag
+        for to in _bit_indices(AttackTables._KING_ATTACKS[king_idx] & targets):
+            if not bb.is_attacked(to, them, occ_without_king):
+                king_codes.add(code | (to << TO_SHIFT))
+                yield code | (to << TO_SHIFT)
+
+    evasion = FULL_MASK
+    pinned: dict[int, int] = {}
+    if kings:
+        attacks = state.attacks
+        checking = attacks.checkers
+        if checking & (checking - 1):
+            evasion = 0
+        elif checking:
+            evasion = checking | between(king_idx, checking.bit_length() - 1)
+        pinned = attacks.pins
+
+    # Stage 2: captures. Quiet targets are kept for stage 3.
+    quiet: list[tuple[int, int]] = []
+
+    pawns = masks[ours + PAWN]
+    if pawns:
+        pawn_attacks = AttackTables._PAWN_ATTACKS[us]
+        step = -8 if turn == Color.WHITE else 8
+        promotion_rank = RANK_8 if turn == Color.WHITE else RANK_1
+        start_row = 6 if turn == Color.WHITE else 1
+        horde_row = 7 if turn == Color.WHITE and rule_set.horde_pawns else None
+        ep_idx = -1
+        if state.ep_square is not None and not state.ep_square.is_none_square:
+            if not occ & (1 << state.ep_square.index):
+                ep_idx = state.ep_square.index
+
+        for sq in _bit_indices(pawns):
+            allowed = evasion & pinned.get(sq, FULL_MASK)
+            pushes = 0
+
+            one = sq + step
+            if 0 <= one < 64 and not occ & (1 << one):
+                pushes |= 1 << one
+                row = sq >> 3
+                if row == start_row or row == horde_row:
+                    two = one + step
+                    if 0 <= two < 64 and not occ & (1 << two):
+                        pushes |= 1 << two
+            if pushes & allowed:
+                quiet.append((sq | flag, pushes & allowed))
+
+            for to in _bit_indices(pawn_attacks[sq] & opp_occ & allowed):
+                code = sq | (to << TO_SHIFT) | flag
+                if (1 << to) & promotion_rank:
+                    for promotion in PROMOTION_FIELDS:
+                        yield code | promotion
+                else:
+                    yield code
+
+            if ep_idx >= 0 and pawn_attacks[sq] & (1 << ep_idx):
+                code = sq | (ep_idx << TO_SHIFT) | flag
+                move = decode(code)
+                if king_idx < 0 or not bb.is_king_attacked_after_move(move, turn, state.board, state.ep_square):
+                    yield code
+
+    for p_type in (KNIGHT, BISHOP, ROOK, QUEEN):
+        for sq in _bit_indices(masks[ours + p_type]):
+            if p_type == KNIGHT:
+                if sq in pinned:
+                    continue
+                dests = AttackTables._KNIGHT_ATTACKS[sq]
+            elif p_type == BISHOP:
+                dests = AttackTables.bishop_attacks(sq, occ)
+            elif p_type == ROOK:
+                dests = AttackTables.rook_attacks(sq, occ)
+            else:
+                dests = AttackTables.queen_attacks(sq, occ)
+
+            dests &= targets & evasion & pinned.get(sq, FULL_MASK)
+            code = sq | flag
+            for to in _bit_indices(dests & opp_occ):
+                yield code | (to << TO_SHIFT)
+            if dests & ~opp_occ:
+                quiet.append((code, dests & ~opp_occ))
+
+    # Stage 3: quiet moves and castling.
+    promotion_ranks = RANK_1 | RANK_8
+    for code, dests in quiet:
+        is_pawn = masks[ours + PAWN] & (1 << (code & SQUARE_MASK))
+        for to in _bit_indices(dests):
+            if is_pawn and (1 << to) & promotion_ranks:
+                for promotion in PROMOTION_FIELDS:
+                    yield code | (to << TO_SHIFT) | promotion
+            else:
+                yield code | (to << TO_SHIFT)
+
+    if kings and rule_set.has_castling:
+        king = PIECES[ours + KING]
+        for rule in rule_set.piece_move_rules:
+            for move in rule(state, SQUARES[king_idx], king):
+                if not _is_castling_attempt(state, move, rules) or move.code in king_codes:
+                    continue
+                if rules.validate_move(state, move) == MoveLegalityReason.LEGAL:
+                    king_codes.add(move.code)
+                    yield move.code
+
+    # Stage 4: global moves (drops)
+    for rule in rule_set.global_move_rules:
+        if rule is crazyhouse_drops:
+            if not isinstance(state, CrazyhouseGameState):
+                continue
+            counts = state.pockets[us].counts
+            drop_fields = [(type_idx + 1) << DROP_SHIFT for type_idx in FEN_ORDER if counts[type_idx]]
+            pawn_field = (PAWN + 1) << DROP_SHIFT
+            empty = FULL_MASK & ~occ & evasion
+            for to in _bit_indices(empty):
+                back_rank = (1 << to) & (RANK_1 | RANK_8)
+                code = (to << TO_SHIFT) | flag
+                for field in drop_fields:
+                    if field == pawn_field and back_rank:
+                        continue
+                    yield code | field
+            continue
+
+        for move in rule(state):
+            if rules.validate_move(state, move) == MoveLegalityReason.LEGAL:
+                yield move.code
@@ -0,0 +1,72 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from v_chess.enums import Color, GameOverReason
+from v_chess.position_cache import position_cache
+
+if TYPE_CHECKING:
+    from v_chess.game_state import GameState
+    from v_chess.rules import Rules
+
+
+@dataclass(frozen=True)
+class MoveOutcome:
+    """Status of a position, computed once when it is reached.
+
+    Attributes:
+        is_check: Whether the side to move is in check.
+        game_over_reason: Why the game ended, ONGOING if it continues.
+        winner: The winning color, None for a draw or an ongoing game.
+        san: The SAN of the move that led to the position, including check,
+            mate and draw offer suffixes, or None for a starting position.
+    """
+    is_check: bool
+    game_over_reason: GameOverReason
+    winner: Color | None = None
+    san: str | None = None
+
+    @property
+    def is_over(self) -> bool:
+        """Whether the game has ended."""
+        return self.game_over_reason != GameOverReason.ONGOING
+
+    @property
+    def result(self) -> str | None:
+        """The PGN result of a finished game, None while it continues."""
+        if not self.is_over:
+            return None
+        if self.winner == Color.WHITE:
+            return "1-0"
+        if self.winner == Color.BLACK:
+            return "0-1"
+        return "1/2-1/2"
+
+
+def evaluate_outcome(rules: Rules, state: GameState) -> MoveOutcome:
+    """Runs the check and game over queries of a position once.
+
+    Args:
+        rules: The variant rules.
+        state: The position.
+
+    Returns:
+        The outcome of the position, without SAN.
+    """
+    reason = rules.get_game_over_reason(state)
+    winner = rules.get_winner(state) if reason != GameOverReason.ONGOING else None
+    return MoveOutcome(position_cache.is_check(rules, state), reason, winner)
+
+
+def outcome_of(rules: Rules, state: GameState) -> MoveOutcome:
+    """Returns the outcome stored on a state, evaluating and storing it if missing.
+
+    Args:
+        rules: The variant rules.
+        state: The position.
+
+    Returns:
+        The outcome of the position.
+    """
+    if state.outcome is None:
+        state.set_outcome(evaluate_outcome(rules, state))
+    return state.outcome
@@ -0,0 +1,263 @@
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+from v_chess.game_state import GameState
+from v_chess.move import Move
+from v_chess.rules import Rules, RULES_MAP
+
+
+@dataclass(frozen=True)
+class PerftPosition:
+    """A reference position with known perft node counts.
+
+    Attributes:
+        name: Short human readable label.
+        variant: Key into RULES_MAP.
+        fen: The position to search from.
+        nodes: Known leaf counts, nodes[d - 1] being the count at depth d.
+        xfail: Depths the engine is known to miscount because of an open
+            bug; the suite reports them without failing.
+    """
+    name: str
+    variant: str
+    fen: str
+    nodes: tuple[int, ...]
+    xfail: tuple[int, ...] = ()
+
+
+@dataclass(frozen=True)
+class PerftResult:
+    """Outcome of a single perft run.
+
+    Attributes:
+        nodes: Number of leaf nodes counted.
+        seconds: Wall clock time spent counting.
+    """
+    nodes: int
+    seconds: float
+
+    @property
+    def nps(self) -> float:
+        """Leaf nodes counted per second."""
+        return self.nodes / self.seconds if self.seconds > 0 else 0.0
+
+
+PERFT_SUITE: tuple[PerftPosition, ...] = (
+    PerftPosition(
+        "startpos", "standard",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        (20, 400, 8902),
+    ),
+    PerftPosition(
+        "kiwipete", "standard",
+        "r3k2r/p1ppqpb1/bn2pnp1/3PN3/1p2P3/2N2Q1p/PPPBBPPP/R3K2R w KQkq - 0 1",
+        (48, 2039, 97862),
+    ),
+    PerftPosition(
+        "endgame-ep", "standard",
+        "8/2p5/3p4/KP5r/1R3p1k/8/4P1P1/8 w - - 0 1",
+        (14, 191, 2812),
+    ),
+    PerftPosition(
+        "promotions", "standard",
+        "r3k2r/Pppp1ppp/1b3nbN/nP6/BBP1P3/q4N2/Pp1P2PP/R2Q1RK1 w kq - 0 1",
+        (6, 264, 9467),
+    ),
+    PerftPosition(
+        "bqnb", "chess960",
+        "bqnb1rkr/pp3ppp/3ppn2/2p5/5P2/P2P4/NPP1P1PP/BQ1BNRKR w HFhf - 2 9",
+        (21, 528),
+    ),
+    PerftPosition(
+        "startpos", "crazyhouse",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR[] w KQkq - 0 1",
+        (20, 400, 8902),
+    ),
+    PerftPosition(
+        "pawn-pockets", "crazyhouse",
+        "2k5/8/8/8/8/8/8/K7[PPPPPPPPpppppppp] w - - 0 1",
+        (51, 2549),
+    ),
+    PerftPosition(
+        "two-knights", "crazyhouse",
+        "r1bqkb1r/pppp1ppp/2n2n2/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R[Pp] w KQkq - 0 4",
+        (56, 3196, 132102),
+    ),
+    # Atomic castling may pass through the f1 bishop, counting 8942 at depth 3.
+    PerftPosition(
+        "startpos", "atomic",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        (20, 400, 8902),
+        xfail=(3,),
+    ),
+    PerftPosition(
+        "middlegame", "atomic",
+        "r4rk1/ppp2ppp/2n5/3pq3/3Pn3/2P2N2/PP1Q1PPP/R3R1K1 w - - 0 12",
+        (34, 1467),
+    ),
+    PerftPosition(
+        "startpos", "horde",
+        "rnbqkbnr/pppppppp/8/1PP2PP1/PPPPPPPP/PPPPPPPP/PPPPPPPP/PPPPPPPP w kq - 0 1",
+        (8, 128, 1274),
+    ),
+    PerftPosition(
+        "startpos", "antichess",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1",
+        (20, 400, 8067),
+    ),
+    PerftPosition(
+        "pawns", "antichess",
+        "8/1p6/8/8/8/8/P7/8 w - - 0 1",
+        (2, 4, 4),
+    ),
+    PerftPosition(
+        "startpos", "racingkings",
+        "8/8/8/8/8/8/krbnNBRK/qrbnNBRQ w - - 0 1",
+        (21, 421, 11264),
+    ),
+    PerftPosition(
+        "bishop", "racingkings",
+        "8/8/8/8/3K4/8/1k6/b7 w - - 0 1",
+        (7, 39, 227),
+    ),
+    PerftPosition(
+        "startpos", "kingofthehill",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1",
+        (20, 400, 8902),
+    ),
+    PerftPosition(
+        "startpos", "threecheck",
+        "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w KQkq - 0 1 +0+0",
+        (20, 400, 8902),
+    ),
+    PerftPosition(
+        "italian", "threecheck",
+        "r1bqkbnr/pppp1ppp/2n5/4p3/2B1P3/8/PPPP1PPP/RNBQK1NR w KQkq - 2 3 +1+0",
+        (33, 991),
+    ),
+)
+
+
+def legal_moves(rules: Rules, state: GameState) -> list[Move]:
+    """Returns the legal moves of a position using the rules pipeline.
+
+    Args:
+        rules: The variant rules.
+        state: The position to generate moves for.
+
+    Returns:
+        All candidate moves accepted by Rules.validate_move.
+    """
+    return Rules.legal_moves(rules, state)
+
+
+def perft(rules: Rules, state: GameState, depth: int) -> int:
+    """Counts the leaf nodes of the legal move tree to a fixed depth.
+
+    Terminal positions are not special cased, the count only reflects
+    move generation, validation and application.
+
+    Args:
+        rules: The variant rules.
+        state: The root position.
+        depth: Number of plies to search.
+
+    Returns:
+        The number of leaf nodes.
+    """
+    if depth <= 0:
+        return 1
+
+    moves = rules.legal_moves(state)
+    if depth == 1:
+        return len(moves)
+
+    return sum(perft(rules, rules.apply_move(state, move), depth - 1) for move in moves)
+
+
+def _divide_worker(variant: str, fen: str, uci: str, depth: int) -> int:
+    """Counts the subtree below a single root move in a worker process."""
+    rules = RULES_MAP[variant]()
+    state = GameState.from_fen(fen)
+    move = Move(uci, player_to_move=state.turn)
+    return perft(rules, rules.apply_move(state, move), depth - 1)
+
+
+def divide(variant: str, fen: str, depth: int, processes: int | None = None) -> dict[str, int]:
+    """Counts leaf nodes per root move.
+
+    Args:
+        variant: Key into RULES_MAP.
+        fen: The root position.
+        depth: Number of plies to search, including the root move.
+        processes: Size of the process pool used to split the root moves.
+            Runs in-process when None or 1.
+
+    Returns:
+        A mapping of root move UCI to the leaf count below it.
+    """
+    rules = RULES_MAP[variant]()
+    state = GameState.from_fen(fen)
+    moves = [move.uci for move in rules.legal_moves(state)]
+
+    if depth <= 1:
+        return {uci: 1 for uci in moves}
+
+    if processes is None or processes <= 1:
+        counts = [_divide_worker(variant, fen, uci, depth) for uci in moves]
+    else:
+        with ProcessPoolExecutor(max_workers=processes) as pool:
+            counts = list(pool.map(
+                _divide_worker,
+                [variant] * len(moves), [fen] * len(moves), moves, [depth] * len(moves),
+            ))
+
+    return dict(zip(moves, counts))
+
+
+def run_perft(variant: str, fen: str, depth: int, processes: int | None = None) -> PerftResult:
+    """Runs a timed perft, optionally split over a process pool.
+
+    Args:
+        variant: Key into RULES_MAP.
+        fen: The root position.
+        depth: Number of plies to search.
+        processes: Size of the process pool, see divide().
+
+    Returns:
+        The node count and elapsed time.
+    """
+    start = time.perf_counter()
+    if processes is not None and processes > 1 and depth > 1:
+        nodes = sum(divide(variant, fen, depth, processes).values())
+    else:
+        rules = RULES_MAP[variant]()
+        nodes = perft(rules, GameState.from_fen(fen), depth)
+    return PerftResult(nodes, time.perf_counter() - start)
+
+
+def run_suite(
+    max_depth: int | None = None,
+    processes: int | None = None,
+    variants: list[str] | None = None,
+) -> list[tuple[PerftPosition, int, PerftResult]]:
+    """Runs the reference suite and reports every (position, depth) pair.
+
+    Args:
+        max_depth: Upper bound on the depth searched for each position.
+        processes: Size of the process pool, see divide().
+        variants: Restrict the suite to these RULES_MAP keys.
+
+    Returns:
+        A list of (position, depth, result) tuples. A result is correct when
+        result.nodes == position.nodes[depth - 1].
+    """
+    results = []
+    for position in PERFT_SUITE:
+        if variants and position.variant not in variants:
+            continue
+        depths = len(position.nodes) if max_depth is None else min(max_depth, len(position.nodes))
+        for depth in range(1, depths + 1):
+            results.append((position, depth, run_perft(position.variant, position.fen, depth, processes)))
+    return results
@@ -0,0 +1,47 @@
+from v_chess.enums import Color
+from .piece import Piece
+from .pawn import Pawn
+from .knight import Knight
+from .bishop import Bishop
+from .rook import Rook
+from .queen import Queen
+from .king import King
+
+# Integer piece codes index the flat mask list of a Bitboard:
+# code = color index * 6 + type index, White first.
+PAWN, KNIGHT, BISHOP, ROOK, QUEEN, KING = range(6)
+WHITE, BLACK = 0, 1
+BLACK_OFFSET = 6
+NUM_CODES = 12
+
+PIECE_TYPES: tuple[type[Piece], ...] = (Pawn, Knight, Bishop, Rook, Queen, King)
+COLORS: tuple[Color, Color] = (Color.WHITE, Color.BLACK)
+
+TYPE_INDEX: dict[type[Piece], int] = {p_type: idx for idx, p_type in enumerate(PIECE_TYPES)}
+COLOR_INDEX: dict[Color, int] = {Color.WHITE: WHITE, Color.BLACK: BLACK}
+
+CODE_TYPES: tuple[type[Piece], ...] = PIECE_TYPES * 2
+CODE_COLORS: tuple[Color, ...] = (Color.WHITE,) * 6 + (Color.BLACK,) * 6
+
+
+def piece_code(p_type: type[Piece], color: Color) -> int:
+    """Returns the integer code of a piece type and color."""
+    return COLOR_INDEX[color] * BLACK_OFFSET + TYPE_INDEX[p_type]
+
+
+def code_of(piece: Piece) -> int:
+    """Returns the integer code of a piece instance."""
+    return COLOR_INDEX[piece.color] * BLACK_OFFSET + TYPE_INDEX[type(piece)]
+
+
+# The interned piece instances, indexed by piece code.
+PIECES: tuple[Piece, ...] = tuple(p_type(color) for color in COLORS for p_type in PIECE_TYPES)
+PIECE_FROM_FEN: dict[str, Piece] = {piece.fen: piece for piece in PIECES}
+# The FEN letter of each piece code, and the piece code of each FEN letter.
+FEN_CHARS: tuple[str, ...] = tuple(piece.fen for piece in PIECES)
+CODE_FROM_FEN: dict[str, int] = {char: code for code, char in enumerate(FEN_CHARS)}
+
+
+def piece_for(p_type: type[Piece], color: Color) -> Piece:
+    """Returns the interned piece of a type and color without constructing it."""
+    return PIECES[COLOR_INDEX[color] * BLACK_OFFSET + TYPE_INDEX[p_type]]
@@ -16,6 +16,25 @@ class Piece(ABC):
     """
     color: Color
     MAX_STEPS = 7
+    _instances = {}
+
+    def __new__(cls, color: Color):
+        """Returns the shared instance of this piece type and color.
+
+        Pieces are immutable and fully described by their class and color,
+        so there is one instance of each and they can be compared by
+        identity.
+        """
+        key = (cls, color)
+        instance = Piece._instances.get(key)
+        if instance is None:
+            instance = super().__new__(cls)
+            Piece._instances[key] = instance
+        return instance
+
+    def __reduce__(self):
+        """Pickles and copies through the constructor to keep instances shared."""
+        return type(self), (self.color,)
 
     @property
     @abstractmethod
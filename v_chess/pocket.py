@@ -0,0 +1,99 @@
+from dataclasses import dataclass
+from typing import Iterable, Iterator
+
+from v_chess.enums import Color
+from v_chess.piece import Piece
+from v_chess.piece.codes import (
+    PAWN, KNIGHT, BISHOP, ROOK, QUEEN, BLACK_OFFSET, COLOR_INDEX, PIECES, TYPE_INDEX,
+)
+
+# One slot per droppable piece type, indexed by type index (pawn to queen).
+POCKET_SLOTS = 5
+EMPTY_COUNTS: tuple[int, ...] = (0,) * POCKET_SLOTS
+# Order pieces are listed in, alphabetical by FEN letter as captures were
+# always filed, so serialized pockets keep their established form.
+FEN_ORDER: tuple[int, ...] = (BISHOP, KNIGHT, PAWN, QUEEN, ROOK)
+
+
+@dataclass(frozen=True)
+class Pocket:
+    """The pieces a Crazyhouse player holds in hand, as a count per piece type.
+
+    Behaves as a read-only sequence of the held pieces in FEN order, so
+    len() and indexing work as they did on piece tuples.
+
+    Attributes:
+        color: The color of the player holding the pieces.
+        counts: The number of pawns, knights, bishops, rooks and queens held,
+            indexed by type index.
+    """
+    color: Color
+    counts: tuple[int, ...] = EMPTY_COUNTS
+
+    @classmethod
+    def from_pieces(cls, color: Color, pieces: Iterable[Piece]) -> Pocket:
+        """Counts the droppable pieces of an iterable; kings are ignored.
+
+        Args:
+            color: The color of the player holding the pieces.
+            pieces: The pieces in hand, of any color.
+
+        Returns:
+            The pocket.
+        """
+        counts = [0] * POCKET_SLOTS
+        for piece in pieces:
+            type_idx = TYPE_INDEX[type(piece)]
+            if type_idx < POCKET_SLOTS:
+                counts[type_idx] += 1
+        return cls(color, tuple(counts))
+
+    def count(self, p_type: type[Piece]) -> int:
+        """Returns how many pieces of a type are held, 0 for kings."""
+        type_idx = TYPE_INDEX[p_type]
+        return self.counts[type_idx] if type_idx < POCKET_SLOTS else 0
+
+    def add(self, type_idx: int) -> Pocket:
+        """Returns the pocket with one more piece of a type index."""
+        counts = list(self.counts)
+        counts[type_idx] += 1
+        return Pocket(self.color, tuple(counts))
+
+    def remove(self, type_idx: int) -> Pocket:
+        """Returns the pocket with one piece of a type index taken out.
+
+        Raises:
+            ValueError: If no piece of the type is held.
+        """
+        if not self.counts[type_idx]:
+            raise ValueError("No piece of this type in the pocket.")
+        counts = list(self.counts)
+        counts[type_idx] -= 1
+        return Pocket(self.color, tuple(counts))
+
+    @property
+    def pieces(self) -> tuple[Piece, ...]:
+        """The held pieces in FEN order."""
+        base = COLOR_INDEX[self.color] * BLACK_OFFSET
+        return tuple(
+            PIECES[base + type_idx]
+            for type_idx in FEN_ORDER
+            for _ in range(self.counts[type_idx])
+        )
+
+    @property
+    def fen(self) -> str:
+        """The held pieces as FEN letters, in FEN order."""
+        return "".join(piece.fen for piece in self.pieces)
+
+    def __len__(self) -> int:
+        return sum(self.counts)
+
+    def __iter__(self) -> Iterator[Piece]:
+        return iter(self.pieces)
+
+    def __getitem__(self, index):
+        return self.pieces[index]
+
+
+EMPTY_POCKETS: tuple[Pocket, Pocket] = (Pocket(Color.WHITE), Pocket(Color.BLACK))
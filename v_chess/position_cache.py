@@ -0,0 +1,207 @@
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Callable, Mapping
+
+from v_chess.enums import GameOverReason
+
+if TYPE_CHECKING:
+    from v_chess.game_state import GameState
+    from v_chess.move import Move
+    from v_chess.rules import Rules
+
+DEFAULT_CACHE_SIZE = 4096
+
+
+@dataclass
+class CacheEntry:
+    """Results computed for one position under one set of rules.
+
+    Attributes:
+        legal_moves: The legal moves, or None if not computed yet.
+        has_legal_moves: Whether any legal move exists, or None if not computed yet.
+        is_check: Whether the side to move is in check, or None if not computed yet.
+        san_index: The legal moves keyed by SAN without disambiguation, see
+            v_chess.san.san_index, or None if not computed yet.
+        game_over: Game over reasons keyed by (repetition count, halfmove clock),
+            the counters the Zobrist key does not cover.
+    """
+    legal_moves: tuple[Move, ...] | None = None
+    has_legal_moves: bool | None = None
+    is_check: bool | None = None
+    san_index: Mapping[str, tuple[Move, ...]] | None = None
+    game_over: dict[tuple[int, int], GameOverReason] = field(default_factory=dict)
+
+
+class PositionCache:
+    """Bounded LRU cache of legal moves and game status shared by all games.
+
+    Entries are keyed by the rules class and the Zobrist key of the
+    position, so common positions such as variant starting positions and
+    popular openings are only analysed once across games.
+
+    Attributes:
+        maxsize: The maximum number of positions kept, 0 disables the cache.
+        hits: Number of lookups answered from the cache.
+        misses: Number of lookups that had to be computed.
+    """
+
+    def __init__(self, maxsize: int = DEFAULT_CACHE_SIZE):
+        """Initializes an empty cache.
+
+        Args:
+            maxsize: The maximum number of positions kept, 0 disables the cache.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._entries: OrderedDict[tuple[type, int], CacheEntry] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _entry(self, rules: Rules, state: GameState) -> CacheEntry:
+        """Returns the entry of a position, creating it and evicting the oldest if needed."""
+        key = (type(rules), state.zobrist)
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = CacheEntry()
+            self._entries[key] = entry
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        else:
+            self._entries.move_to_end(key)
+        return entry
+
+    def legal_moves(self, rules: Rules, state: GameState) -> list[Move]:
+        """Returns the legal moves of a position.
+
+        Args:
+            rules: The variant rules.
+            state: The position.
+
+        Returns:
+            A new list of the legal moves.
+        """
+        if self.maxsize <= 0:
+            return rules.legal_moves(state)
+        entry = self._entry(rules, state)
+        if entry.legal_moves is None:
+            self.misses += 1
+            entry.legal_moves = tuple(rules.legal_moves(state))
+        else:
+            self.hits += 1
+        return list(entry.legal_moves)
+
+    def has_legal_moves(self, rules: Rules, state: GameState) -> bool:
+        """Returns whether the side to move has a legal move.
+
+        Answered from the cached legal moves when they are known, otherwise
+        rules.has_legal_moves stops at the first legal move.
+
+        Args:
+            rules: The variant rules.
+            state: The position.
+
+        Returns:
+            True if at least one legal move exists.
+        """
+        if self.maxsize <= 0:
+            return rules.has_legal_moves(state)
+        entry = self._entry(rules, state)
+        if entry.has_legal_moves is None:
+            if entry.legal_moves is not None:
+                self.hits += 1
+                entry.has_legal_moves = bool(entry.legal_moves)
+            else:
+                self.misses += 1
+                entry.has_legal_moves = rules.has_legal_moves(state)
+        else:
+            self.hits += 1
+        return entry.has_legal_moves
+
+    def is_check(self, rules: Rules, state: GameState) -> bool:
+        """Returns whether the side to move is in check.
+
+        Args:
+            rules: The variant rules.
+            state: The position.
+
+        Returns:
+            True if the side to move is in check.
+        """
+        if self.maxsize <= 0:
+            return rules.is_check(state)
+        entry = self._entry(rules, state)
+        if entry.is_check is None:
+            self.misses += 1
+            entry.is_check = rules.is_check(state)
+        else:
+            self.hits += 1
+        return entry.is_check
+
+    def san_index(self, rules: Rules, state: GameState,
+                  build: Callable[[GameState], Mapping[str, tuple[Move, ...]]]) -> Mapping[str, tuple[Move, ...]]:
+        """Returns the SAN index of a position.
+
+        Args:
+            rules: The variant rules.
+            state: The position.
+            build: Computes the index on a miss, as a read-only mapping.
+
+        Returns:
+            The read-only mapping of SAN key to the legal moves sharing it.
+        """
+        if self.maxsize <= 0:
+            return build(state)
+        entry = self._entry(rules, state)
+        if entry.san_index is None:
+            self.misses += 1
+            entry.san_index = build(state)
+        else:
+            self.hits += 1
+        return entry.san_index
+
+    def game_over_reason(self, rules: Rules, state: GameState,
+                         evaluate: Callable[[GameState], GameOverReason]) -> GameOverReason:
+        """Returns the game over reason of a position.
+
+        Args:
+            rules: The variant rules.
+            state: The position.
+            evaluate: Computes the reason on a miss.
+
+        Returns:
+            The game over reason, ONGOING if the game continues.
+        """
+        if self.maxsize <= 0:
+            return evaluate(state)
+        entry = self._entry(rules, state)
+        counters = (state.repetition_count, state.halfmove_clock)
+        reason = entry.game_over.get(counters)
+        if reason is None:
+            self.misses += 1
+            reason = evaluate(state)
+            entry.game_over[counters] = reason
+        else:
+            self.hits += 1
+        return reason
+
+    def resize(self, maxsize: int):
+        """Changes the maximum number of positions, evicting the oldest ones."""
+        self.maxsize = maxsize
+        while len(self._entries) > max(maxsize, 0):
+            self._entries.popitem(last=False)
+
+    def clear(self):
+        """Drops all entries and resets the counters."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def stats(self) -> dict[str, int]:
+        """Returns the size and hit/miss counters of the cache."""
+        return {"size": len(self._entries), "maxsize": self.maxsize, "hits": self.hits, "misses": self.misses}
+
+
+# Shared by every Game and Rules instance in the process.
+position_cache = PositionCache()
@@ -7,4 +7,17 @@ from .crazyhouse import CrazyhouseRules
 from .atomic import AtomicRules
 from .horde import HordeRules
 from .racing_kings import RacingKingsRules
-from .chess960 import Chess960Rules
\ No newline at end of file
+from .chess960 import Chess960Rules
+
+
+RULES_MAP: dict[str, type[Rules]] = {
+    "standard": StandardRules,
+    "antichess": AntichessRules,
+    "atomic": AtomicRules,
+    "chess960": Chess960Rules,
+    "crazyhouse": CrazyhouseRules,
+    "horde": HordeRules,
+    "kingofthehill": KingOfTheHillRules,
+    "racingkings": RacingKingsRules,
+    "threecheck": ThreeCheckRules,
+}
@@ -23,6 +23,10 @@ from .standard import StandardRules
 
 
 class AntichessRules(StandardRules):
+    # Captures are mandatory and kings are ordinary pieces, so moves go through the validator pipeline.
+    uses_legal_movegen = False
+    allows_king_promotion = True
+
     @property
     def game_over_conditions(self) -> List[Callable[[GameState, "StandardRules"], Optional[GameOverReason]]]:
         return [
@@ -70,6 +74,9 @@ class AntichessRules(StandardRules):
     def inactive_player_in_check(self, state: GameState) -> bool:
         return False
 
+    def gives_check(self, state: GameState, move: Move) -> bool:
+        return False
+
     def get_winner(self, state: GameState) -> Color | None:
         reason = self.get_game_over_reason(state)
         if reason == GameOverReason.ALL_PIECES_CAPTURED:
@@ -1,8 +1,11 @@
 from typing import List, Callable, Optional
-from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReason, Color, Direction
+from v_chess.bitboard import AttackTables
+from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReason, CastlingRight, Color
 from v_chess.game_state import GameState
+from v_chess import zobrist
 from v_chess.move import Move
-from v_chess.piece import Pawn, King
+from v_chess.piece import Pawn
+from v_chess.piece.codes import BLACK_OFFSET, COLOR_INDEX, KING, PAWN
 from v_chess.game_over_conditions import evaluate_atomic_king_exploded
 from v_chess.move_validators import (
     validate_piece_presence, validate_turn, 
@@ -18,11 +21,15 @@ from v_chess.special_moves import (
     PieceMoveRule, GlobalMoveRule, basic_moves,
     pawn_promotions, pawn_double_push, standard_castling
 )
+from .core import Rules
 from .standard import StandardRules
 from dataclasses import replace
 
 
 class AtomicRules(StandardRules):
+    # Explosions decide legality, so moves go through the validator pipeline.
+    uses_legal_movegen = False
+
     @property
     def game_over_conditions(self) -> List[Callable[[GameState, "StandardRules"], Optional[GameOverReason]]]:
         return [evaluate_atomic_king_exploded] + super().game_over_conditions
@@ -66,6 +73,7 @@ class AtomicRules(StandardRules):
         ]
 
     def post_move_actions(self, old_state: GameState, move: Move, new_state: GameState) -> GameState:
+        """Explodes captures on the successor board built by apply_move, in place."""
         moving_piece = old_state.board.get_piece(move.start)
         target_piece = old_state.board.get_piece(move.end)
         is_en_passant = isinstance(moving_piece, Pawn) and move.end == old_state.ep_square
@@ -73,51 +81,62 @@ class AtomicRules(StandardRules):
         if not (target_piece or is_en_passant):
             return new_state
             
-        final_board = new_state.board.copy()
-        final_board.remove_piece(move.end)
-        
-        neighbors = [
-            move.end.adjacent(d) for d in Direction.straight_and_diagonal()
-        ]
-        
-        for sq in neighbors:
-            if not sq.is_none_square:
-                p = final_board.get_piece(sq)
-                if p and not isinstance(p, Pawn):
-                    final_board.remove_piece(sq)
+        # apply_move hands over a fresh copy of the board, so it can be
+        # exploded without copying it again.
+        final_board = new_state.board
+        undo = final_board.bitboard.explode(move.end.index)
                     
         new_rights = self._update_castling_rights_after_explosion(old_state, final_board)
         
+        new_key = (
+            new_state.zobrist
+            ^ zobrist.toggles_key(undo.toggles)
+            ^ zobrist.castling_key(new_state.castling_rights)
+            ^ zobrist.castling_key(new_rights)
+            ^ zobrist.ep_key(new_state.ep_square)
+        )
+
         return replace(new_state, 
                        board=final_board, 
                        castling_rights=new_rights,
                        ep_square=None, 
                        halfmove_clock=0, 
-                       explosion_square=move.end)
+                       explosion_square=move.end,
+                       zobrist_key=new_key)
+
+    def gives_check(self, state: GameState, move: Move) -> bool:
+        """Checks if a move puts the opponent in check, applying captures to resolve the explosion."""
+        board = state.board
+        if not move.is_drop:
+            moving = board.piece_code_at(move.start.index)
+            is_en_passant = moving >= 0 and moving % BLACK_OFFSET == PAWN and move.end == state.ep_square
+            if board.piece_code_at(move.end.index) >= 0 or is_en_passant:
+                return Rules.gives_check(self, state, move)
+        return super().gives_check(state, move)
 
     def _update_castling_rights_after_explosion(self, state: GameState, board) -> tuple:
-        from v_chess.enums import CastlingRight
+        """Keeps the castling rights whose king and rook squares still hold pieces of their color."""
+        bb = board.bitboard
         new_rights = []
         for right in state.castling_rights:
             if right == CastlingRight.NONE: continue
-            king = board.get_piece(right.expected_king_square)
-            rook = board.get_piece(right.expected_rook_square)
-            if isinstance(king, King) and king.color == right.color and \
-               board.get_piece(right.expected_rook_square) and \
-               board.get_piece(right.expected_rook_square).color == right.color:
+            idx = COLOR_INDEX[right.color]
+            king_bit = 1 << right.expected_king_square.index
+            rook_bit = 1 << right.expected_rook_square.index
+            if bb.masks[idx * BLACK_OFFSET + KING] & king_bit and bb.colors[idx] & rook_bit:
                 new_rights.append(right)
         return tuple(new_rights)
 
     def _kings_adjacent(self, board) -> bool:
-        wk = [sq for sq, p in board.items() if isinstance(p, King) and p.color == Color.WHITE]
-        bk = [sq for sq, p in board.items() if isinstance(p, King) and p.color == Color.BLACK]
+        """Whether the first white king and the first black king stand next to each other."""
+        masks = board.bitboard.masks
+        wk, bk = masks[KING], masks[BLACK_OFFSET + KING]
         if not wk or not bk: return False
-        return wk[0].is_adjacent_to(bk[0])
+        return bool(AttackTables.king_attacks((wk & -wk).bit_length() - 1) & (bk & -bk))
 
     def get_winner(self, state: GameState) -> Color | None:
         reason = self.get_game_over_reason(state)
         if reason == GameOverReason.KING_EXPLODED:
-            wk = any(isinstance(p, King) and p.color == Color.WHITE for p in state.board.values())
-            if not wk: return Color.BLACK
+            if not state.board.bitboard.masks[KING]: return Color.BLACK
             return Color.WHITE
         return super().get_winner(state)
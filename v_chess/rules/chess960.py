@@ -198,13 +198,10 @@ class Chess960Rules(StandardRules):
 
         if self.is_check(state): return MoveLegalityReason.CASTLING_FROM_CHECK
 
+        # The king may already stand on its target square.
         step = 1 if target_king.col > move.start.col else -1
-        curr_col = move.start.col + step
-        while True:
-            sq = Square(row, curr_col)
-            if self.is_under_attack(state.board, sq, piece.color.opposite):
+        for col in range(move.start.col + step, target_king.col + step, step):
+            if state.attacks.is_attacked(Square(row, col).index, piece.color.opposite):
                 return MoveLegalityReason.CASTLING_THROUGH_CHECK
-            if curr_col == target_king.col: break
-            curr_col += step
 
         return MoveLegalityReason.LEGAL
\ No newline at end of file
@@ -1,8 +1,15 @@
+import logging
+import time
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, List, Callable, Optional
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Callable, Optional
 
 from v_chess.enums import Color, MoveLegalityReason, BoardLegalityReason, GameOverReason
+from v_chess.instrumentation import instrumentation
 from v_chess.move import Move
+from v_chess.move_context import MoveContext
+from v_chess.move_codes import SQUARES
+from v_chess.piece.codes import BLACK_OFFSET, COLOR_INDEX, KING, PIECES
+from v_chess.rules.rule_set import RuleSet
 
 if TYPE_CHECKING:
     from v_chess.game_state import GameState
@@ -11,17 +18,43 @@ if TYPE_CHECKING:
     from v_chess.state_validators import StateValidator
     from v_chess.special_moves import PieceMoveRule, GlobalMoveRule
 
+logger = logging.getLogger(__name__)
+
 
 class Rules(ABC):
     """Abstract base class for chess variant rules.
 
     Rules are stateless logic providers that answer questions about
-    the legality and status of a given GameState.
+    the legality and status of a given GameState. Each rules class has a
+    single shared instance, which carries the variant's compiled RuleSet.
+
+    Attributes:
+        rule_set: The validators, conditions and move generators of the
+            variant, read once from the component properties.
     """
     GameOverReason = GameOverReason
     MoveLegalityReason = MoveLegalityReason
     BoardLegalityReason = BoardLegalityReason
 
+    # Whether pawns may promote to a king.
+    allows_king_promotion = False
+
+    _instances: dict[type, "Rules"] = {}
+    rule_set: RuleSet
+
+    def __new__(cls):
+        """Returns the shared instance of this rules class, compiling its rule set once."""
+        instance = Rules._instances.get(cls)
+        if instance is None:
+            instance = super().__new__(cls)
+            instance.rule_set = RuleSet.compile(instance)
+            Rules._instances[cls] = instance
+        return instance
+
+    def __reduce__(self):
+        """Pickles and copies through the constructor to keep instances shared."""
+        return type(self), ()
+
     @property
     @abstractmethod
     def starting_fen(self) -> str:
@@ -60,32 +93,54 @@ class Rules(ABC):
         """Generates all moves possible on an empty board using modular rules."""
         moves = []
         bb = state.board.bitboard
-        turn = state.turn
-
-        piece_rules = [r for r in self.available_moves if not getattr(r, "is_global", False)]
-        global_rules = [r for r in self.available_moves if getattr(r, "is_global", False)]
+        piece_rules = self.rule_set.piece_move_rules
 
         # 1. Piece-specific moves
-        for p_type, mask in bb.pieces[turn].items():
-            temp_mask = mask
+        base = COLOR_INDEX[state.turn] * BLACK_OFFSET
+        for code in range(base, base + BLACK_OFFSET):
+            temp_mask = bb.masks[code]
+            piece = PIECES[code]
             while temp_mask:
-                sq_idx = (temp_mask & -temp_mask).bit_length() - 1
-                from v_chess.square import Square
-                sq = Square(divmod(sq_idx, 8))
-                piece = state.board.get_piece(sq)
-
-                if piece:
-                    for rule in piece_rules:
-                        moves.extend(rule(state, sq, piece))
-
+                sq = SQUARES[(temp_mask & -temp_mask).bit_length() - 1]
+                for rule in piece_rules:
+                    moves.extend(rule(state, sq, piece))
                 temp_mask &= temp_mask - 1
 
         # 2. Global moves (e.g. Drops)
-        for rule in global_rules:
+        for rule in self.rule_set.global_move_rules:
             moves.extend(rule(state))
 
         return moves
 
+    def iter_possible_moves(self, state: "GameState") -> Iterator[Move]:
+        """Yields the candidate moves of get_possible_moves in stages.
+
+        King moves come first, then captures and quiet moves of the other
+        pieces, then global moves such as drops. Global rules are only run
+        once the earlier stages are exhausted.
+        """
+        piece_rules = self.rule_set.piece_move_rules
+        bb = state.board.bitboard
+        base = COLOR_INDEX[state.turn] * BLACK_OFFSET
+        opp_occ = bb.colors[1 - COLOR_INDEX[state.turn]]
+
+        quiet = []
+        for code in (base + KING, *range(base, base + KING)):
+            temp_mask = bb.masks[code]
+            while temp_mask:
+                sq_idx = (temp_mask & -temp_mask).bit_length() - 1
+                for rule in piece_rules:
+                    for move in rule(state, SQUARES[sq_idx], PIECES[code]):
+                        if code == base + KING or opp_occ & (1 << move.end.index):
+                            yield move
+                        else:
+                            quiet.append(move)
+                temp_mask &= temp_mask - 1
+        yield from quiet
+
+        for rule in self.rule_set.global_move_rules:
+            yield from rule(state)
+
     @abstractmethod
     def apply_move(self, state: "GameState", move: Move) -> "GameState":
         """Executes a move and returns the resulting state.
@@ -101,7 +156,7 @@ class Rules(ABC):
 
     def validate_board_state(self, state: "GameState") -> BoardLegalityReason:
         """Validates the overall board state using the component pipeline."""
-        for v in self.state_validators:
+        for v in self.rule_set.state_validators:
             reason = v(state, self)
             if reason:
                 return reason
@@ -109,28 +164,71 @@ class Rules(ABC):
 
     def validate_move(self, state: "GameState", move: "Move") -> MoveLegalityReason:
         """Validates a move using the component pipeline."""
-        for v in self.move_validators:
-            reason = v(state, move, self)
+        return self._run_move_validators(state, move, None)
+
+    def validate_moves(self, state: "GameState", moves: Iterable[Move],
+                       context: Optional[MoveContext] = None) -> list[MoveLegalityReason]:
+        """Validates several moves of one position using the component pipeline.
+
+        The piece placement, checkers and pins of the position are read once
+        into a MoveContext shared by every validator call.
+
+        Args:
+            state: The position the moves are played from.
+            moves: The moves to validate.
+            context: The context of the position, built if not given.
+
+        Returns:
+            The legality reason of each move, in the order given.
+        """
+        if context is None:
+            context = MoveContext(state)
+        return [self._run_move_validators(state, move, context) for move in moves]
+
+    def _run_move_validators(self, state: "GameState", move: "Move",
+                             context: Optional[MoveContext]) -> MoveLegalityReason:
+        """Runs the validator pipeline on one move, returning the first rejection."""
+        if instrumentation.enabled:
+            return self._validate_move_instrumented(state, move, context)
+        for v in self.rule_set.move_validators:
+            reason = v(state, move, self, context)
             if reason:
-                print(f"[RULES DEBUG] Move {move.uci} rejected by {v.__name__}: {reason.value}")
+                logger.debug("Move %s rejected by %s: %s", move, v.__name__, reason.value)
                 return reason
         return MoveLegalityReason.LEGAL
 
+    def _validate_move_instrumented(self, state: "GameState", move: "Move",
+                                    context: Optional[MoveContext] = None) -> MoveLegalityReason:
+        """Runs the validator pipeline while recording per-validator counters and slow moves."""
+        started = time.perf_counter()
+        result = MoveLegalityReason.LEGAL
+        for v in self.rule_set.move_validators:
+            call_started = time.perf_counter()
+            reason = v(state, move, self, context)
+            instrumentation.record_validator(v.__name__, reason, time.perf_counter() - call_started)
+            if reason:
+                logger.debug("Move %s rejected by %s: %s", move, v.__name__, reason.value)
+                result = reason
+                break
+        instrumentation.record_operation("validate", self, state, move, time.perf_counter() - started)
+        return result
+
     def move_pseudo_legality_reason(self, state: "GameState", move: Move) -> MoveLegalityReason:
         """Checks pseudo-legality using the validator pipeline."""
-        for v in self.move_validators:
-            # Skip validators that check for 'full' legality (safety, variant goals)
-            name = v.__name__.lower()
-            if "safety" in name or "mandatory" in name or "atomic" in name or "racing" in name:
-                continue
+        for v in self.rule_set.pseudo_legal_validators:
             reason = v(state, move, self)
             if reason:
                 return reason
         return MoveLegalityReason.LEGAL
 
     def get_game_over_reason(self, state: "GameState") -> GameOverReason:
-        """Determines why the game ended."""
-        for condition in self.game_over_conditions:
+        """Determines why the game ended, sharing results through the position cache."""
+        from v_chess.position_cache import position_cache
+        return position_cache.game_over_reason(self, state, self.evaluate_game_over_conditions)
+
+    def evaluate_game_over_conditions(self, state: "GameState") -> GameOverReason:
+        """Runs the game over conditions and returns the first reason found."""
+        for condition in self.rule_set.game_over_conditions:
             reason = condition(state, self)
             if reason:
                 return reason
@@ -152,9 +250,22 @@ class Rules(ABC):
     # Convenience / Helper methods exposed to Game
     # -------------------------------------------------------------------------
 
+    def legal_moves(self, state: "GameState") -> list[Move]:
+        """Returns all legal moves, filtering candidates through the validator pipeline."""
+        moves = self.get_possible_moves(state)
+        reasons = self.validate_moves(state, moves)
+        return [move for move, reason in zip(moves, reasons) if reason == MoveLegalityReason.LEGAL]
+
+    def iter_legal_moves(self, state: "GameState") -> Iterator[Move]:
+        """Lazily yields the legal moves in the stages of iter_possible_moves."""
+        context = MoveContext(state)
+        for move in self.iter_possible_moves(state):
+            if self._run_move_validators(state, move, context) == MoveLegalityReason.LEGAL:
+                yield move
+
     def has_legal_moves(self, state: "GameState") -> bool:
-        """Checks if there is at least one legal move."""
-        return any(self.validate_move(state, move) == MoveLegalityReason.LEGAL for move in self.get_possible_moves(state))
+        """Checks if there is at least one legal move, stopping at the first one."""
+        return next(self.iter_legal_moves(state), None) is not None
 
     def is_game_over(self, state: "GameState") -> bool:
         """Convenience method to check if the game has ended."""
@@ -168,6 +279,10 @@ class Rules(ABC):
         """Checks if the current player is in check."""
         return False
     
+    def gives_check(self, state: "GameState", move: Move) -> bool:
+        """Checks if a move puts the opponent in check, by applying it."""
+        return self.is_check(self.apply_move(state, move))
+
     def is_checkmate(self, state: "GameState") -> bool:
         """Checks if the game is over by checkmate."""
         reason = self.get_game_over_reason(state)
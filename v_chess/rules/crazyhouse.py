@@ -1,8 +1,10 @@
 from typing import List, Callable, Optional
 from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReason, Color
 from v_chess.game_state import GameState, CrazyhouseGameState
+from v_chess import zobrist
 from v_chess.move import Move
-from v_chess.piece import Pawn, Piece
+from v_chess.piece.codes import BLACK_OFFSET, PAWN, TYPE_INDEX
+from v_chess.pocket import EMPTY_POCKETS, POCKET_SLOTS
 from v_chess.square import Square
 from v_chess.game_over_conditions import (
     evaluate_repetition, evaluate_fifty_move_rule, 
@@ -76,50 +78,37 @@ class CrazyhouseRules(StandardRules):
     def post_move_actions(self, old_state: GameState, move: Move, new_state: GameState) -> GameState:
         """Updates pockets after a move (capture or drop)."""
         # Ensure we are working with a CrazyhouseGameState
-        current_pockets = ((), ())
+        current_pockets = EMPTY_POCKETS
         if isinstance(old_state, CrazyhouseGameState):
             current_pockets = old_state.pockets
-            
-        new_pockets = [list(current_pockets[0]), list(current_pockets[1])]
-        
+
+        pocket_idx = 0 if old_state.turn == Color.WHITE else 1
+        my_pocket = current_pockets[pocket_idx]
+        new_pocket = my_pocket
+
         if move.is_drop:
             # Remove dropped piece from pocket
-            pocket_idx = 0 if old_state.turn == Color.WHITE else 1
-            my_pocket = new_pockets[pocket_idx]
-            
-            found = False
-            for i, p in enumerate(my_pocket):
-                if type(p) == type(move.drop_piece):
-                    my_pocket.pop(i)
-                    found = True
-                    break
-            
-            if not found:
-                # Should have been caught by validate_move/pseudo check
-                pass
-                
+            type_idx = TYPE_INDEX[type(move.drop_piece)]
+            # An empty slot should have been caught by validate_move/pseudo check
+            if my_pocket.counts[type_idx]:
+                new_pocket = my_pocket.remove(type_idx)
         else:
             # Check capture
-            moving_piece = old_state.board.get_piece(move.start)
-            target_piece = old_state.board.get_piece(move.end)
-            
-            captured_piece = None
-            if target_piece:
-                captured_piece = target_piece
-            elif isinstance(moving_piece, Pawn) and move.end == old_state.ep_square:
-                # En Passant
-                from v_chess.enums import Direction
-                direction = Direction.DOWN if moving_piece.color == Color.WHITE else Direction.UP
-                captured_sq = move.end.adjacent(direction)
-                captured_piece = old_state.board.get_piece(captured_sq)
-                
-            if captured_piece:
-                pocket_color_idx = 0 if old_state.turn == Color.WHITE else 1
-                captured_piece_type = type(captured_piece)
-                new_piece = captured_piece_type(old_state.turn)
-                new_pockets[pocket_color_idx].append(new_piece)
-                new_pockets[pocket_color_idx].sort(key=lambda p: p.fen.upper())
+            board = old_state.board
+            code = board.piece_code_at(move.end.index)
+            if code < 0 and move.end == old_state.ep_square:
+                moving = board.piece_code_at(move.start.index)
+                if moving >= 0 and moving % BLACK_OFFSET == PAWN:
+                    # En Passant
+                    code = board.piece_code_at(move.start.row * 8 + move.end.col)
+            if code >= 0 and code % BLACK_OFFSET < POCKET_SLOTS:
+                new_pocket = my_pocket.add(code % BLACK_OFFSET)
 
+        new_pockets = current_pockets
+        zobrist_key = new_state.zobrist
+        if new_pocket is not my_pocket:
+            new_pockets = (new_pocket, current_pockets[1]) if pocket_idx == 0 else (current_pockets[0], new_pocket)
+            zobrist_key ^= zobrist.pocket_key(my_pocket) ^ zobrist.pocket_key(new_pocket)
         return CrazyhouseGameState(
             board=new_state.board,
             turn=new_state.turn,
@@ -128,5 +117,6 @@ class CrazyhouseRules(StandardRules):
             halfmove_clock=new_state.halfmove_clock,
             fullmove_count=new_state.fullmove_count,
             repetition_count=new_state.repetition_count,
-            pockets=(tuple(new_pockets[0]), tuple(new_pockets[1]))
+            pockets=new_pockets,
+            zobrist_key=zobrist_key
         )
@@ -21,6 +21,9 @@ from .standard import StandardRules
 
 
 class RacingKingsRules(StandardRules):
+    # Giving check is illegal, so moves go through the validator pipeline.
+    uses_legal_movegen = False
+
     @property
     def game_over_conditions(self) -> List[Callable[[GameState, "StandardRules"], Optional[GameOverReason]]]:
         return [
@@ -71,7 +74,7 @@ class RacingKingsRules(StandardRules):
         return "8/8/8/8/8/8/krbnNBRK/qrbnNBRQ w - - 0 1"
 
     def is_check(self, state: GameState) -> bool:
-        return self._is_color_in_check(state.board, state.turn)
+        return state.attacks.in_check(state.turn)
 
     def get_winner(self, state: GameState) -> Color | None:
         reason = self.get_game_over_reason(state)
@@ -0,0 +1,74 @@
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Callable
+
+from v_chess.special_moves import (
+    standard_castling, chess960_castling, horde_pawn_double_push, crazyhouse_drops
+)
+
+if TYPE_CHECKING:
+    from v_chess.rules import Rules
+
+# Validators skipped by Rules.move_pseudo_legality_reason, matched on name.
+FULL_LEGALITY_MARKERS = ("safety", "mandatory", "atomic", "racing")
+
+
+@dataclass(frozen=True)
+class RuleSet:
+    """The components of a variant, collected once and shared by all games.
+
+    Attributes:
+        move_validators: The move validator pipeline, in order.
+        pseudo_legal_validators: The move validators that do not check full
+            legality (king safety, variant goals).
+        state_validators: The board state validators, in order.
+        game_over_conditions: The game over conditions, in order.
+        piece_move_rules: Move generators run for each piece.
+        global_move_rules: Move generators run once per position (drops).
+        has_castling: Whether castling moves are generated.
+        chess960_castling: Whether castling may be written as king-takes-own-rook.
+        has_drops: Whether pieces can be dropped from a pocket.
+        horde_pawns: Whether White pawns may double push from the first rank.
+        king_promotion: Whether pawns may promote to a king.
+    """
+    move_validators: tuple[Callable, ...]
+    pseudo_legal_validators: tuple[Callable, ...]
+    state_validators: tuple[Callable, ...]
+    game_over_conditions: tuple[Callable, ...]
+    piece_move_rules: tuple[Callable, ...]
+    global_move_rules: tuple[Callable, ...]
+    has_castling: bool
+    chess960_castling: bool
+    has_drops: bool
+    horde_pawns: bool
+    king_promotion: bool
+
+    @classmethod
+    def compile(cls, rules: Rules) -> RuleSet:
+        """Reads the component properties of a rules instance once.
+
+        Args:
+            rules: The rules to compile.
+
+        Returns:
+            The immutable rule set of the variant.
+        """
+        move_validators = tuple(rules.move_validators)
+        available_moves = tuple(rules.available_moves)
+        piece_rules = tuple(r for r in available_moves if not getattr(r, "is_global", False))
+        global_rules = tuple(r for r in available_moves if getattr(r, "is_global", False))
+        return cls(
+            move_validators=move_validators,
+            pseudo_legal_validators=tuple(
+                v for v in move_validators
+                if not any(marker in v.__name__.lower() for marker in FULL_LEGALITY_MARKERS)
+            ),
+            state_validators=tuple(rules.state_validators),
+            game_over_conditions=tuple(rules.game_over_conditions),
+            piece_move_rules=piece_rules,
+            global_move_rules=global_rules,
+            has_castling=standard_castling in piece_rules or chess960_castling in piece_rules,
+            chess960_castling=chess960_castling in piece_rules,
+            has_drops=crazyhouse_drops in global_rules,
+            horde_pawns=horde_pawn_double_push in piece_rules,
+            king_promotion=rules.allows_king_promotion,
+        )
@@ -1,12 +1,16 @@
-from typing import List, Callable, Optional
+from typing import Iterator, List, Callable, Optional
 from itertools import chain
 
+from v_chess.attacks import move_gives_check
 from v_chess.board import Board
 from v_chess.enums import Color, CastlingRight, Direction, MoveLegalityReason, BoardLegalityReason, GameOverReason
 from v_chess.move import Move
 from v_chess.piece import King, Pawn, Piece, Rook, Queen, Bishop, Knight
 from v_chess.square import Square
 from v_chess.game_state import GameState
+from v_chess.move_codes import decode
+from v_chess.movegen import generate_legal_moves, iter_legal_codes
+from v_chess import zobrist
 from v_chess.game_over_conditions import (
     evaluate_repetition, evaluate_fifty_move_rule,
     evaluate_checkmate, evaluate_stalemate
@@ -32,6 +36,10 @@ from .core import Rules
 class StandardRules(Rules):
     """Standard rules for a game of chess."""
 
+    # Whether legality is plain king safety, so moves can come from the
+    # bitboard generator instead of the validator pipeline.
+    uses_legal_movegen = True
+
     @property
     def game_over_conditions(self) -> List[Callable[[GameState, "StandardRules"], Optional[GameOverReason]]]:
         """Returns a list of game over conditions."""
@@ -94,7 +102,67 @@ class StandardRules(Rules):
 
     def is_check(self, state: GameState) -> bool:
         """Checks if the current player is in check."""
-        return self._is_color_in_check(state.board, state.turn)
+        return state.attacks.in_check(state.turn)
+
+    def legal_moves(self, state: GameState) -> list[Move]:
+        """Returns all legal moves, using the bitboard generator when possible."""
+        if self.uses_legal_movegen:
+            moves = generate_legal_moves(self, state)
+            if moves is not None:
+                return moves
+        return super().legal_moves(state)
+
+    def iter_legal_moves(self, state: GameState) -> Iterator[Move]:
+        """Lazily yields the legal moves, using the bitboard generator when possible."""
+        if self.uses_legal_movegen:
+            codes = iter_legal_codes(self, state)
+            if codes is not None:
+                return map(decode, codes)
+        return super().iter_legal_moves(state)
+
+    def gives_check(self, state: GameState, move: Move) -> bool:
+        """Checks if a move puts the opponent in check without applying it.
+
+        Castling moves the rook too and is probed on the bitboard instead.
+        """
+        if not move.is_drop:
+            piece = state.board.get_piece(move.start)
+            if isinstance(piece, King):
+                target = state.board.get_piece(move.end)
+                if isinstance(target, Rook) and target.color == piece.color:
+                    return self._castling_gives_check(state, move, piece, move.end)
+                if abs(move.start.col - move.end.col) > 1:
+                    return self._castling_gives_check(state, move, piece, None)
+        return move_gives_check(state, move)
+
+    def _castling_gives_check(self, state: GameState, move: Move, piece: King, rook_sq: Square | None) -> bool:
+        """Probes a castling move in place and checks whether the opponent king is attacked."""
+        right = self._castling_right(state, move, piece, rook_sq)
+        bb = state.board.bitboard
+        undo = bb.push(move, castling_rook=right.expected_rook_square if right else None)
+        try:
+            return self._is_color_in_check(state.board, state.turn.opposite)
+        finally:
+            bb.pop(undo)
+
+    def _castling_right(self, state: GameState, move: Move, piece: King, rook_sq: Square | None) -> CastlingRight | None:
+        """Finds the castling right a castling move uses, None if there is none."""
+        if rook_sq: # Known from KxR
+            # Find right matching this rook
+            return next((r for r in state.castling_rights if r.expected_rook_square == rook_sq and r.color == piece.color), None)
+        # Infer from direction
+        is_kingside = move.end.col > move.start.col
+        # For 960, we might need more robust matching if multiple rooks on same side (rare)
+        # Standard assumption: King moves towards the rook.
+        # In 960 standard notation (target c/g), g is kingside, c is queenside.
+        if move.end.col == 6: # g-file (Kingside)
+             return next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col > move.start.col), None)
+        elif move.end.col == 2: # c-file (Queenside)
+             return next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col < move.start.col), None)
+        # Non-standard target (manual 960 move?), fall back to direction
+        if is_kingside:
+            return next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col > move.start.col), None)
+        return next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col < move.start.col), None)
 
     def king_left_in_check(self, state: GameState, move: Move) -> bool:
         """Checks if the king is left in check after a move."""
@@ -144,11 +212,12 @@ class StandardRules(Rules):
             if state.board.get_piece(sq) is not None:
                 return MoveLegalityReason.PATH_BLOCKED
 
-        if self._is_color_in_check(state.board, piece.color):
+        attacks = state.attacks
+        if attacks.in_check(piece.color):
             return MoveLegalityReason.CASTLING_FROM_CHECK
 
         for sq in squares_to_check_attack:
-            if self.is_under_attack(state.board, sq, piece.color.opposite):
+            if attacks.is_attacked(sq.index, piece.color.opposite):
                 return MoveLegalityReason.CASTLING_THROUGH_CHECK
 
         return MoveLegalityReason.LEGAL
@@ -166,7 +235,7 @@ class StandardRules(Rules):
 
     def inactive_player_in_check(self, state: GameState) -> bool:
         """Checks if the player who just moved is in check."""
-        return self._is_color_in_check(state.board, state.turn.opposite)
+        return state.attacks.in_check(state.turn.opposite)
 
     def invalid_castling_rights(self, state: GameState) -> list[CastlingRight]:
         """Returns a list of castling rights that are no longer valid due to piece positions."""
@@ -219,7 +288,7 @@ class StandardRules(Rules):
 
     def _is_color_in_check(self, board: Board, color: Color) -> bool:
         """Checks if the king of the given color is under attack."""
-        king_mask = board.bitboard.pieces[color][King]
+        king_mask = board.bitboard.get_piece_mask(King, color)
         while king_mask:
             sq_idx = (king_mask & -king_mask).bit_length() - 1
             if board.bitboard.is_attacked(sq_idx, color.opposite):
@@ -288,7 +357,7 @@ class StandardRules(Rules):
 
         if move.is_drop:
              new_board = state.board.copy()
-             new_board.set_piece(move.drop_piece, move.end)
+             undo = new_board.push(move)
 
              new_halfmove_clock = state.halfmove_clock + 1
              new_fullmove_count = state.fullmove_count + (1 if state.turn == Color.BLACK else 0)
@@ -300,7 +369,13 @@ class StandardRules(Rules):
                 ep_square=None,
                 halfmove_clock=new_halfmove_clock,
                 fullmove_count=new_fullmove_count,
-                repetition_count=1
+                repetition_count=1,
+                zobrist_key=(
+                    state.zobrist
+                    ^ zobrist.toggles_key(undo.toggles)
+                    ^ zobrist.SIDE_KEY
+                    ^ zobrist.ep_key(state.ep_square)
+                )
              )
 
              return self.post_move_actions(state, move, new_state)
@@ -334,59 +409,16 @@ class StandardRules(Rules):
             new_fullmove_count += 1
 
         if is_castling:
-            # Determine Castling Right involved
-            if rook_sq: # Known from KxR
-                # Find right matching this rook
-                right = next((r for r in state.castling_rights if r.expected_rook_square == rook_sq and r.color == piece.color), None)
-            else:
-                # Infer from direction
-                is_kingside = move.end.col > move.start.col
-                # For 960, we might need more robust matching if multiple rooks on same side (rare)
-                # Standard assumption: King moves towards the rook.
-                # In 960 standard notation (target c/g), g is kingside, c is queenside.
-                if move.end.col == 6: # g-file (Kingside)
-                     right = next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col > move.start.col), None)
-                elif move.end.col == 2: # c-file (Queenside)
-                     right = next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col < move.start.col), None)
-                else:
-                     # Non-standard target (manual 960 move?), fall back to direction
-                     if is_kingside:
-                         right = next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col > move.start.col), None)
-                     else:
-                         right = next((r for r in state.castling_rights if r.color == piece.color and r.expected_rook_square.col < move.start.col), None)
-
+            right = self._castling_right(state, move, piece, rook_sq)
             if right:
                 rook_sq = right.expected_rook_square
-                rook = new_board.get_piece(rook_sq)
-
-                # Destination Squares (Fixed for Chess)
-                rank = move.start.row
-                king_dest = Square(rank, 6) # g-file
-                rook_dest = Square(rank, 5) # f-file
-                if right.expected_rook_square.col < move.start.col: # Queenside
-                    king_dest = Square(rank, 2) # c-file
-                    rook_dest = Square(rank, 3) # d-file
-
-                # Execute Castling
-                # Remove both first to avoid self-collision in 960
-                new_board.remove_piece(move.start)
-                new_board.remove_piece(rook_sq)
-                new_board.set_piece(piece, king_dest)
-                new_board.set_piece(rook, rook_dest)
+                undo = new_board.push(move, castling_rook=rook_sq)
             else:
                 # Fallback (shouldn't happen if validated)
-                new_board.move_piece(piece, move.start, move.end)
+                undo = new_board.push(move)
 
         else:
-            new_board.move_piece(piece, move.start, move.end)
-
-        if is_en_passant:
-            direction = Direction.DOWN if piece.color == Color.WHITE else Direction.UP
-            captured_coordinate = move.end.adjacent(direction)
-            new_board.remove_piece(captured_coordinate)
-
-        if move.promotion_piece is not None:
-            new_board.set_piece(move.promotion_piece, move.end)
+            undo = new_board.push(move, state.ep_square)
 
         new_castling_rights = set(state.castling_rights)
 
@@ -419,15 +451,27 @@ class StandardRules(Rules):
         if isinstance(piece, Pawn) and abs(move.start.row - move.end.row) > 1:
             new_ep_square = move.end.adjacent(direction)
 
+        new_castling_rights = tuple(sorted(new_castling_rights, key=lambda x: x.value))
+        new_key = (
+            state.zobrist
+            ^ zobrist.toggles_key(undo.toggles)
+            ^ zobrist.SIDE_KEY
+            ^ zobrist.castling_key(state.castling_rights)
+            ^ zobrist.castling_key(new_castling_rights)
+            ^ zobrist.ep_key(state.ep_square)
+            ^ zobrist.ep_key(new_ep_square)
+        )
+
         # Basic state transition
         new_state = GameState(
             board=new_board,
             turn=state.turn.opposite,
-            castling_rights=tuple(sorted(new_castling_rights, key=lambda x: x.value)),
+            castling_rights=new_castling_rights,
             ep_square=new_ep_square,
             halfmove_clock=new_halfmove_clock,
             fullmove_count=new_fullmove_count,
-            repetition_count=1
+            repetition_count=1,
+            zobrist_key=new_key
         )
 
         # Apply variant hooks
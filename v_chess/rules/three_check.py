@@ -1,6 +1,7 @@
 from typing import List, Callable, Optional
 from v_chess.enums import GameOverReason, MoveLegalityReason, BoardLegalityReason, Color
 from v_chess.game_state import GameState, ThreeCheckGameState
+from v_chess import zobrist
 from v_chess.move import Move
 from v_chess.game_over_conditions import evaluate_three_check_win
 from v_chess.special_moves import (
@@ -31,7 +32,7 @@ class ThreeCheckRules(StandardRules):
         if isinstance(old_state, ThreeCheckGameState):
             current_checks = old_state.checks
 
-        is_check = self.is_check(new_state)
+        is_check = self.gives_check(old_state, move)
 
         white_checks, black_checks = current_checks
 
@@ -49,7 +50,12 @@ class ThreeCheckRules(StandardRules):
             halfmove_clock=new_state.halfmove_clock,
             fullmove_count=new_state.fullmove_count,
             repetition_count=new_state.repetition_count,
-            checks=(white_checks, black_checks)
+            checks=(white_checks, black_checks),
+            zobrist_key=(
+                new_state.zobrist
+                ^ zobrist.checks_key(current_checks)
+                ^ zobrist.checks_key((white_checks, black_checks))
+            )
         )
 
     def get_winner(self, state: GameState) -> Color | None:
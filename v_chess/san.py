@@ -0,0 +1,241 @@
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
+
+from v_chess.piece import Pawn, King, Rook
+
+if TYPE_CHECKING:
+    from v_chess.game_state import GameState
+    from v_chess.move import Move
+    from v_chess.rules import Rules
+
+
+def castling_side(state: GameState, move: Move) -> str | None:
+    """Returns "O-O" or "O-O-O" when the move castles, otherwise None.
+
+    Both the king-to-target (two files) and the Chess960 king-takes-rook
+    forms are recognised.
+    """
+    if move.is_drop:
+        return None
+    piece = state.board.get_piece(move.start)
+    if not isinstance(piece, King):
+        return None
+
+    target = state.board.get_piece(move.end)
+    if isinstance(target, Rook) and target.color == piece.color:
+        return "O-O" if move.end.col > move.start.col else "O-O-O"
+    if abs(move.start.col - move.end.col) == 2:
+        return "O-O" if move.end.col > move.start.col else "O-O-O"
+    return None
+
+
+def _disambiguation(move: Move, rivals: list[Move]) -> str:
+    """Returns the file, rank or square needed to tell move apart from rivals."""
+    start = str(move.start)
+    if not rivals:
+        return ""
+    if all(rival.start.col != move.start.col for rival in rivals):
+        return start[0]
+    if all(rival.start.row != move.start.row for rival in rivals):
+        return start[1]
+    return start
+
+
+def san_for_moves(state: GameState, moves: list[Move], rules: Rules,
+                  legal_moves: list[Move] | None = None, annotate: bool = True) -> list[str]:
+    """Returns the Standard Algebraic Notation of several moves of one position.
+
+    Disambiguation is derived from a single legal move list of the
+    position, which is only generated when a moving piece shares its type
+    and color with another piece. For a single move without a known legal
+    list, only the moves of those twin pieces to the same target are
+    validated. Check and mate suffixes are derived from
+    the position after each move.
+
+    Args:
+        state: The position the moves are played from.
+        moves: Legal moves of the position.
+        rules: The variant rules.
+        legal_moves: The legal moves of the position, if already known.
+        annotate: Whether to append "+" and "#".
+
+    Returns:
+        The SAN of each move, in the order given.
+    """
+    board = state.board
+    bitboard = board.bitboard
+    rivals_by_target: dict[tuple[int, int, object], list[Move]] | None = None
+
+    result = []
+    for move in moves:
+        if move.is_drop:
+            san = move.uci
+        else:
+            code = bitboard.piece_code_at(move.start.index)
+            piece = board.get_piece(move.start)
+            castling = castling_side(state, move)
+            if piece is None:
+                san = move.uci
+            elif castling is not None:
+                san = castling
+            else:
+                is_capture = board.get_piece(move.end) is not None
+                if isinstance(piece, Pawn):
+                    is_capture = is_capture or move.start.col != move.end.col
+                    san = str(move.start)[0] + "x" if is_capture else ""
+                else:
+                    san = piece.fen.upper()
+                    twins = bitboard.masks[code] & ~(1 << move.start.index)
+                    if twins and legal_moves is None and len(moves) == 1:
+                        san += _disambiguation(move, _probe_rivals(state, rules, move, twins))
+                    elif twins:
+                        if rivals_by_target is None:
+                            rivals_by_target = _rivals_by_target(state, rules, legal_moves)
+                        key = (code, move.end.index, move.promotion_piece)
+                        rivals = [m for m in rivals_by_target.get(key, ()) if m.start != move.start]
+                        san += _disambiguation(move, rivals)
+                    if is_capture:
+                        san += "x"
+                san += str(move.end)
+                if move.promotion_piece is not None:
+                    san += "=" + move.promotion_piece.fen.upper()
+
+        if annotate:
+            san += _check_suffix(state, move, rules)
+        result.append(san)
+    return result
+
+
+def _rivals_by_target(state: GameState, rules: Rules,
+                      legal_moves: list[Move] | None) -> dict[tuple[int, int, object], list[Move]]:
+    """Groups the non-castling legal moves by moving piece, target and promotion."""
+    if legal_moves is None:
+        legal_moves = rules.legal_moves(state)
+    bitboard = state.board.bitboard
+    groups: dict[tuple[int, int, object], list[Move]] = {}
+    for move in legal_moves:
+        if move.is_drop or castling_side(state, move) is not None:
+            continue
+        key = (bitboard.piece_code_at(move.start.index), move.end.index, move.promotion_piece)
+        groups.setdefault(key, []).append(move)
+    return groups
+
+
+def _probe_rivals(state: GameState, rules: Rules, move: Move, twins: int) -> list[Move]:
+    """Returns the legal moves of the twin pieces to the target of move.
+
+    Validating a handful of rival moves is cheaper than generating the legal
+    move list when only one move needs its SAN.
+    """
+    from v_chess.enums import MoveLegalityReason
+    from v_chess.move import Move
+    from v_chess.move_codes import SQUARES
+
+    candidates = []
+    while twins:
+        idx = (twins & -twins).bit_length() - 1
+        candidates.append(Move(SQUARES[idx], move.end, move.promotion_piece, player_to_move=state.turn))
+        twins &= twins - 1
+    reasons = rules.validate_moves(state, candidates)
+    return [rival for rival, reason in zip(candidates, reasons) if reason == MoveLegalityReason.LEGAL]
+
+
+def _check_suffix(state: GameState, move: Move, rules: Rules) -> str:
+    """Returns "#", "+" or "" for the position after move."""
+    if not rules.gives_check(state, move):
+        return ""
+    return "+" if rules.has_legal_moves(rules.apply_move(state, move)) else "#"
+
+
+def _normalize(san: str) -> str:
+    """Drops the parts of a SAN string that do not identify the move."""
+    for char in "x=+#!?":
+        san = san.replace(char, "")
+    return san.replace("0", "O")
+
+
+def san_index(state: GameState, rules: Rules,
+              legal_moves: list[Move] | None = None) -> Mapping[str, tuple[Move, ...]]:
+    """Returns the legal moves of a position keyed by their SAN without disambiguation.
+
+    Keys are the piece letter (none for pawns), the target square and the
+    promotion letter, e.g. "Nd2", "e8Q"; "O-O"/"O-O-O" for castling and
+    "N@f3" for drops. The index is built from one legal move list and kept
+    on the position's entry in the shared position cache.
+
+    Args:
+        state: The position to index.
+        rules: The variant rules.
+        legal_moves: The legal moves of the position, if already known.
+
+    Returns:
+        A read-only mapping of SAN key to the legal moves sharing it.
+    """
+    from v_chess.position_cache import position_cache
+
+    return position_cache.san_index(rules, state, lambda s: _build_san_index(s, rules, legal_moves))
+
+
+def _build_san_index(state: GameState, rules: Rules,
+                     legal_moves: list[Move] | None) -> Mapping[str, tuple[Move, ...]]:
+    """Builds the SAN index of a position, see san_index."""
+    if legal_moves is None:
+        legal_moves = rules.legal_moves(state)
+    board = state.board
+    index = {}
+    for move in legal_moves:
+        if move.is_drop:
+            san = f"{move.drop_piece.fen.upper()}@{move.end}"
+        else:
+            piece = board.get_piece(move.start)
+            san = castling_side(state, move) if isinstance(piece, King) else None
+            if san is None:
+                letter = "" if isinstance(piece, Pawn) else piece.fen.upper()
+                promotion = move.promotion_piece.fen.upper() if move.promotion_piece is not None else ""
+                san = f"{letter}{move.end}{promotion}"
+        index.setdefault(san, []).append(move)
+    return MappingProxyType({san: tuple(moves) for san, moves in index.items()})
+
+
+def parse_san(state: GameState, san: str, rules: Rules) -> Move | None:
+    """Resolves a SAN string through the index of the position.
+
+    Args:
+        state: The position the move is played from.
+        san: The move in SAN, capture, check and annotation marks are ignored.
+        rules: The variant rules.
+
+    Returns:
+        The single legal move the string names, or None when it names no
+        legal move, several of them, or is not well formed.
+    """
+    text = _normalize(san.strip())
+    if text in ("O-O", "O-O-O"):
+        candidates = san_index(state, rules).get(text, ())
+        # Chess960 lists both castling notations, prefer king-to-target.
+        preferred = [move for move in candidates if move.end.col in (2, 6)]
+        return (preferred or candidates or [None])[0]
+
+    if "@" in text:
+        piece, _, square = text.partition("@")
+        candidates = san_index(state, rules).get(f"{piece.upper() or 'P'}@{square}", ())
+        return candidates[0] if len(candidates) == 1 else None
+
+    promotion = ""
+    if len(text) > 2 and text[-1].upper() in "QRBNK" and text[-2].isdigit():
+        promotion, text = text[-1].upper(), text[:-1]
+    if len(text) < 2:
+        return None
+
+    target, prefix = text[-2:], text[:-2]
+    letter = ""
+    if prefix and prefix[0] in "KQRBNP":
+        letter, prefix = prefix[0], prefix[1:]
+        if letter == "P":
+            letter = ""
+
+    candidates = san_index(state, rules).get(f"{letter}{target}{promotion}", ())
+    if prefix:
+        candidates = [move for move in candidates if str(move.start).startswith(prefix)
+                      or (prefix.isdigit() and str(move.start)[1] == prefix)]
+    return candidates[0] if len(candidates) == 1 else None
@@ -24,11 +24,12 @@ def basic_moves(state: "GameState", sq: "Square", piece: "Piece") -> Iterable[Mo
 def pawn_promotions(state: "GameState", sq: "Square", piece: "Piece") -> Iterable[Move]:
     """Generates promotion moves for pawns reaching the last rank."""
     from v_chess.piece import Pawn, Queen, Rook, Bishop, Knight, King
+    from v_chess.piece.codes import piece_for
     if isinstance(piece, Pawn):
         for end in piece.theoretical_moves(sq):
             if end.is_promotion_row(state.turn):
                 for promo_piece_type in [Queen, Rook, Bishop, Knight, King]:
-                    yield Move(sq, end, promo_piece_type(state.turn), player_to_move=state.turn)
+                    yield Move(sq, end, piece_for(promo_piece_type, state.turn), player_to_move=state.turn)
 
 def pawn_double_push(state: "GameState", sq: "Square", piece: "Piece") -> Iterable[Move]:
     """Generates double push moves for pawns on their starting rank."""
@@ -81,27 +82,45 @@ def horde_pawn_double_push(state: "GameState", sq: "Square", piece: "Piece") ->
             yield Move(sq, two_step, player_to_move=state.turn)
 
 def crazyhouse_drops(state: "GameState") -> Iterable[Move]:
-    """Generates all legal drops from the pocket in Crazyhouse."""
+    """Generates drops from the pocket onto empty squares in Crazyhouse.
+
+    Pawns are not dropped on the back ranks. In check, only drops that
+    block a single checker are generated.
+    """
     from v_chess.game_state import CrazyhouseGameState
-    from v_chess.piece import Pawn
-    
+    from v_chess.move_codes import BLACK_FLAG, DROP_SHIFT, TO_SHIFT, decode
+    from v_chess.movegen import FULL_MASK, RANK_1, RANK_8, between
+    from v_chess.piece.codes import COLOR_INDEX, PAWN
+    from v_chess.pocket import FEN_ORDER
+
     if not isinstance(state, CrazyhouseGameState):
         return
 
-    pocket_idx = 0 if state.turn == Color.WHITE else 1
-    pocket = state.pockets[pocket_idx]
-    if not pocket:
+    us = COLOR_INDEX[state.turn]
+    counts = state.pockets[us].counts
+    drop_fields = [(type_idx + 1) << DROP_SHIFT for type_idx in FEN_ORDER if counts[type_idx]]
+    if not drop_fields:
         return
 
-    unique_pieces = {type(p): p for p in pocket}.values()
+    empty = FULL_MASK & ~state.board.bitboard.occupied
+    attacks = state.attacks
+    checking = attacks.checkers
+    if checking:
+        if checking & (checking - 1):
+            return
+        empty &= between(attacks.king_index, checking.bit_length() - 1)
 
-    for r in range(8):
-        for c in range(8):
-            target_sq = Square(r, c)
-            if state.board.get_piece(target_sq) is None:
-                for p in unique_pieces:
-                    if isinstance(p, Pawn) and (r == 0 or r == 7):
-                        continue
-                    yield Move(Square(None), target_sq, None, p, player_to_move=state.turn)
+    # Drops are built from packed codes, so each Move is shared once decoded.
+    flag = BLACK_FLAG if us else 0
+    pawn_field = (PAWN + 1) << DROP_SHIFT
+    while empty:
+        bit = empty & -empty
+        code = ((bit.bit_length() - 1) << TO_SHIFT) | flag
+        back_rank = bit & (RANK_1 | RANK_8)
+        for field in drop_fields:
+            if field == pawn_field and back_rank:
+                continue
+            yield decode(code | field)
+        empty ^= bit
 
 crazyhouse_drops.is_global = True
\ No newline at end of file
@@ -65,8 +65,7 @@ def en_passant_target_validity(state: "GameState", rules: "Rules") -> Optional[B
     """Ensures en passant target square is valid."""
     if state.ep_square is not None:
         valid_rows = [2, 5]
-        from v_chess.rules.horde import HordeRules
-        if isinstance(rules, HordeRules):
+        if rules.rule_set.horde_pawns:
             valid_rows.append(6) # Rank 2 for white double push from rank 1
             
         if state.ep_square.row not in valid_rows:
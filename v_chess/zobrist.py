@@ -0,0 +1,111 @@
+import random
+from typing import TYPE_CHECKING, Iterable
+
+from v_chess.enums import CastlingRight, Color
+from v_chess.piece import Piece
+from v_chess.piece.codes import NUM_CODES, PIECE_TYPES
+from v_chess.square import Square
+
+if TYPE_CHECKING:
+    from v_chess.bitboard import Bitboard
+    from v_chess.pocket import Pocket
+
+# Counts the pocket and check tables hold keys for up front; larger counts
+# extend the tables on demand, see _count_key.
+MAX_POCKET_COUNT = 32
+MAX_CHECK_COUNT = 16
+
+# A fixed seed keeps keys stable across processes, so they can be shared by
+# worker pools and stored alongside games.
+_rng = random.Random(0x5EED_C4E55)
+
+
+def _key() -> int:
+    return _rng.getrandbits(64)
+
+
+# Indexed by piece code, then by square.
+PIECE_KEYS: list[list[int]] = [[_key() for _ in range(64)] for _ in range(NUM_CODES)]
+SIDE_KEY: int = _key()
+CASTLING_KEYS: dict[CastlingRight, int] = {
+    right: (0 if right == CastlingRight.NONE else _key()) for right in CastlingRight
+}
+EP_FILE_KEYS: list[int] = [_key() for _ in range(8)]
+# Index 0 is left empty so that empty pockets and zero checks contribute nothing.
+POCKET_KEYS: dict[Color, dict[type[Piece], list[int]]] = {
+    color: {p_type: [0] + [_key() for _ in range(MAX_POCKET_COUNT)] for p_type in PIECE_TYPES}
+    for color in Color
+}
+CHECK_KEYS: dict[Color, list[int]] = {
+    color: [0] + [_key() for _ in range(MAX_CHECK_COUNT)] for color in Color
+}
+
+
+def _count_key(keys: list[int], count: int) -> int:
+    """Returns the key of a count, extending its table up to the count first.
+
+    Each added key is drawn from a generator seeded with the key before it,
+    so extended tables are the same in every process whatever order counts
+    are first seen in.
+    """
+    while len(keys) <= count:
+        keys.append(random.Random(keys[-1]).getrandbits(64))
+    return keys[count]
+
+
+def board_key(bitboard: Bitboard) -> int:
+    """Computes the piece placement component of a Zobrist key from scratch."""
+    key = 0
+    for square_keys, mask in zip(PIECE_KEYS, bitboard.masks):
+        while mask:
+            bit = mask & -mask
+            key ^= square_keys[bit.bit_length() - 1]
+            mask ^= bit
+    return key
+
+
+def toggles_key(toggles: Iterable[tuple[int, int]]) -> int:
+    """Returns the key delta of the bit toggles recorded in an UndoInfo."""
+    key = 0
+    for code, bit in toggles:
+        key ^= PIECE_KEYS[code][bit.bit_length() - 1]
+    return key
+
+
+def side_key(turn: Color) -> int:
+    """Returns the side to move component, non-zero when Black is to move."""
+    return SIDE_KEY if turn == Color.BLACK else 0
+
+
+def castling_key(rights: Iterable[CastlingRight]) -> int:
+    """Returns the castling rights component of a Zobrist key."""
+    key = 0
+    for right in rights:
+        key ^= CASTLING_KEYS[right]
+    return key
+
+
+def ep_key(ep_square: Square | None) -> int:
+    """Returns the en passant component, keyed by the file of the target square."""
+    if ep_square is None or ep_square.is_none_square:
+        return 0
+    return EP_FILE_KEYS[ep_square.col]
+
+
+def pocket_key(pocket: Pocket) -> int:
+    """Returns the key of one Crazyhouse pocket, keyed by piece counts."""
+    key = 0
+    type_keys = POCKET_KEYS[pocket.color]
+    for p_type, count in zip(PIECE_TYPES, pocket.counts):
+        key ^= _count_key(type_keys[p_type], count)
+    return key
+
+
+def pockets_key(pockets: tuple[Pocket, Pocket]) -> int:
+    """Returns the Crazyhouse pocket component of both colors."""
+    return pocket_key(pockets[0]) ^ pocket_key(pockets[1])
+
+
+def checks_key(checks: tuple[int, int]) -> int:
+    """Returns the Three-Check component, keyed by the checks given per color."""
+    return _count_key(CHECK_KEYS[Color.WHITE], checks[0]) ^ _count_key(CHECK_KEYS[Color.BLACK], checks[1])